@@ -0,0 +1,262 @@
+"""Kernel backend running pysim models on the C++ `CyScheduler`.
+
+`CythonKernel` provides the part of `pysim.des.Kernel` interface used by
+`Simulator` and models, so `pysim.model.Network` handlers run unchanged with
+`DES.simulate(..., backend='cython')`. The `model` package (`src/model`)
+must be built with its Cython extension.
+
+Event codes are passed to `CyScheduler` as is. Every event carries its
+record `[event_id, code, args, kwargs, period]` as the object payload
+(`att`), and a single dispatcher is attached to every used code, so the
+handlers get the same arguments as with the Python kernel. The record is
+also the event handle for `remove_event()`.
+
+The first `resume()` starts the scheduler run up to the sim-time limit,
+later calls continue it with `CyScheduler.continue_until()`. Time limit and
+`max_events` are checked by the C++ scheduler loop, and its exit reason is
+mapped to `StopReason`. An exception raised by a handler stops the scheduler
+and is re-raised by `resume()`, as with the Python kernel.
+"""
+from time import perf_counter
+
+from pysim.des import StopReason, _check_event_code, _INFINITY, _REMOVED
+
+
+def _import_cy_scheduler():
+    try:
+        from model.des.cyscheduler import CyScheduler
+        from model.des.pyscheduler import ExitReason, SpecType
+    except ImportError as err:
+        raise ImportError(
+            'Cython backend requires the "model" package with the compiled '
+            '"model.des.cyscheduler" extension (run "pip install -e ." or '
+            '"python setup.py build_ext --inplace")') from err
+    return CyScheduler, SpecType, ExitReason
+
+
+class CythonKernel:
+    WALL_CHECK_INTERVAL = 1000
+
+    def __init__(self, handlers=None):
+        CyScheduler, SpecType, ExitReason = _import_cy_scheduler()
+        self.__scheduler = CyScheduler()
+        self.__stop_reasons = {
+            ExitReason.EMPTY: StopReason.EMPTY,
+            ExitReason.TIME_LIMIT: StopReason.SIM_TIME_LIMIT,
+            ExitReason.MAX_EVENTS: StopReason.MAX_EVENTS,
+            # Kernel stops the scheduler when the wall time limit is met, or
+            # when a handler raised (then the exception is re-raised):
+            ExitReason.STOPPED: StopReason.WALL_TIME_LIMIT,
+        }
+        self.__spec_type = SpecType.OBJECT
+        # Scheduler keeps borrowed references to handlers, so the bound
+        # methods are stored here to keep them alive:
+        self.__dispatch = self._dispatch
+        self.__attached_codes = set()
+        self.__events_mapping = {}
+        self.__dispatch_table = {}
+        self.__event_names = {}
+        self.__num_events = 0
+        self.__num_processed = 0
+        self.__sim_time_limit = _INFINITY
+        self.__max_events = None
+        self.__wall_time_limit = None
+        self.__wall_started_at = None
+        self.__stop_reason = None
+        self.__error = None
+        self.__started = False
+        for code, handlers_list in (handlers or {}).items():
+            for handler in handlers_list:
+                self.bind(code, handler)
+
+    @property
+    def scheduler(self):
+        return self.__scheduler
+
+    @property
+    def sim_time(self):
+        return self.__scheduler.get_time()
+
+    @property
+    def num_events(self):
+        return self.__num_events
+
+    @property
+    def stop_reason(self):
+        return self.__stop_reason
+
+    @property
+    def num_removed(self):
+        return 0
+
+    @property
+    def num_compactions(self):
+        return 0
+
+    @property
+    def profile(self):
+        return None
+
+    @property
+    def event_names(self):
+        return self.__event_names
+
+    def set_event_names(self, names):
+        self.__event_names = dict(names)
+
+    def get_event_name(self, code):
+        return self.__event_names.get(code, f'#{code}')
+
+    def add_event(self, code, delay, args=(), kwargs=None):
+        _check_event_code(code)
+        if delay < 0:
+            raise ValueError('negative delay disallowed')
+        event = [None, code, args, kwargs or None, None]
+        event[0] = self.__scheduler.schedule(
+            self.__scheduler.get_time() + delay, code, -1, event)
+        return event
+
+    def add_events(self, events):
+        for code, delay, _ in events:
+            _check_event_code(code)
+            if delay < 0:
+                raise ValueError('negative delay disallowed')
+        return [self.add_event(code, delay, args)
+                for code, delay, args in events]
+
+    def add_periodic(self, code, period, args=(), kwargs=None, delay=None):
+        if period <= 0:
+            raise ValueError('period must be positive')
+        event = self.add_event(code, period if delay is None else delay,
+                               args, kwargs)
+        event[4] = period
+        return event
+
+    def add_timeout(self, code, delay, args=(), kwargs=None):
+        return self.add_event(code, delay, args, kwargs)
+
+    @staticmethod
+    def get_event_id(handle):
+        return handle[0]
+
+    def remove_event(self, event):
+        if event is None or isinstance(event, int):
+            # Integer IDs can not be told fired from pending here:
+            return False
+        if event[1] is not _REMOVED:
+            self.__scheduler.cancel(event[0])
+            event[1] = _REMOVED
+            event[4] = None
+            return True
+        if event[4] is not None:
+            event[4] = None  # periodic event cancelled by its own handler
+            return True
+        return False
+
+    def bind(self, code, handler):
+        _check_event_code(code)
+        handlers_list = self.__events_mapping.setdefault(code, [])
+        if handler not in handlers_list:
+            handlers_list.append(handler)
+        self._update_dispatch_table(code)
+        if code not in self.__attached_codes:
+            self.__scheduler.bind(code, self.__dispatch, self.__spec_type)
+            self.__attached_codes.add(code)
+
+    def unbind(self, code, handler):
+        try:
+            self.__events_mapping[code].remove(handler)
+        except (KeyError, ValueError):
+            pass
+        self._update_dispatch_table(code)
+
+    def _update_dispatch_table(self, code):
+        """Rebuild the immutable handlers tuple for a single event code.
+
+        Dispatching an event then looks the tuple up, with no allocation.
+        """
+        self.__dispatch_table[code] = \
+            tuple(self.__events_mapping.get(code, ()))
+
+    def setup(self, sim_time_limit=None, max_events=None, wall_time_limit=None,
+              **_ignored):
+        """Configure stop conditions, see `pysim.des.Kernel.setup()`."""
+        if sim_time_limit is not None:
+            if sim_time_limit < 0:
+                raise ValueError('sim time limit must be non-negative')
+            self.__sim_time_limit = sim_time_limit
+        if max_events is not None:
+            if max_events <= 0:
+                raise ValueError('max events must be positive')
+            self.__max_events = max_events
+        if wall_time_limit is not None:
+            if wall_time_limit <= 0:
+                raise ValueError('wall time limit must be positive')
+            self.__wall_time_limit = wall_time_limit
+
+    def _dispatch(self, ctx, event):
+        code = event[1]
+        args, kwargs = event[2], event[3]
+        event[1] = _REMOVED
+        handlers_list = self.__dispatch_table[code]
+        # Exceptions can not pass the C++ callback, so the run is stopped and
+        # the exception is re-raised by resume():
+        try:
+            if kwargs is None:
+                for handler in handlers_list:
+                    handler(*args)
+            else:
+                for handler in handlers_list:
+                    handler(*args, **kwargs)
+        except BaseException as err:
+            self.__error = err
+            self.__scheduler.stop()
+            return
+        self.__num_events += len(handlers_list)
+
+        if event[4] is not None:
+            event[0] = self.__scheduler.schedule(
+                self.__scheduler.get_time() + event[4], code, -1, event)
+            event[1] = code
+
+        self.__num_processed += 1
+        if self.__wall_time_limit is not None and \
+                self.__num_processed % self.WALL_CHECK_INTERVAL == 0 and \
+                perf_counter() - self.__wall_started_at >= \
+                self.__wall_time_limit:
+            self.__scheduler.stop()
+
+    def start(self, sim, init):
+        if hasattr(sim.data, 'initialize'):
+            sim.data.initialize()
+        if init:
+            init(sim)
+
+    def resume(self, sim):
+        self.__num_processed = 0
+        self.__wall_started_at = perf_counter()
+        until = self.__sim_time_limit
+        if not self.__started:
+            self.__started = True
+            exit_reason = self.__scheduler.run(
+                None if until == _INFINITY else until, self.__max_events)
+        else:
+            exit_reason = self.__scheduler.continue_until(
+                until, self.__max_events)
+        if self.__error is not None:
+            error, self.__error = self.__error, None
+            raise error
+        self.__stop_reason = self.__stop_reasons[exit_reason]
+        return self.__stop_reason
+
+    def finish(self, sim, fin):
+        if hasattr(sim.data, 'finalize'):
+            sim.data.finalize()
+        if fin:
+            fin(sim)
+
+    def run(self, sim, init, fin):
+        self.start(sim, init)
+        stop_reason = self.resume(sim)
+        self.finish(sim, fin)
+        return stop_reason
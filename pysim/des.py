@@ -1,13 +1,18 @@
-import heapq
-import itertools
-from collections import namedtuple
+import copy
+import os
+import random
+from collections import deque, namedtuple
 from enum import Enum
-from functools import total_ordering
 from multiprocessing.pool import Pool, ThreadPool
 from pprint import pformat
+from time import perf_counter
 
 import colorama
 
+from pysim.profiling import Profile
+from pysim.queues import create_queue
+from pysim.timers import TimingWheel
+
 
 def _get_scalar_or_dict(x):
     if isinstance(x, dict):
@@ -29,183 +34,721 @@ class _ParamsDict:
         return self.__kwargs[item]
 
     def __getattr__(self, item):
-        return self.__kwargs[item]
+        # Read __dict__ directly, since __getattr__ may be called by copy and
+        # pickle before the instance is initialized:
+        try:
+            return self.__dict__['_ParamsDict__kwargs'][item]
+        except KeyError:
+            raise AttributeError(item) from None
+
+    def __deepcopy__(self, memo):
+        # Parameters are never changed, so copies may share them:
+        return self
 
     def as_dict(self):
         return {**self.__kwargs}
 
 
-@total_ordering
-class _Event:
-    def __init__(self, event_id, name, sim_time, args, kwargs):
-        self.__event_id = event_id
-        self.__name = name
-        self.__sim_time = sim_time
-        self.__args = args
-        self.__kwargs = kwargs
-        self.__removed = False
-
-    @property
-    def event_id(self):
-        return self.__event_id
-
-    @property
-    def sim_time(self):
-        return self.__sim_time
-
-    @property
-    def name(self):
-        return self.__name
+# Events are stored as plain lists
+# [sim_time, event_id, code, args, kwargs, period], so that queues compare
+# them by (sim_time, event_id) in C and no extra objects are allocated per
+# event. Kwargs is None if not given, period is None for one-shot events.
+# The list itself is the event handle returned by Kernel.add_event(): when
+# the event is cancelled or popped to run, its code is replaced with _REMOVED
+# in place, so that cancelling it (again) is a no-op. Periodic events keep
+# their period while running and are re-armed after the handlers.
+_REMOVED = None
 
-    @property
-    def args(self):
-        return self.__args
 
-    @property
-    def kwargs(self):
-        return self.__kwargs
+class _TimerSlot:
+    """Args of a timing wheel slot marker.
 
-    @property
-    def removed(self):
-        return self.__removed
+    Slot markers are stored in the queue as cancelled events
+    `[start_time, -1 - level, _REMOVED, _TimerSlot, (level, key), None]`,
+    so the run loops only check for them when they skip cancelled events.
+    The class itself is the marker, so it survives deep copies.
+    """
 
-    def remove(self):
-        self.__removed = True
 
-    def __eq__(self, other):
-        return (self.__sim_time == other.sim_time and
-                self.__event_id == other.event_id)
+_INFINITY = float('inf')
 
-    def __lt__(self, other):
-        return (self.__sim_time < other.sim_time or
-                self.__sim_time == other.sim_time and
-                self.__event_id < other.event_id)
 
+def _check_event_code(code):
+    if not isinstance(code, int) or code < 0:
+        raise TypeError(f'event code must be a non-negative integer, '
+                        f'"{code}" given')
 
-class _SimTimePredicate:
-    def __init__(self, kernel, sim_time_limit):
-        self.__kernel = kernel
-        self.__sim_time_limit = sim_time_limit
 
-    def __call__(self):
-        return self.__kernel.sim_time > self.__sim_time_limit
+class StopReason(Enum):
+    """Condition that ended the kernel run."""
+    EMPTY = 0
+    SIM_TIME_LIMIT = 1
+    MAX_EVENTS = 2
+    WALL_TIME_LIMIT = 3
 
 
 class Kernel:
-    def __init__(self):
-        self.__queue = []
+    # Heaps smaller than this are never compacted, rebuilding them costs more
+    # than popping the few cancelled events they may contain:
+    MIN_COMPACTION_SIZE = 64
+
+    def __init__(self, compaction_threshold=0.5, queue=None,
+                 verify_order=False, profile=False, tick=None,
+                 timer_resolution=None, handlers=None):
+        """Create a kernel.
+
+        :param compaction_threshold: see `setup()`
+        :param queue: event queue backend name, class or instance
+            (see `pysim.queues`), binary heap by default
+        :param verify_order: raise RuntimeError if events are popped out of
+            (time, ID) order (slow, for tests)
+        :param profile: collect `profile` of the run
+        :param tick: if given, time is kept as an integer number of ticks of
+            this length (in seconds, e.g. 1e-12), so that events are ordered
+            exactly. Delays are rounded to the nearest tick when scheduled,
+            `sim_time` is still given in seconds.
+        :param timer_resolution: slot width of the timing wheel used by
+            `add_timeout()` (seconds), by default an eighth of the first
+            timeout delay
+        :param handlers: mapping of event codes to lists of handlers bound
+            to this kernel
+        """
+        if tick is not None and tick <= 0:
+            raise ValueError('tick must be positive')
+        self.__tick = tick
+        self.__queue = create_queue(queue)
+        # Events at the current time (zero delay, or a delay lost in float
+        # addition) bypass the queue: they all have the current time and the
+        # largest IDs so far, so a FIFO keeps them in order:
+        self.__fifo = deque()
+        self.__verify_order = verify_order
+        self.__last_key = None
+        self.__profile = Profile() if profile else None
+        self.__timer_resolution = timer_resolution
+        self.__timers = None
         self.__sim_time = 0
-        self.__event_ids = {}
-        self.__next_event_id = itertools.count()
+        self.__next_event_id = 0
         self.__num_events = 0
         self.__queue_size = 0
-        self.__stop_predicates = []
+        self.__sim_time_limit = _INFINITY
+        self.__max_events = None
+        self.__wall_time_limit = None
+        self.__wall_check_interval = 1000
+        self.__stop_reason = None
         self.__events_mapping = {}
+        self.__dispatch_table = []
+        self.__event_names = {}
+        self.__num_removed = 0
+        self.__num_compactions = 0
+        self.__compaction_threshold = compaction_threshold
+        # Handlers registry is per kernel, nothing is shared between
+        # simulations, so they can run on parallel threads:
+        for code, handlers_list in (handlers or {}).items():
+            for handler in handlers_list:
+                self.bind(code, handler)
 
     @property
     def sim_time(self):
-        return self.__sim_time
+        if self.__tick is None:
+            return self.__sim_time
+        return self.__sim_time * self.__tick
+
+    @property
+    def tick(self):
+        return self.__tick
+
+    def _to_ticks(self, interval):
+        if self.__tick is None or interval == _INFINITY:
+            return interval
+        return round(interval / self.__tick)
 
     @property
     def empty(self):
         return self.__queue_size == 0
 
+    def next_event_time(self):
+        """Get a lower bound of the next event time, inf if there are none.
+
+        The bound is exact, unless the earliest queue entry is a cancelled
+        event or a timer slot.
+        """
+        if not self.__queue_size:
+            return _INFINITY
+        if self.__fifo:
+            return self.sim_time
+        time = self.__queue.peek()[0]
+        return time if self.__tick is None else time * self.__tick
+
     @property
     def num_events(self):
         return self.__num_events
 
-    def add_event(self, name, delay, args=(), kwargs=None):
+    @property
+    def stop_reason(self):
+        return self.__stop_reason
+
+    @property
+    def num_removed(self):
+        """Number of cancelled events (tombstones) still kept in the heap."""
+        return self.__num_removed
+
+    @property
+    def num_compactions(self):
+        """Number of times the heap was rebuilt to drop cancelled events."""
+        return self.__num_compactions
+
+    @property
+    def compaction_threshold(self):
+        return self.__compaction_threshold
+
+    @property
+    def queue(self):
+        return self.__queue
+
+    @property
+    def verify_order(self):
+        return self.__verify_order
+
+    @property
+    def profile(self):
+        """Run profile (`pysim.profiling.Profile`), or None if not enabled."""
+        return self.__profile
+
+    @property
+    def event_names(self):
+        return self.__event_names
+
+    def set_event_names(self, names):
+        """Provide human-readable event names, they are used for logging only.
+        """
+        self.__event_names = dict(names)
+
+    def get_event_name(self, code):
+        return self.__event_names.get(code, f'#{code}')
+
+    def add_event(self, code, delay, args=(), kwargs=None):
+        """Schedule an event and return its handle for `remove_event()`.
+
+        Handle is opaque, `get_event_id()` gives the integer event ID.
+        """
+        _check_event_code(code)
         if delay < 0:
             raise ValueError('negative delay disallowed')
-        kwargs = {} if kwargs is None else kwargs
-        event = _Event(
-            event_id=next(self.__next_event_id),
-            name=name,
-            sim_time=self.sim_time + delay,
-            args=args,
-            kwargs=kwargs
-        )
-        self.__event_ids[event.event_id] = event
-        heapq.heappush(self.__queue, event)
+        if self.__tick is not None:
+            delay = round(delay / self.__tick)
+        event_id = self.__next_event_id
+        self.__next_event_id = event_id + 1
+        time = self.__sim_time + delay
+        event = [time, event_id, code, args, kwargs or None, None]
+        # Delay may be lost in float addition, so the lane is chosen by time:
+        if time == self.__sim_time:
+            self.__fifo.append(event)
+        else:
+            self.__queue.push(event)
         self.__queue_size += 1
-        return event.event_id
+        return event
+
+    def add_events(self, events):
+        """Schedule a batch of events and return the list of their handles.
+
+        :param events: sequence of `(code, delay, args)` tuples
+        """
+        sim_time = self.__sim_time
+        tick = self.__tick
+        event_id = self.__next_event_id
+        ret, batch, immediate = [], [], []
+        for code, delay, args in events:
+            _check_event_code(code)
+            if delay < 0:
+                raise ValueError('negative delay disallowed')
+            if tick is not None:
+                delay = round(delay / tick)
+            event = [sim_time + delay, event_id, code, args, None, None]
+            (immediate if event[0] == sim_time else batch).append(event)
+            ret.append(event)
+            event_id += 1
+        self.__next_event_id = event_id
+        if batch:
+            self.__queue.push_many(batch)
+        self.__fifo.extend(immediate)
+        self.__queue_size += len(ret)
+        return ret
+
+    def add_periodic(self, code, period, args=(), kwargs=None, delay=None):
+        """Schedule an event that repeats every `period` until cancelled.
+
+        The event record is re-armed after its handlers ran, so it is not
+        allocated again, and the handle stays valid for `remove_event()`.
+
+        :param delay: delay of the first occurrence, `period` by default
+        """
+        if period <= 0:
+            raise ValueError('period must be positive')
+        event = self.add_event(code, period if delay is None else delay,
+                               args, kwargs)
+        event[5] = self._to_ticks(period)
+        return event
+
+    def add_timeout(self, code, delay, args=(), kwargs=None):
+        """Schedule an event which is likely to be cancelled.
+
+        The event is kept in a timing wheel (see `pysim.timers`) and gets
+        into the queue only shortly before it is due, so arming and
+        cancelling it costs O(1) and does not touch the queue.
+        """
+        ticks = self._to_ticks(delay)
+        if delay <= 0 or self.__sim_time + ticks == self.__sim_time:
+            return self.add_event(code, delay, args, kwargs)
+        _check_event_code(code)
+        delay = ticks
+        timers = self.__timers
+        if timers is None:
+            timers = self._create_timers(delay)
+        event_id = self.__next_event_id
+        self.__next_event_id = event_id + 1
+        event = [self.__sim_time + delay, event_id, code, args, kwargs or None,
+                 None]
+        slot = timers.arm(event, delay, self.__sim_time)
+        if slot is False:
+            self.__queue.push(event)
+        elif slot is not None:
+            self._push_timer_slot(slot)
+        self.__queue_size += 1
+        return event
+
+    def _create_timers(self, delay):
+        resolution = self._to_ticks(self.__timer_resolution) \
+            if self.__timer_resolution is not None else delay / 8
+        if self.__tick is not None:
+            resolution = max(1, round(resolution))
+        self.__timers = TimingWheel(resolution)
+        return self.__timers
+
+    def _push_timer_slot(self, slot):
+        start_time, level, key = slot
+        self.__queue.push([start_time, -1 - level, _REMOVED, _TimerSlot,
+                           (level, key), None])
+
+    def _expire_timer_slot(self, marker):
+        """Move timeouts of the slot to a finer level or to the queue."""
+        level, key = marker[4]
+        timers = self.__timers
+        events = timers.expire(level, key)
+        live = [event for event in events if event[2] is not _REMOVED]
+        self.__num_removed -= len(events) - len(live)
+        if level == 0:
+            if live:
+                self.__queue.push_many(live)
+            return
+        now = marker[0]
+        for event in live:
+            slot = timers.arm(event, event[0] - now, now, max_level=level)
+            if slot:
+                self._push_timer_slot(slot)
 
-    def bind(self, event_name, handler):
+    @staticmethod
+    def get_event_id(handle):
+        return handle[1]
+
+    def bind(self, code, handler):
+        _check_event_code(code)
         try:
-            handlers_list = self.__events_mapping[event_name]
+            handlers_list = self.__events_mapping[code]
             if handler not in handlers_list:
                 handlers_list.append(handler)
         except KeyError:
-            self.__events_mapping[event_name] = [handler]
+            self.__events_mapping[code] = [handler]
+        self._update_dispatch_table(code)
 
-    def unbind(self, name, handler):
+    def unbind(self, code, handler):
         try:
-            self.__events_mapping[name].remove(handler)
-        except KeyError:
+            self.__events_mapping[code].remove(handler)
+        except (KeyError, ValueError):
             pass
-
-    def remove_event(self, event_id):
-        event = self.__event_ids.get(event_id, None)
-        if event:
-            del self.__event_ids[event_id]
-            if not event.removed:
-                event.remove()
-                self.__queue_size -= 1
+        self._update_dispatch_table(code)
+
+    def _update_dispatch_table(self, code):
+        """Rebuild the immutable handlers tuple for a single event code.
+
+        The table is a list indexed by event code, it is extended in place
+        when needed.
+        """
+        handlers = self.__events_mapping.get(code, ())
+        table = self.__dispatch_table
+        if code >= len(table):
+            table.extend([()] * (code + 1 - len(table)))
+        table[code] = tuple(handlers)
+
+    def _build_dispatch_table(self):
+        self.__dispatch_table.clear()
+        for code in self.__events_mapping:
+            self._update_dispatch_table(code)
+
+    def remove_event(self, event):
+        """Cancel the event, return True if it was pending.
+
+        Accepts a handle returned by `add_event()`. Cancelling None, or an
+        event that already ran or was cancelled, does nothing. Integer event
+        IDs are still accepted, but they are found by a linear search.
+        """
+        if event is None:
+            return False
+        if isinstance(event, int):
+            event = self._find_event(event)
+            if event is None:
+                return False
+        if event[2] is not _REMOVED:
+            event[2] = _REMOVED
+            event[5] = None
+            self.__queue_size -= 1
+            self.__num_removed += 1
+            self._maybe_compact()
+            return True
+        if event[5] is not None:
+            # Periodic event cancelled by its own handler is not in the
+            # queue, it is just not re-armed:
+            event[5] = None
+            self.__queue_size -= 1
+            return True
+        return False
+
+    def _find_event(self, event_id):
+        for event in self.__queue.entries():
+            if event[1] == event_id:
                 return event
+        for event in self.__fifo:
+            if event[1] == event_id:
+                return event
+        if self.__timers is not None:
+            for event in self.__timers.events():
+                if event[1] == event_id:
+                    return event
         return None
 
+    def _maybe_compact(self):
+        num_entries = len(self.__queue) + len(self.__fifo)
+        if self.__timers is not None:
+            num_entries += len(self.__timers)
+        if (self.__compaction_threshold is not None and
+                num_entries >= self.MIN_COMPACTION_SIZE and
+                self.__num_removed > self.__compaction_threshold * num_entries):
+            self.compact()
+
+    def compact(self):
+        """Drop cancelled events from the queue and rebuild it."""
+        self.__queue.rebuild([event for event in self.__queue.entries()
+                              if event[2] is not _REMOVED or
+                              event[3] is _TimerSlot])
+        if self.__timers is not None:
+            self.__timers.discard(lambda event: event[2] is _REMOVED)
+        # FIFO is filtered in place, since the run loop holds a reference:
+        fifo = self.__fifo
+        events = [event for event in fifo if event[2] is not _REMOVED]
+        fifo.clear()
+        fifo.extend(events)
+        self.__num_removed = 0
+        self.__num_compactions += 1
+
+    def reset(self):
+        """Drop all events and return to time zero, e.g. for a replication.
+
+        Queue, time, event IDs, counters and profile are reset in place.
+        Bound handlers, event names and `setup()` options are kept.
+        """
+        self.__queue.clear()
+        self.__fifo.clear()
+        self.__timers = None
+        self.__sim_time = 0
+        self.__next_event_id = 0
+        self.__num_events = 0
+        self.__queue_size = 0
+        self.__stop_reason = None
+        self.__last_key = None
+        self.__num_removed = 0
+        self.__num_compactions = 0
+        if self.__profile is not None:
+            self.__profile = Profile()
+
+    def _fifo_first(self):
+        """Check whether the next event is the FIFO head, not the queue head.
+
+        FIFO events have the current time, so a queue event goes first only
+        if it has the current time too, since its ID is smaller.
+        """
+        if not self.__fifo:
+            return False
+        try:
+            return self.__queue.peek()[0] > self.__sim_time
+        except IndexError:
+            return True
+
+    def _check_order(self, event):
+        key = (event[0], event[1])
+        if self.__last_key is not None and key < self.__last_key:
+            raise RuntimeError(f'event {key} popped after {self.__last_key}')
+        self.__last_key = key
+
     def _next_event(self):
-        while self.__queue:
-            event = heapq.heappop(self.__queue)
-            if not event.removed:
-                # Update time:
-                assert event.sim_time >= self.__sim_time
-                self.__sim_time = event.sim_time
-
-                # Remove event from the EventID table and reduce queue size:
-                del self.__event_ids[event.event_id]
-                self.__queue_size -= 1
+        """Pop the next live event, or return None if the run must stop.
+
+        The horizon is checked before popping, so an event beyond it stays
+        in the queue and the run can be continued later. Popping and pushing
+        it back would move calendar and ladder queues past the events that
+        are scheduled before it afterwards.
+        """
+        queue = self.__queue
+        fifo = self.__fifo
+        while self.__queue_size:
+            from_fifo = self._fifo_first()
+            head = fifo[0] if from_fifo else queue.peek()
+            if head[0] > self.__sim_time_limit:
+                self.__sim_time = self.__sim_time_limit
+                self.__stop_reason = StopReason.SIM_TIME_LIMIT
+                return None
+            event = fifo.popleft() if from_fifo else queue.pop()
+            if event[2] is _REMOVED:
+                if event[3] is _TimerSlot:
+                    self._expire_timer_slot(event)
+                    continue
+                self.__num_removed -= 1
+                if self.__profile is not None:
+                    self.__profile.num_skipped += 1
+                continue
+            if self.__verify_order:
+                self._check_order(event)
+            return event
+
+        self.__stop_reason = StopReason.EMPTY
+        return None
 
-                return event
-        raise KeyError('pop from empty queue')
+    def _fire(self, event):
+        """Update time, mark the handle as fired and reduce queue size."""
+        self.__sim_time = event[0]
+        event[2] = _REMOVED
+        if event[5] is None:
+            self.__queue_size -= 1
+
+    def _rearm(self, event, code):
+        """Schedule the next occurrence of a periodic event."""
+        if event[5] is not None:
+            event[0] = self.__sim_time + event[5]
+            event[1] = self.__next_event_id
+            event[2] = code
+            self.__next_event_id += 1
+            if event[0] == self.__sim_time:
+                self.__fifo.append(event)
+            else:
+                self.__queue.push(event)
+
+    def setup(self, sim_time_limit=None, compaction_threshold=None,
+              max_events=None, wall_time_limit=None, wall_check_interval=None):
+        """Configure stop conditions and heap compaction.
+
+        :param sim_time_limit: events later than this time are not run
+            (the event crossing the horizon stays in the queue)
+        :param compaction_threshold: fraction of cancelled events in the
+            queue that triggers its compaction
+        :param max_events: maximum number of events run by a single run()
+        :param wall_time_limit: wall-clock budget of a single run() (seconds)
+        :param wall_check_interval: wall clock is checked every that many
+            events (default: 1000)
+        """
+        if sim_time_limit is not None:
+            if sim_time_limit < 0:
+                raise ValueError('sim time limit must be non-negative')
+            self.__sim_time_limit = self._to_ticks(sim_time_limit)
+        if compaction_threshold is not None:
+            if compaction_threshold <= 0:
+                raise ValueError('compaction threshold must be positive')
+            self.__compaction_threshold = compaction_threshold
+        if max_events is not None:
+            if max_events <= 0:
+                raise ValueError('max events must be positive')
+            self.__max_events = max_events
+        if wall_time_limit is not None:
+            if wall_time_limit <= 0:
+                raise ValueError('wall time limit must be positive')
+            self.__wall_time_limit = wall_time_limit
+        if wall_check_interval is not None:
+            if wall_check_interval <= 0:
+                raise ValueError('wall check interval must be positive')
+            self.__wall_check_interval = wall_check_interval
+
+    def _next_budget_check(self, num_processed):
+        """Get the number of processed events when budgets are checked next.
+        """
+        next_check = _INFINITY
+        if self.__max_events is not None:
+            next_check = self.__max_events
+        if self.__wall_time_limit is not None:
+            interval = self.__wall_check_interval
+            next_check = min(next_check,
+                             (num_processed // interval + 1) * interval)
+        return next_check
+
+    def _check_budget(self, num_processed, wall_started_at):
+        if self.__max_events is not None and \
+                num_processed >= self.__max_events:
+            self.__stop_reason = StopReason.MAX_EVENTS
+            return False
+        if self.__wall_time_limit is not None and \
+                perf_counter() - wall_started_at >= self.__wall_time_limit:
+            self.__stop_reason = StopReason.WALL_TIME_LIMIT
+            return False
+        return True
+
+    def _run_fast(self):
+        queue = self.__queue
+        pop, peek = queue.pop, queue.peek
+        fifo = self.__fifo
+        popleft = fifo.popleft
+        dispatch_table = self.__dispatch_table
+        time_limit = self.__sim_time_limit
+        # Without a horizon the queue head need not be peeked before popping:
+        limited = time_limit != _INFINITY
+        num_processed = 0
+        next_check = self._next_budget_check(0)
+        wall_started_at = perf_counter()
+
+        while self.__queue_size:
+            # Inlined _fifo_first() and horizon check of _next_event():
+            if fifo:
+                try:
+                    from_fifo = peek()[0] > self.__sim_time
+                except IndexError:
+                    from_fifo = True
+            else:
+                from_fifo = False
+            if limited and \
+                    (fifo[0] if from_fifo else peek())[0] > time_limit:
+                self.__sim_time = time_limit
+                self.__stop_reason = StopReason.SIM_TIME_LIMIT
+                return
+            event = popleft() if from_fifo else pop()
+            sim_time, _, code, args, kwargs, period = event
+            if code is _REMOVED:
+                if args is _TimerSlot:
+                    self._expire_timer_slot(event)
+                else:
+                    self.__num_removed -= 1
+                continue
+            self.__sim_time = sim_time
+            event[2] = _REMOVED
+            if period is None:
+                self.__queue_size -= 1
 
-    def _test_stop(self):
-        return any(pred() for pred in self.__stop_predicates)
+            try:
+                handlers_list = dispatch_table[code]
+            except IndexError:
+                handlers_list = ()
+            if kwargs is None:
+                for handler in handlers_list:
+                    handler(*args)
+            else:
+                for handler in handlers_list:
+                    handler(*args, **kwargs)
+            self.__num_events += len(handlers_list)
+            if period is not None:
+                self._rearm(event, code)
+
+            num_processed += 1
+            if num_processed >= next_check:
+                if not self._check_budget(num_processed, wall_started_at):
+                    return
+                next_check = self._next_budget_check(num_processed)
+
+        self.__stop_reason = StopReason.EMPTY
+
+    def _run_traced(self, sim):
+        dispatch_table = self.__dispatch_table
+        logger = sim.logger
+        profile = self.__profile
+        num_processed = 0
+        next_check = self._next_budget_check(0)
+        wall_started_at = perf_counter()
+
+        while True:
+            event = self._next_event()
+            if event is None:
+                logger.trace('---- stop: %s', self.__stop_reason.name)
+                return
+            code, args, kwargs = event[2:5]
+            self._fire(event)
 
-    def setup(self, sim_time_limit=None):
-        if sim_time_limit and sim_time_limit > 0:
-            self.__stop_predicates.append(
-                _SimTimePredicate(self, sim_time_limit))
+            try:
+                handlers_list = dispatch_table[code]
+            except IndexError:
+                handlers_list = ()
+            logger.trace('---- event "%s" [running %d handlers]',
+                         self.get_event_name(code), len(handlers_list))
+            if profile is not None:
+                queue_size = self.__queue_size
+                event_started_at = perf_counter()
+            for handler in handlers_list:
+                logger.trace('** calling %s()', handler.__name__)
+                if profile is not None:
+                    started_at = perf_counter()
+                if kwargs is None:
+                    handler(*args)
+                else:
+                    handler(*args, **kwargs)
+                if profile is not None:
+                    profile.add_handler(handler, perf_counter() - started_at)
+                self.__num_events += 1
+            if profile is not None:
+                profile.add_event(self.get_event_name(code),
+                                  perf_counter() - event_started_at,
+                                  queue_size)
+            self._rearm(event, code)
+
+            num_processed += 1
+            if num_processed >= next_check:
+                if not self._check_budget(num_processed, wall_started_at):
+                    logger.trace('---- stop: %s', self.__stop_reason.name)
+                    return
+                next_check = self._next_budget_check(num_processed)
+
+    def start(self, sim, init):
+        """Initialize the model and call `init`, but run no events yet."""
+        # Dispatch table is built once here and then kept up to date by
+        # bind() and unbind(), so dispatching an event is a single indexing:
+        self._build_dispatch_table()
 
-    def run(self, sim, init, fin):
         if hasattr(sim.data, 'initialize'):
             sim.data.initialize()
         if init:
             init(sim)
 
-        while not self.empty:
-            event = self._next_event()
-            if self._test_stop():
-                break
-
-            try:
-                handlers_list = self.__events_mapping.get(event.name, [])
-                handlers_list.extend(DES.events_mapping.get(event.name, []))
-            except KeyError:
-                raise RuntimeError(f'event "{event.name}" not defined')
-
-            sim.logger.trace(f'---- event "{event.name}" '
-                             f'[running {len(handlers_list)} handlers]')
-            for handler in handlers_list:
-                sim.logger.trace(f'** calling {handler.__name__}()')
-                handler(*event.args, **event.kwargs)
-                self.__num_events += 1
+    def resume(self, sim):
+        """Run events until any stop condition is met.
+
+        Model is neither initialized nor finalized, so `resume()` can be
+        called again later, e.g. after moving the sim-time horizon with
+        `setup()`.
+        """
+        # Trace messages are only built in the traced loop, so when TRACE
+        # level is disabled the main loop does no logging at all. Order is
+        # verified and events are profiled in the traced loop only:
+        if self.__verify_order or self.__profile is not None or \
+                sim.logger.is_enabled(Logger.Level.TRACE):
+            self._run_traced(sim)
+        else:
+            self._run_fast()
+        return self.__stop_reason
 
+    def finish(self, sim, fin):
+        """Finalize the model and call `fin`."""
         if hasattr(sim.data, 'finalize'):
             sim.data.finalize()
         if fin:
             fin(sim)
 
+    def run(self, sim, init, fin):
+        self.start(sim, init)
+        stop_reason = self.resume(sim)
+        self.finish(sim, fin)
+        return stop_reason
+
 
 class Logger:
     class Level(Enum):
@@ -216,42 +759,69 @@ class Logger:
         ERROR = 4
 
     def __init__(self, kernel):
-        self.level = Logger.Level.INFO
         self.__kernel = kernel
+        self.__level = Logger.Level.INFO
+        self.__min_value = self.__level.value
 
     @property
     def kernel(self):
         return self.__kernel
 
-    def write(self, level, msg, src=''):
+    @property
+    def level(self):
+        return self.__level
+
+    @level.setter
+    def level(self, level):
+        self.__level = level
+        self.__min_value = level.value
+
+    def is_enabled(self, level):
+        return level.value >= self.__min_value
+
+    def write(self, level, msg, *args, src=''):
+        """Write a message, if the level is enabled.
+
+        Formatting is lazy: if `args` are given, the message is formatted
+        as `msg % args`, and if `msg` is callable, it is called without
+        arguments to get the message. Nothing is done for disabled levels.
+        """
+        if level.value < self.__min_value:
+            return
+        if callable(msg):
+            msg = msg()
+        elif args:
+            msg = msg % args
+
         fs_bright = colorama.Style.BRIGHT
         fs_normal = colorama.Style.NORMAL
         fs_dim = colorama.Style.DIM
         fs_reset = colorama.Style.RESET_ALL + colorama.Fore.RESET
         time_color = colorama.Fore.LIGHTCYAN_EX
 
-        if level.value >= self.level.value:
-            lc = Logger.level2font(level)
-            src_str = (fs_bright + f'({src}) ' + fs_reset) if src else ''
-            level_str = fs_bright + lc + f'[{level.name:7s}]'
-            time_str = fs_dim + time_color + f'{self.kernel.sim_time:014.9f}'
-            msg_str = fs_normal + lc + msg
-            print(f'{level_str} {time_str} {src_str}{msg_str}' + fs_reset)
+        lc = Logger.level2font(level)
+        src_str = (fs_bright + f'({src}) ' + fs_reset) if src else ''
+        level_str = fs_bright + lc + f'[{level.name:7s}]'
+        time_str = fs_dim + time_color + f'{self.kernel.sim_time:014.9f}'
+        msg_str = fs_normal + lc + msg
+        print(f'{level_str} {time_str} {src_str}{msg_str}' + fs_reset)
 
-    def trace(self, msg, src=''):
-        self.write(Logger.Level.TRACE, msg, src)
+    def trace(self, msg, *args, src=''):
+        if self.__min_value <= 0:  # Logger.Level.TRACE
+            self.write(Logger.Level.TRACE, msg, *args, src=src)
 
-    def debug(self, msg, src=''):
-        self.write(Logger.Level.DEBUG, msg, src)
+    def debug(self, msg, *args, src=''):
+        if self.__min_value <= 1:  # Logger.Level.DEBUG
+            self.write(Logger.Level.DEBUG, msg, *args, src=src)
 
-    def info(self, msg, src=''):
-        self.write(Logger.Level.INFO, msg, src)
+    def info(self, msg, *args, src=''):
+        self.write(Logger.Level.INFO, msg, *args, src=src)
 
-    def warning(self, msg, src=''):
-        self.write(Logger.Level.WARNING, msg, src)
+    def warning(self, msg, *args, src=''):
+        self.write(Logger.Level.WARNING, msg, *args, src=src)
 
-    def error(self, msg, src=''):
-        self.write(Logger.Level.ERROR, msg, src)
+    def error(self, msg, *args, src=''):
+        self.write(Logger.Level.ERROR, msg, *args, src=src)
 
     @staticmethod
     def level2font(level):
@@ -268,11 +838,15 @@ class Logger:
 
 
 class Simulator:
-    def __init__(self, kernel, model, params=None, logger_level=None):
+    def __init__(self, kernel, model, params=None, logger_level=None,
+                 seed=None, outbox=None):
         params = {} if params is None else params
         self.__kernel = kernel
+        self.__outbox = outbox
         self.__params = _ParamsDict(params)
         self.__logger = Logger(kernel)
+        self.__rng = random.Random(seed)
+        self.__started = False
         if logger_level is not None:
             self.__logger.level = logger_level
         # Creating model data:
@@ -282,6 +856,84 @@ class Simulator:
             # If protodata is not a class, we use it as it is.
             self.__data = model
 
+    @property
+    def kernel(self):
+        return self.__kernel
+
+    @property
+    def rng(self):
+        """Random numbers generator of this simulation.
+
+        Models must draw all random values from it (not from the global
+        `random` module), so that simulations are reproducible and forks
+        get independent streams.
+        """
+        return self.__rng
+
+    def seed(self, seed=None):
+        """Re-seed the simulation RNG in place."""
+        self.__rng.seed(seed)
+
+    def reset(self, seed=None):
+        """Prepare the simulation for a new run from time zero.
+
+        Kernel is reset (see `Kernel.reset()`), RNG is re-seeded, and the
+        model `reset()` method is called, if it has one. Models must return
+        all their state to the initial one there.
+        """
+        self.__kernel.reset()
+        self.__rng.seed(seed)
+        self.__started = False
+        if hasattr(self.__data, 'reset'):
+            self.__data.reset()
+
+    def run(self, until=None, init=None):
+        """Start the simulation and run events up to time `until`.
+
+        Model is initialized and `init` is called, but the model is not
+        finalized, so that the run can be extended with `continue_until()`.
+        Events with time equal to `until` are run, later events stay in the
+        queue, and `sim_time` is set to `until`.
+
+        :param until: sim-time horizon, by default events are run until none
+            left (or other stop condition set with `Kernel.setup()` is met)
+        :return: `StopReason`
+        """
+        if self.__started:
+            raise RuntimeError('simulation is already started, '
+                               'use continue_until()')
+        self.__started = True
+        self.__kernel.start(self, init)
+        return self.continue_until(_INFINITY if until is None else until)
+
+    def continue_until(self, until):
+        """Continue a started simulation up to time `until`.
+
+        Queue, model and statistics are kept, so events run in exactly the
+        same order as in a single `run()` up to `until`, and only the events
+        after the previous horizon are simulated.
+
+        :return: `StopReason`
+        """
+        if not self.__started:
+            raise RuntimeError('simulation is not started, call run() first')
+        if until < self.sim_time:
+            raise ValueError(f'horizon {until} is before current time '
+                             f'{self.sim_time}')
+        self.__kernel.setup(sim_time_limit=until)
+        return self.__kernel.resume(self)
+
+    def snapshot(self):
+        """Capture the whole simulation state.
+
+        The snapshot holds a deep copy of the kernel (queue, sim time,
+        counters, bound handlers), the model and the RNG state. It is best
+        taken between `Kernel.resume()` calls, e.g. when the run stopped at
+        a sim-time horizon. If taken from a handler, the other handlers of
+        the same event are not run in the forks.
+        """
+        return Snapshot(self)
+
     @property
     def sim_time(self):
         return self.__kernel.sim_time
@@ -290,11 +942,36 @@ class Simulator:
     def num_events(self):
         return self.__kernel.num_events
 
-    def schedule(self, event_name, delay=0, args=(), kwargs=None):
-        return self.__kernel.add_event(event_name, delay, args, kwargs)
+    @property
+    def num_compactions(self):
+        return self.__kernel.num_compactions
+
+    def schedule(self, code, delay=0, args=(), kwargs=None):
+        return self.__kernel.add_event(code, delay, args, kwargs)
 
-    def cancel(self, event_id):
-        self.__kernel.remove_event(event_id)
+    def schedule_many(self, events):
+        return self.__kernel.add_events(events)
+
+    def schedule_periodic(self, code, period, args=(), kwargs=None,
+                          delay=None):
+        return self.__kernel.add_periodic(code, period, args, kwargs, delay)
+
+    def schedule_timeout(self, code, delay, args=(), kwargs=None):
+        return self.__kernel.add_timeout(code, delay, args, kwargs)
+
+    def send(self, lp, code, delay, args=()):
+        """Schedule an event in another logical process.
+
+        Only available when the simulation is a logical process of
+        `pysim.parallel.simulate_parallel()`. Delay must not be less than
+        the lookahead of the parallel simulation.
+        """
+        if self.__outbox is None:
+            raise RuntimeError('not a logical process of parallel simulation')
+        self.__outbox.send(lp, code, self.sim_time, delay, args)
+
+    def cancel(self, event):
+        self.__kernel.remove_event(event)
 
     @property
     def params(self):
@@ -308,23 +985,114 @@ class Simulator:
     def logger(self):
         return self.__logger
 
-    def bind(self, event_name, handler):
-        self.__kernel.bind(event_name, handler)
+    def bind(self, code, handler):
+        self.__kernel.bind(code, handler)
+
+    def unbind(self, code, handler):
+        self.__kernel.unbind(code, handler)
+
+    def set_event_names(self, names):
+        self.__kernel.set_event_names(names)
+
+
+class Snapshot:
+    def __init__(self, sim):
+        self.__sim = copy.deepcopy(sim)
+
+    @property
+    def sim_time(self):
+        return self.__sim.sim_time
+
+    def restore(self):
+        """Get a new simulator in the state captured by the snapshot."""
+        return copy.deepcopy(self.__sim)
+
+    def fork(self, n, seeds=None):
+        """Create `n` simulators continuing from the snapshot.
+
+        Each simulator gets its own RNG stream: seeded with the items of
+        `seeds`, if given, or from OS entropy otherwise.
+
+        :return: list of simulators, run them with `sim.kernel.resume(sim)`
+        """
+        if seeds is not None and len(seeds) != n:
+            raise ValueError(f'expected {n} seeds, {len(seeds)} given')
+        forks = []
+        for i in range(n):
+            sim = self.restore()
+            sim.seed(None if seeds is None else seeds[i])
+            forks.append(sim)
+        return forks
+
 
-    def unbind(self, event_name, handler):
-        self.__kernel.unbind(event_name, handler)
+SimRet = namedtuple('SimRet', ('data', 'sim_time', 'stop_reason', 'profile'),
+                    defaults=(None,))
 
 
-SimRet = namedtuple('SimRet', ('data', 'sim_time'))
+class Replicator:
+    """Run replications of a model, building it only once.
+
+    Kernel, simulator and model are created in the constructor. Before each
+    replication except the first one they are reset in place (see
+    `Simulator.reset()`), so the model must implement `reset()`.
+
+    Since the model is reused, `SimRet.data` of a replication is only valid
+    until the next one starts: pass `extract` to `replicate()` to convert
+    results into data that does not refer to the model.
+    """
+    def __init__(self, model, initialize=None, params=None,
+                 logger_level=Logger.Level.INFO, sim_time_limit=None,
+                 compaction_threshold=None, queue=None, max_events=None,
+                 wall_time_limit=None, profile=False, tick=None,
+                 timer_resolution=None, handlers=None):
+        kernel = Kernel(queue=queue, profile=profile, tick=tick,
+                        timer_resolution=timer_resolution, handlers=handlers)
+        kernel.setup(sim_time_limit=sim_time_limit,
+                     compaction_threshold=compaction_threshold,
+                     max_events=max_events, wall_time_limit=wall_time_limit)
+        self.__sim = Simulator(kernel, model, params, logger_level)
+        self.__initialize = initialize
+        self.__num_runs = 0
+
+    @property
+    def sim(self):
+        return self.__sim
+
+    @property
+    def num_runs(self):
+        return self.__num_runs
+
+    def run(self, seed=None):
+        """Run a single replication with RNG seeded by `seed`.
+
+        :return: `SimRet`
+        """
+        sim = self.__sim
+        if self.__num_runs:
+            sim.reset(seed)
+        else:
+            sim.seed(seed)
+        self.__num_runs += 1
+        stop_reason = sim.kernel.run(sim, init=self.__initialize, fin=None)
+        return SimRet(sim.data, sim.sim_time, stop_reason, sim.kernel.profile)
+
+    def replicate(self, seeds, extract=None):
+        """Run a replication for each seed and yield results in order.
+
+        :param seeds: iterable of RNG seeds
+        :param extract: function applied to `SimRet` of each replication
+        """
+        for seed in seeds:
+            ret = self.run(seed)
+            yield extract(ret) if extract else ret
 
 
 class _SimulationInstance:
-    def __init__(self, model, initialize, params, logger_level, sim_time_limit):
+    def __init__(self, model, initialize, params, options):
         self.model = model
         self.initialize = initialize
         self.params = params
-        self.logger_level = logger_level
-        self.sim_time_limit = sim_time_limit
+        self.options = options
 
 
 def _call_simulation_instance(sim_inst):
@@ -332,58 +1100,214 @@ def _call_simulation_instance(sim_inst):
         model=sim_inst.model,
         initialize=sim_inst.initialize,
         params=sim_inst.params,
-        logger_level=sim_inst.logger_level,
-        sim_time_limit=sim_inst.sim_time_limit,
+        **sim_inst.options
     )
 
 
-class DES:
-    events_mapping = {}
-    initialize = None
+def _call_indexed_simulation_instance(indexed_sim_inst):
+    index, sim_inst = indexed_sim_inst
+    return index, _call_simulation_instance(sim_inst)
 
-    @classmethod
-    def on(cls, event_name, handler):
-        try:
-            handlers_list = cls.events_mapping[event_name]
-            if handler not in handlers_list:
-                handlers_list.append(handler)
-        except KeyError:
-            cls.events_mapping[event_name] = [handler]
 
-    @classmethod
-    def delete_handler(cls, name, handler):
-        try:
-            cls.events_mapping[name].remove(handler)
-        except KeyError:
-            pass
+def _seeded_options(options, index):
+    seed = options.get('seed')
+    if seed is None:
+        return options
+    return {**options, 'seed': seed + index}
+
+
+def get_num_cpus():
+    """Get the number of CPU cores available to this process."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
 
+
+class DES:
     @classmethod
     def simulate(cls, model, initialize=None, params=None,
                  logger_level=Logger.Level.INFO, sim_time_limit=None,
-                 pool_size=4):
-        initialize = initialize or cls.initialize
+                 pool_size=None, compaction_threshold=None, queue=None,
+                 max_events=None, wall_time_limit=None, pool='thread',
+                 extract=None, seed=None, profile=False, tick=None,
+                 timer_resolution=None, handlers=None, backend='python'):
+        """Run simulation of the model with given parameters.
+
+        If `params` is a list or a tuple, a simulation is run for each item,
+        and the list of results is returned in the same order. These
+        simulations are run on a thread pool (`pool='thread'`, default),
+        or on a process pool (`pool='process'`, see `simulate_iter()`).
+        Thread pool has 4 threads by default, process pool has a worker per
+        available CPU core.
+
+        If `extract` is given, it is called with `SimRet` of each simulation
+        and its return value is returned instead of `SimRet`.
+
+        If `seed` is given, the simulation RNG is seeded with it. For a list
+        of parameters, simulation with index `i` is seeded with `seed + i`.
+
+        If `profile` is True, `SimRet.profile` holds the run profile (see
+        `pysim.profiling`), profiles of a parameter list can be merged with
+        `pysim.profiling.merge_profiles()`.
+
+        If `tick` is given, kernel keeps time in integer ticks of that length
+        (see `Kernel`). `timer_resolution` is the timing wheel slot width
+        (see `Kernel.add_timeout()`).
+
+        `handlers` maps event codes to lists of extra handlers, they are bound
+        to the kernel of each simulation (see `Kernel`). Simulations share no
+        mutable state, so thread pool runs them in parallel on free-threaded
+        Python builds.
+
+        `backend` selects the kernel: 'python' (`Kernel`, default) or
+        'cython' (`pysim.cykernel.CythonKernel`, runs events on the C++
+        scheduler of the `model` package). The Cython backend supports
+        neither `queue`, `tick`, `profile` nor `timer_resolution`.
+        """
         params = {} if params is None else params
         if isinstance(params, list) or isinstance(params, tuple):
+            options = {
+                'logger_level': logger_level,
+                'sim_time_limit': sim_time_limit,
+                'compaction_threshold': compaction_threshold,
+                'queue': queue,
+                'max_events': max_events,
+                'wall_time_limit': wall_time_limit,
+                'extract': extract,
+                'seed': seed,
+                'profile': profile,
+                'tick': tick,
+                'timer_resolution': timer_resolution,
+                'handlers': handlers,
+                'backend': backend,
+            }
+            if pool == 'process':
+                ret = [None] * len(params)
+                for index, item in cls.simulate_iter(
+                        model, initialize, params, pool_size=pool_size,
+                        **options):
+                    ret[index] = item
+                return ret
+            if pool != 'thread':
+                raise ValueError(f'unknown pool "{pool}"')
+
             sim_instances = [
-                _SimulationInstance(
-                    model, initialize, p, logger_level, sim_time_limit
-                ) for p in params
+                _SimulationInstance(model, initialize, p,
+                                    _seeded_options(options, index))
+                for index, p in enumerate(params)
             ]
 
+            pool_size = 4 if pool_size is None else pool_size
             if pool_size > 1:
                 with ThreadPool(pool_size) as a_pool:
                     return a_pool.map(_call_simulation_instance, sim_instances)
             else:
                 return [_call_simulation_instance(si) for si in sim_instances]
 
-        kernel = Kernel()
-        sim = Simulator(kernel, model, params, logger_level)
-        kernel.setup(sim_time_limit=sim_time_limit)
-        sim.logger.debug(f'*** starting simulation with parameters:\n'
-                         f'{pformat(params)}\n'
-                         f'SIM TIME LIMIT: {sim_time_limit}')
-        kernel.run(sim, init=initialize, fin=None)
-        return SimRet(sim.data, sim.sim_time)
+        if backend == 'python':
+            kernel = Kernel(queue=queue, profile=profile, tick=tick,
+                            timer_resolution=timer_resolution,
+                            handlers=handlers)
+        elif backend == 'cython':
+            if queue is not None or profile or tick is not None or \
+                    timer_resolution is not None:
+                raise ValueError('Cython backend supports neither queue, '
+                                 'profile, tick nor timer resolution')
+            from pysim.cykernel import CythonKernel
+            kernel = CythonKernel(handlers=handlers)
+        else:
+            raise ValueError(f'unknown backend "{backend}"')
+        sim = Simulator(kernel, model, params, logger_level, seed)
+        kernel.setup(sim_time_limit=sim_time_limit,
+                     compaction_threshold=compaction_threshold,
+                     max_events=max_events,
+                     wall_time_limit=wall_time_limit)
+        sim.logger.debug(lambda: f'*** starting simulation with parameters:\n'
+                                 f'{pformat(params)}\n'
+                                 f'SIM TIME LIMIT: {sim_time_limit}')
+        stop_reason = kernel.run(sim, init=initialize, fin=None)
+        ret = SimRet(sim.data, sim.sim_time, stop_reason, kernel.profile)
+        return extract(ret) if extract else ret
+
+    @classmethod
+    def simulate_iter(cls, model, initialize=None, params=(), pool_size=None,
+                      chunksize=None, **options):
+        """Run simulations for a list of parameters on a process pool.
+
+        Results are yielded as `(index, result)` pairs as soon as they are
+        ready, where `index` is the position of the parameters in the list.
+        The order of results is arbitrary.
+
+        Model, `initialize` and other options (see `simulate()`) are pickled
+        to the worker processes, so they must be defined at module level.
+        `SimRet.data` is usually not picklable, so pass `extract` function to
+        convert results into plain data inside the workers.
+
+        :param pool_size: number of worker processes, by default the number of
+            available CPU cores (but not more than the number of parameters)
+        :param chunksize: number of simulations sent to a worker at once, by
+            default parameters are split into about four chunks per worker
+        """
+        sim_instances = [
+            (index, _SimulationInstance(model, initialize, p,
+                                        _seeded_options(options, index)))
+            for index, p in enumerate(params)
+        ]
+        if not sim_instances:
+            return
+        if pool_size is None:
+            pool_size = min(get_num_cpus(), len(sim_instances))
+        if chunksize is None:
+            chunksize = max(1, len(sim_instances) // (4 * pool_size))
+
+        with Pool(pool_size) as a_pool:
+            yield from a_pool.imap_unordered(
+                _call_indexed_simulation_instance, sim_instances, chunksize)
+
+    @classmethod
+    def simulate_forks(cls, model, fork_time, num_forks, initialize=None,
+                       params=None, logger_level=Logger.Level.INFO,
+                       sim_time_limit=None, compaction_threshold=None,
+                       queue=None, max_events=None, wall_time_limit=None,
+                       seed=None, seeds=None, extract=None, profile=False,
+                       tick=None, timer_resolution=None, handlers=None):
+        """Simulate the common prefix once, then fork replications from it.
+
+        The model is simulated up to `fork_time` with RNG seeded by `seed`.
+        Then `num_forks` replications continue from the snapshot of this
+        state, each with its own RNG stream (see `Snapshot.fork()`), until
+        `sim_time_limit` or other stop condition.
+
+        Kernel options are the same as in `simulate()`. Queue, `tick`,
+        `profile`, `timer_resolution`, `handlers` and `compaction_threshold`
+        are set for the prefix run, and forks inherit them from the snapshot
+        (so the profile of each fork includes the prefix). `max_events` and
+        `wall_time_limit` limit each fork run.
+
+        :return: list of `SimRet` (or `extract` results), one per fork
+        """
+        kernel = Kernel(queue=queue, profile=profile, tick=tick,
+                        timer_resolution=timer_resolution, handlers=handlers)
+        sim = Simulator(kernel, model, params, logger_level, seed)
+        kernel.setup(sim_time_limit=fork_time,
+                     compaction_threshold=compaction_threshold)
+        kernel.start(sim, initialize)
+        kernel.resume(sim)
+
+        ret = []
+        if sim_time_limit is None:
+            sim_time_limit = _INFINITY
+        for fork in sim.snapshot().fork(num_forks, seeds):
+            fork.kernel.setup(sim_time_limit=sim_time_limit,
+                              max_events=max_events,
+                              wall_time_limit=wall_time_limit)
+            stop_reason = fork.kernel.resume(fork)
+            fork.kernel.finish(fork, None)
+            fork_ret = SimRet(fork.data, fork.sim_time, stop_reason,
+                              fork.kernel.profile)
+            ret.append(extract(fork_ret) if extract else fork_ret)
+        return ret
 
 
 class DESModel:
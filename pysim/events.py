@@ -1,15 +1,34 @@
 """Events defined in the simulation model.
+
+Events are identified by small integer codes, so that the kernel can
+dispatch them by indexing. Human-readable names are used for logging only.
 """
-START_ROUND = 'Start round'
-UPDATE_POSITIONS = 'Update positions'
-READER_TX_END = 'Reader TX finished'
-READER_RX_START = 'Reader RX started'
-READER_RX_END = 'Reader RX finished'
-READER_SEND_COMMAND = 'Send command'
-READER_NO_REPLY = 'No reply'
-TAG_TX_END = 'Tag TX finished'
-TAG_RX_START = 'Tag RX started'
-TAG_RX_END = 'Tag RX finished'
-TAG_SEND_REPLY = 'Send reply'
-TAG_TURNED_OFF = 'Tag turned off'
-TAG_TURNED_ON = 'Tag turned on'
+START_ROUND = 0
+UPDATE_POSITIONS = 1
+READER_TX_END = 2
+READER_RX_START = 3
+READER_RX_END = 4
+READER_SEND_COMMAND = 5
+READER_NO_REPLY = 6
+TAG_TX_END = 7
+TAG_RX_START = 8
+TAG_RX_END = 9
+TAG_SEND_REPLY = 10
+TAG_TURNED_OFF = 11
+TAG_TURNED_ON = 12
+
+NAMES = {
+    START_ROUND: 'Start round',
+    UPDATE_POSITIONS: 'Update positions',
+    READER_TX_END: 'Reader TX finished',
+    READER_RX_START: 'Reader RX started',
+    READER_RX_END: 'Reader RX finished',
+    READER_SEND_COMMAND: 'Send command',
+    READER_NO_REPLY: 'No reply',
+    TAG_TX_END: 'Tag TX finished',
+    TAG_RX_START: 'Tag RX started',
+    TAG_RX_END: 'Tag RX finished',
+    TAG_SEND_REPLY: 'Send reply',
+    TAG_TURNED_OFF: 'Tag turned off',
+    TAG_TURNED_ON: 'Tag turned on',
+}
@@ -1,7 +1,5 @@
 from enum import Enum
 from math import pi, cos, sin
-from random import randint, random
-
 from numpy import asarray
 
 from pysim import events
@@ -83,15 +81,30 @@ class Network(DESModel):
         # States
         self._tag_rx_start_event_id = {tag.id: None for tag in self.tags}
 
-        self._handle_tag_rx_start = \
-            lambda tag_id, frame: self.get_tag(tag_id).start_rx(frame)
-        self._handle_tag_tx_end = \
-            lambda tag_id: self.get_tag(tag_id).finish_tx()
-        self._handle_tag_rx_end = \
-            lambda tag_id: self.get_tag(tag_id).finish_rx()
+    def reset(self):
+        """Return reader, tags and statistics to the initial state.
+
+        Called by `Simulator.reset()` after the kernel was reset, so that
+        the network is simulated again without being rebuilt.
+        """
+        self._tag_rx_start_event_id = {tag.id: None for tag in self.tags}
+        self.reader.reset()
+        for tag in self.tags:
+            tag.reset()
+
+    # Tag events handlers are methods, not lambdas, so that the network can be
+    # copied with Simulator.snapshot():
+    def _handle_tag_rx_start(self, tag_id, frame):
+        self.get_tag(tag_id).start_rx(frame)
+
+    def _handle_tag_tx_end(self, tag_id):
+        self.get_tag(tag_id).finish_tx()
+
+    def _handle_tag_rx_end(self, tag_id):
+        self.get_tag(tag_id).finish_rx()
 
     def initialize(self):
-        # TODO: move DES.on and DES.delete_handler to kernel
+        self.sim.set_event_names(events.NAMES)
         # Subscribe to events:
         self.sim.bind(events.TAG_RX_START, self._handle_tag_rx_start)
         self.sim.bind(events.TAG_TX_END, self._handle_tag_tx_end)
@@ -104,6 +117,10 @@ class Network(DESModel):
         self.sim.bind(events.READER_NO_REPLY, self.reader.no_reply)
         self.sim.bind(events.UPDATE_POSITIONS, self.update_positions)
         self.sim.bind(events.START_ROUND, self.reader.start_round)
+        # Positions are updated right away, and then every update timeout:
+        self.sim.schedule_periodic(events.UPDATE_POSITIONS,
+                                   self.sim.params.mobility.update_timeout,
+                                   delay=0)
 
     def finalize(self):
         # Subscribe to events:
@@ -129,10 +146,12 @@ class Network(DESModel):
         self.sim.schedule(events.READER_RX_START, dt, args=(tag_id, frame))
 
     def send_reader_frame(self, frame):
-        for tag in [tag for tag in self.tags if tag.state != TagState.OFF]:
-            distance = count_distance(self.reader.position, tag.position)
-            dt = distance / SPEED_OF_LIGHT
-            self.sim.schedule(events.TAG_RX_START, dt, args=(tag.id, frame))
+        position = self.reader.position
+        self.sim.schedule_many([
+            (events.TAG_RX_START,
+             count_distance(position, tag.position) / SPEED_OF_LIGHT,
+             (tag.id, frame))
+            for tag in self.tags if tag.state != TagState.OFF])
 
     def update_positions(self):
         self.reader.update_position()
@@ -146,10 +165,6 @@ class Network(DESModel):
             elif d > propagation_distance and tag.state != TagState.OFF:
                 tag.turn_off()
 
-        # Schedule next positions update:
-        dt = self.sim.params.mobility.update_timeout
-        self.sim.schedule(events.UPDATE_POSITIONS, dt)
-
 
 class RxOp:
     def __init__(self, frame=None, t_start=0, t_end=0, tag_id=-1, broken=False):
@@ -189,9 +204,6 @@ class Reader(DeviceMixin, DESModel):
         super().__init__(sim)
         self.network = network
         self.trajectory = Trajectory(sim)
-        self._position = self.trajectory.get_position(0)
-        self._is_in_start_area = \
-            self.trajectory.is_in_start_area(self._position)
         self.tari = sim.params.reader.tari
         self.rtcal = sim.params.reader.rtcal
         self.trcal = sim.params.reader.trcal
@@ -207,6 +219,12 @@ class Reader(DeviceMixin, DESModel):
         self._blf = get_blf(self.dr, self.trcal)
         self._inter_command_interval = min_t1(self.rtcal, self._blf) + t3()
         self._num_slots = 2 ** self.Q
+        self.reset()
+
+    def reset(self):
+        self._position = self.trajectory.get_position(0)
+        self._is_in_start_area = \
+            self.trajectory.is_in_start_area(self._position)
 
         # State:
         self._state = ReaderState.OFF
@@ -220,7 +238,7 @@ class Reader(DeviceMixin, DESModel):
         self._no_reply_event_id = None
 
         # Statistics:
-        self.num_reads = {tag.id: 0 for tag in sim.params.tags}
+        self.num_reads = {tag.id: 0 for tag in self.sim.params.tags}
         self.rounds = []  # {index, t_start, t_finish, duration, tags_on, tags_read}
         self._round_index = 0
         self.read_timestamps = []
@@ -286,7 +304,7 @@ class Reader(DeviceMixin, DESModel):
 
         self._tx_frame = ReaderFrame(preamble, self._command)
 
-        self.sim.logger.trace(f'reader is sending {self._tx_frame}')
+        self.sim.logger.trace('reader is sending %s', self._tx_frame)
 
         # 2) Update reader state and schedule end of TX:
         self._state = ReaderState.TX
@@ -304,8 +322,8 @@ class Reader(DeviceMixin, DESModel):
         self._end_of_tx_event_id = None
         self._end_of_tx_time = self.sim.sim_time
         # Schedule no reply timeout:
-        self._no_reply_event_id = \
-            self.sim.schedule(events.READER_NO_REPLY, self._inter_command_interval)
+        self._no_reply_event_id = self.sim.schedule_timeout(
+            events.READER_NO_REPLY, self._inter_command_interval)
 
     def start_rx(self, tag_id, frame):
         """Start tag reply receive (RXOP) by the reader.
@@ -345,7 +363,7 @@ class Reader(DeviceMixin, DESModel):
             rxop = self._rxops[0]
             reply = rxop.frame.reply
             p_success = (1 - self.sim.params.channel.ber) ** reply.bitlen
-            success = random() <= p_success
+            success = self.sim.rng.random() <= p_success
             # print('success: ', success, ', ber: ', self.sim.params.channel.ber,
             #       ', bit length: ', reply.bitlen)
             if success:
@@ -402,6 +420,9 @@ class Tag(DeviceMixin, DESModel):
         self._position = asarray(params.position)
         self.epcid = params.epcid
         self.switch_target = params.switch_target
+        self.reset()
+
+    def reset(self):
         # State variables:
         self._sessions = [InventoryFlag.A] * 4
         self._state = TagState.OFF
@@ -425,14 +446,14 @@ class Tag(DeviceMixin, DESModel):
         return self._state
 
     def turn_on(self):
-        self.sim.logger.debug(f'tag {self.id} turned on')
+        self.sim.logger.debug('tag %s turned on', self.id)
         self._state = TagState.READY
         self.sim.schedule(events.TAG_TURNED_ON, args=(self.id,))
         for i in range(4):
             self._sessions[i] = InventoryFlag.A
 
     def turn_off(self):
-        self.sim.logger.debug(f'tag {self.id} turned off')
+        self.sim.logger.debug('tag %s turned off', self.id)
         self.sim.cancel(self._rx_end_event_id)
         self.sim.cancel(self._tx_end_event_id)
         self._rx_end_event_id = None
@@ -485,7 +506,7 @@ class Tag(DeviceMixin, DESModel):
                 self.session = command.session
                 self.target = command.target
                 # Select random slot and send RN16 if it is zero:
-                self._slot = randint(0, self.num_slots - 1)
+                self._slot = self.sim.rng.randint(0, self.num_slots - 1)
 
                 if self._slot == 0:
                     self._state = TagState.REPLY
@@ -513,7 +534,7 @@ class Tag(DeviceMixin, DESModel):
             raise ValueError(f'unsupported command {command}')
 
     def _send_rn16(self):
-        self._rn16 = randint(0, 0xFFFF)
+        self._rn16 = self.sim.rng.randint(0, 0xFFFF)
         self._transmit(QueryReply(self._rn16))
 
     def _send_epcid(self):
@@ -0,0 +1,254 @@
+"""Conservative parallel simulation of logical processes.
+
+A large scene (e.g., several readers flying over one tag field) is split
+into logical processes (LPs), each simulated by its own `Simulator` and
+`Kernel`. LPs are distributed over worker processes. An LP schedules
+events in other LPs with `Simulator.send()`, and every such event must be
+at least `lookahead` seconds ahead of the sender time. For radio frames
+the lookahead is the minimum propagation delay plus the minimum frame
+duration (see `frame_lookahead()`), since a frame is delivered when it
+ends.
+
+Synchronization is conservative (Chandy-Misra family, with synchronous
+windows): no LP can receive an event earlier than the global lower bound
+`T` of the next event times plus the lookahead, so all LPs safely run
+their events up to `T + lookahead`. Then events sent during the window are
+delivered, ordered by `(time, sender LP, sender sequence number)`, and the
+next window starts. Since the windows and the delivery order do not depend
+on how LPs are mapped to workers, results are the same for any number of
+workers, including the sequential in-process run (`num_workers=0`).
+"""
+import traceback
+from multiprocessing import Pipe, Process
+
+from pysim.des import (Kernel, Logger, SimRet, Simulator, _INFINITY,
+                       get_num_cpus)
+
+
+class LogicalProcess:
+    """Description of a logical process: model, initializer and params.
+
+    Model and `initialize` must be defined at module level, so that they
+    can be sent to worker processes.
+    """
+    def __init__(self, model, initialize=None, params=None, seed=None):
+        self.model = model
+        self.initialize = initialize
+        self.params = params
+        self.seed = seed
+
+
+def frame_lookahead(min_distance, min_frame_duration, speed=299792458.0):
+    """Get lookahead for frames exchanged between LPs (seconds).
+
+    :param min_distance: minimum distance between partitions (meters)
+    :param min_frame_duration: duration of the shortest frame (seconds)
+    :param speed: propagation speed (meters per second)
+    """
+    return min_distance / speed + min_frame_duration
+
+
+class _Outbox:
+    """Collects events sent by an LP during a window."""
+    def __init__(self, lp, lookahead):
+        self.lp = lp
+        self.lookahead = lookahead
+        self.messages = []
+        self.__next_seq = 0
+
+    def send(self, lp, code, sim_time, delay, args):
+        if delay < self.lookahead:
+            raise ValueError(f'delay {delay} is less than lookahead '
+                             f'{self.lookahead}')
+        self.messages.append((sim_time + delay, self.lp, self.__next_seq, lp,
+                              code, tuple(args)))
+        self.__next_seq += 1
+
+
+class _Partition:
+    """Logical processes simulated by a single worker."""
+    def __init__(self, lps, lookahead, logger_level):
+        self.sims = {}
+        self.outboxes = {}
+        for index, lp in lps:
+            outbox = _Outbox(index, lookahead)
+            kernel = Kernel()
+            sim = Simulator(kernel, lp.model, lp.params, logger_level,
+                            lp.seed, outbox=outbox)
+            kernel.start(sim, lp.initialize)
+            self.sims[index] = sim
+            self.outboxes[index] = outbox
+
+    def _collect(self):
+        next_times = {index: sim.kernel.next_event_time()
+                      for index, sim in self.sims.items()}
+        messages = []
+        for outbox in self.outboxes.values():
+            messages.extend(outbox.messages)
+            outbox.messages = []
+        return next_times, messages
+
+    def start(self):
+        return self._collect()
+
+    def run_window(self, window_end, inbox):
+        for index, sim in self.sims.items():
+            for time, _, _, _, code, args in inbox.get(index, ()):
+                sim.schedule(code, time - sim.sim_time, args)
+            sim.kernel.setup(sim_time_limit=window_end)
+            sim.kernel.resume(sim)
+        return self._collect()
+
+    def finish(self, extract):
+        ret = {}
+        for index, sim in self.sims.items():
+            sim.kernel.finish(sim, None)
+            sim_ret = SimRet(sim.data, sim.sim_time, sim.kernel.stop_reason)
+            ret[index] = extract(sim_ret) if extract else sim_ret
+        return ret
+
+
+class _WorkerError:
+    """Exception raised by a worker, sent back instead of its reply."""
+    def __init__(self, error, tb):
+        self.error = error
+        self.traceback = tb
+
+
+class _WorkerTraceback(Exception):
+    """Traceback of a worker exception, set as its `__cause__`."""
+    def __str__(self):
+        return f'\n\n"""\n{self.args[0]}"""'
+
+
+def _serve_partition(conn, lps, lookahead, logger_level):
+    try:
+        partition = _Partition(lps, lookahead, logger_level)
+        conn.send(partition.start())
+        while True:
+            command, *args = conn.recv()
+            if command == 'run':
+                conn.send(partition.run_window(*args))
+            else:
+                conn.send(partition.finish(*args))
+                conn.close()
+                return
+    except Exception as err:
+        tb = traceback.format_exc()
+        try:
+            conn.send(_WorkerError(err, tb))
+        except Exception:
+            # Exception can not be pickled, so only its text is sent:
+            conn.send(_WorkerError(RuntimeError(repr(err)), tb))
+        conn.close()
+
+
+class _RemotePartition:
+    """Proxy of a partition served by a worker process."""
+    def __init__(self, lps, lookahead, logger_level):
+        self.conn, child_conn = Pipe()
+        self.process = Process(target=_serve_partition,
+                               args=(child_conn, lps, lookahead, logger_level),
+                               daemon=True)
+        self.process.start()
+
+    def start(self):
+        return self.recv()
+
+    def send_run_window(self, window_end, inbox):
+        self.conn.send(('run', window_end, inbox))
+
+    def recv(self):
+        """Receive a worker reply, re-raise the worker exception if any."""
+        ret = self.conn.recv()
+        if isinstance(ret, _WorkerError):
+            raise ret.error from _WorkerTraceback(ret.traceback)
+        return ret
+
+    def finish(self, extract):
+        self.conn.send(('finish', extract))
+        ret = self.recv()
+        self.process.join()
+        return ret
+
+    def terminate(self):
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
+
+def simulate_parallel(lps, lookahead, sim_time_limit=None, num_workers=None,
+                      extract=None, logger_level=Logger.Level.WARNING):
+    """Simulate logical processes in parallel.
+
+    :param lps: list of `LogicalProcess`, LP index in this list is used in
+        `Simulator.send()`
+    :param lookahead: minimum delay of events sent between LPs (seconds)
+    :param sim_time_limit: simulation stops after this time, by default it
+        runs until no events left in all LPs
+    :param num_workers: number of worker processes, by default the number of
+        CPU cores (but not more than LPs), 0 runs LPs in this process
+    :param extract: function applied to `SimRet` of each LP in its worker,
+        result must be picklable if workers are used
+    :return: list of results (`SimRet` or `extract` results) in LP order
+
+    An exception raised in a worker is re-raised here, with the worker
+    traceback as its cause, and the other workers are terminated.
+    """
+    if lookahead <= 0:
+        raise ValueError('lookahead must be positive')
+    if sim_time_limit is None:
+        sim_time_limit = _INFINITY
+    indexed_lps = list(enumerate(lps))
+    if num_workers is None:
+        num_workers = min(get_num_cpus(), len(indexed_lps))
+    if num_workers == 0:
+        lps_mapping = [indexed_lps]
+        partitions = [_Partition(indexed_lps, lookahead, logger_level)]
+    else:
+        lps_mapping = [indexed_lps[i::num_workers] for i in range(num_workers)]
+        partitions = [_RemotePartition(partition_lps, lookahead, logger_level)
+                      for partition_lps in lps_mapping]
+
+    try:
+        next_times, messages = {}, []
+        for partition in partitions:
+            partition_times, partition_messages = partition.start()
+            next_times.update(partition_times)
+            messages.extend(partition_messages)
+
+        while True:
+            lower_bound = min(min(next_times.values(), default=_INFINITY),
+                              min((m[0] for m in messages), default=_INFINITY))
+            if lower_bound > sim_time_limit or lower_bound == _INFINITY:
+                break
+            window_end = min(lower_bound + lookahead, sim_time_limit)
+            # Deliver messages in an order independent of workers mapping:
+            messages.sort(key=lambda m: m[:3])
+            inbox = {}
+            for message in messages:
+                inbox.setdefault(message[3], []).append(message)
+            messages = []
+
+            if num_workers == 0:
+                results = [partitions[0].run_window(window_end, inbox)]
+            else:
+                for partition, partition_lps in zip(partitions, lps_mapping):
+                    partition.send_run_window(window_end, {
+                        index: inbox[index] for index, _ in partition_lps
+                        if index in inbox})
+                results = [partition.recv() for partition in partitions]
+            for partition_times, partition_messages in results:
+                next_times.update(partition_times)
+                messages.extend(partition_messages)
+
+        ret = {}
+        for partition in partitions:
+            ret.update(partition.finish(extract))
+        return [ret[index] for index in range(len(indexed_lps))]
+    except BaseException:
+        if num_workers != 0:
+            for partition in partitions:
+                partition.terminate()
+        raise
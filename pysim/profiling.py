@@ -0,0 +1,127 @@
+"""Per-event and per-handler profiling for `pysim.des.Kernel`.
+
+Profiling is opt-in (`Kernel(profile=True)` or `DES.simulate(profile=True)`).
+Profiles contain plain data only, so they can be returned from worker
+processes and merged with `merge_profiles()`.
+"""
+
+
+class Stats:
+    """Call count, total and maximum wall time (seconds)."""
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+
+    @property
+    def mean_time(self):
+        return self.total_time / self.count if self.count else 0.0
+
+    def add(self, elapsed):
+        self.count += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+
+    def merge(self, other):
+        self.count += other.count
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+
+    def __repr__(self):
+        return (f'{type(self).__name__}(count={self.count}, '
+                f'total_time={self.total_time:.6f}, '
+                f'max_time={self.max_time:.6f})')
+
+
+class EventStats(Stats):
+    """Handler statistics plus the queue size when the event ran."""
+    def __init__(self):
+        super().__init__()
+        self.total_queue_size = 0
+        self.max_queue_size = 0
+
+    @property
+    def mean_queue_size(self):
+        return self.total_queue_size / self.count if self.count else 0.0
+
+    def add(self, elapsed, queue_size=0):
+        super().add(elapsed)
+        self.total_queue_size += queue_size
+        if queue_size > self.max_queue_size:
+            self.max_queue_size = queue_size
+
+    def merge(self, other):
+        super().merge(other)
+        self.total_queue_size += other.total_queue_size
+        self.max_queue_size = max(self.max_queue_size, other.max_queue_size)
+
+
+class Profile:
+    """Kernel run profile.
+
+    - `events`: event name -> `EventStats` (time of all handlers of an event);
+    - `handlers`: handler qualified name -> `Stats`;
+    - `num_skipped`: number of cancelled events popped and skipped.
+    """
+    def __init__(self):
+        self.events = {}
+        self.handlers = {}
+        self.num_skipped = 0
+
+    def add_event(self, name, elapsed, queue_size):
+        try:
+            stats = self.events[name]
+        except KeyError:
+            stats = self.events[name] = EventStats()
+        stats.add(elapsed, queue_size)
+
+    def add_handler(self, handler, elapsed):
+        name = getattr(handler, '__qualname__', None) or repr(handler)
+        try:
+            stats = self.handlers[name]
+        except KeyError:
+            stats = self.handlers[name] = Stats()
+        stats.add(elapsed)
+
+    def merge(self, other):
+        """Add statistics of another profile to this one."""
+        for table, other_table, stats_class in (
+                (self.events, other.events, EventStats),
+                (self.handlers, other.handlers, Stats)):
+            for name, other_stats in other_table.items():
+                try:
+                    stats = table[name]
+                except KeyError:
+                    stats = table[name] = stats_class()
+                stats.merge(other_stats)
+        self.num_skipped += other.num_skipped
+        return self
+
+    def format(self):
+        """Build a text table of events and handlers, slowest first."""
+        lines = [f'{"EVENT / HANDLER":40s} {"COUNT":>9s} {"TOTAL, s":>10s} '
+                 f'{"MEAN, us":>10s} {"MAX, us":>10s} {"QUEUE":>8s}']
+        for table in (self.events, self.handlers):
+            for name, stats in sorted(table.items(),
+                                      key=lambda item: -item[1].total_time):
+                queue_size = (f'{stats.mean_queue_size:8.1f}'
+                              if isinstance(stats, EventStats) else '')
+                lines.append(
+                    f'{name[:40]:40s} {stats.count:9d} '
+                    f'{stats.total_time:10.4f} {stats.mean_time * 1e6:10.2f} '
+                    f'{stats.max_time * 1e6:10.2f} {queue_size:>8s}')
+        lines.append(f'cancelled events skipped: {self.num_skipped}')
+        return '\n'.join(lines)
+
+
+def merge_profiles(profiles):
+    """Merge profiles (e.g., of the specs of a parameter list) into a new one.
+
+    `None` items (simulations run without profiling) are ignored.
+    """
+    ret = Profile()
+    for profile in profiles:
+        if profile is not None:
+            ret.merge(profile)
+    return ret
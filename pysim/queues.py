@@ -0,0 +1,452 @@
+"""Event queue backends for `pysim.des.Kernel`.
+
+Every queue stores entries - sequences whose first two items are the event
+time and the event ID. Entries are compared as sequences, so they are always
+popped in (time, ID) order, whichever backend is used. Kernel never pushes
+entries with time less than the time of the last popped entry, and
+calendar and ladder queues rely on this. Peeking does not count as popping:
+entries earlier than the peeked one may still be pushed.
+
+Each backend provides the same interface:
+
+- `push(entry)`: add an entry;
+- `push_many(entries)`: add a batch of entries;
+- `pop()`: remove and return the smallest entry (`IndexError` if empty);
+- `peek()`: return the smallest entry without removing it;
+- `entries()`: list all stored entries in arbitrary order;
+- `rebuild(entries)`: replace queue content with the given entries;
+- `clear()`: remove all entries and return to the initial state;
+- `len(queue)`: number of stored entries.
+"""
+import heapq
+from bisect import insort
+from functools import partial
+
+
+class BinaryHeapQueue:
+    """Binary heap based on `heapq` module.
+
+    `push()` and `pop()` are partials over C-implemented `heapq` functions,
+    so that the kernel calls them without any Python-level frame.
+    """
+    name = 'heap'
+
+    def __init__(self):
+        self._heap = []
+        self.push = partial(heapq.heappush, self._heap)
+        self.pop = partial(heapq.heappop, self._heap)
+
+    def push_many(self, entries):
+        heap = self._heap
+        # Pushing k entries one by one costs O(k log n), while re-heapifying
+        # costs O(n + k), so large batches are merged by heapify():
+        if len(entries) * 4 > len(heap):
+            heap.extend(entries)
+            heapq.heapify(heap)
+        else:
+            push = heapq.heappush
+            for entry in entries:
+                push(heap, entry)
+
+    def peek(self):
+        return self._heap[0]
+
+    def entries(self):
+        return list(self._heap)
+
+    def rebuild(self, entries):
+        # Rebuild in place, since push() and pop() are bound to the list:
+        self._heap[:] = entries
+        heapq.heapify(self._heap)
+
+    def clear(self):
+        self._heap.clear()
+
+    def __len__(self):
+        return len(self._heap)
+
+
+class PairingHeapQueue:
+    """Pairing heap with two-pass melding on pop.
+
+    Each node is a list `[entry, children]`.
+    """
+    name = 'pairing'
+
+    def __init__(self):
+        self._root = None
+        self._size = 0
+
+    def push(self, entry):
+        node = [entry, []]
+        root = self._root
+        if root is None:
+            self._root = node
+        elif entry < root[0]:
+            node[1].append(root)
+            self._root = node
+        else:
+            root[1].append(node)
+        self._size += 1
+
+    def push_many(self, entries):
+        for entry in entries:
+            self.push(entry)
+
+    def pop(self):
+        root = self._root
+        if root is None:
+            raise IndexError('pop from empty queue')
+        self._root = self._merge_pairs(root[1])
+        self._size -= 1
+        return root[0]
+
+    def peek(self):
+        if self._root is None:
+            raise IndexError('peek from empty queue')
+        return self._root[0]
+
+    def entries(self):
+        ret = []
+        stack = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            ret.append(node[0])
+            stack.extend(node[1])
+        return ret
+
+    def rebuild(self, entries):
+        self._root = None
+        self._size = 0
+        for entry in entries:
+            self.push(entry)
+
+    def clear(self):
+        self._root = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    @staticmethod
+    def _meld(a, b):
+        if a[0] < b[0]:
+            a[1].append(b)
+            return a
+        b[1].append(a)
+        return b
+
+    @staticmethod
+    def _merge_pairs(nodes):
+        if not nodes:
+            return None
+        meld = PairingHeapQueue._meld
+        # First pass: meld pairs from left to right:
+        paired = [meld(nodes[i], nodes[i + 1])
+                  for i in range(0, len(nodes) - 1, 2)]
+        if len(nodes) % 2:
+            paired.append(nodes[-1])
+        # Second pass: meld the results from right to left:
+        root = paired.pop()
+        while paired:
+            root = meld(paired.pop(), root)
+        return root
+
+
+class CalendarQueue:
+    """Calendar queue (R. Brown, 1988).
+
+    Entries are hashed into a circular array of buckets ("days") of equal
+    width, each bucket is kept sorted. The number of buckets doubles or
+    halves with queue size, and bucket width is re-estimated from the
+    spacing of the earliest events on each resize.
+    """
+    name = 'calendar'
+
+    MIN_NUM_BUCKETS = 2
+    NUM_SAMPLES = 25
+
+    def __init__(self, bucket_width=1.0):
+        self._size = 0
+        self._last_time = 0.0
+        self._reset(self.MIN_NUM_BUCKETS, bucket_width)
+
+    def _reset(self, num_buckets, width):
+        # Current day is where the last popped entry was, since new entries
+        # may still come at that time:
+        self._buckets = [[] for _ in range(num_buckets)]
+        self._num_buckets = num_buckets
+        self._width = width
+        self._day = int(self._last_time / width)
+        self._top_threshold = 2 * num_buckets
+        self._bottom_threshold = num_buckets // 2 - 2
+
+    def push(self, entry):
+        day = int(entry[0] / self._width)
+        insort(self._buckets[day % self._num_buckets], entry)
+        self._size += 1
+        if self._size > self._top_threshold:
+            self._resize(2 * self._num_buckets)
+
+    def push_many(self, entries):
+        for entry in entries:
+            self.push(entry)
+
+    def pop(self):
+        if not self._size:
+            raise IndexError('pop from empty queue')
+        self._day = day = self._find()
+        entry = self._buckets[day % self._num_buckets].pop(0)
+        self._last_time = entry[0]
+        self._size -= 1
+        if self._size < self._bottom_threshold:
+            self._resize(self._num_buckets // 2)
+        return entry
+
+    def peek(self):
+        if not self._size:
+            raise IndexError('peek from empty queue')
+        # Current day is not moved, since entries earlier than the head may
+        # still be pushed:
+        return self._buckets[self._find() % self._num_buckets][0]
+
+    def entries(self):
+        return [entry for bucket in self._buckets for entry in bucket]
+
+    def rebuild(self, entries):
+        entries = sorted(entries)
+        num_buckets = self.MIN_NUM_BUCKETS
+        while 2 * num_buckets < len(entries):
+            num_buckets *= 2
+        width = self._estimate_width(entries) or self._width
+        self._reset(num_buckets, width)
+        for entry in entries:
+            day = int(entry[0] / width)
+            self._buckets[day % num_buckets].append(entry)
+        self._size = len(entries)
+
+    def clear(self):
+        # Time goes back to zero, so the current day is reset too:
+        self._size = 0
+        self._last_time = 0.0
+        self._reset(self.MIN_NUM_BUCKETS, self._width)
+
+    def __len__(self):
+        return self._size
+
+    def _find(self):
+        """Find the day of the bucket holding the smallest entry."""
+        buckets, num_buckets, width = \
+            self._buckets, self._num_buckets, self._width
+        day = self._day
+        for _ in range(num_buckets):
+            bucket = buckets[day % num_buckets]
+            if bucket and int(bucket[0][0] / width) <= day:
+                return day
+            day += 1
+        # No entries within a year ahead, fall back to direct search:
+        head = min(bucket[0] for bucket in buckets if bucket)
+        return int(head[0] / width)
+
+    def _resize(self, num_buckets):
+        if num_buckets < self.MIN_NUM_BUCKETS:
+            return
+        entries = sorted(self.entries())
+        width = self._estimate_width(entries) or self._width
+        self._reset(num_buckets, width)
+        for entry in entries:
+            day = int(entry[0] / width)
+            self._buckets[day % num_buckets].append(entry)
+
+    def _estimate_width(self, sorted_entries):
+        """Estimate bucket width as three average gaps between events.
+
+        Only the earliest events are sampled, and gaps larger than twice the
+        average are discarded as outliers, as proposed by R. Brown.
+        """
+        sample = [entry[0] for entry in sorted_entries[:self.NUM_SAMPLES]]
+        gaps = [b - a for a, b in zip(sample, sample[1:])]
+        if not gaps:
+            return None
+        average = sum(gaps) / len(gaps)
+        gaps = [gap for gap in gaps if gap <= 2 * average]
+        average = sum(gaps) / len(gaps) if gaps else 0
+        return 3 * average if average > 0 else None
+
+
+class _Rung:
+    def __init__(self, start, width, num_buckets):
+        self.start = start
+        self.width = width
+        self.buckets = [[] for _ in range(num_buckets)]
+        self.current = 0
+        self.size = 0
+
+    def index(self, time):
+        return min(int((time - self.start) / self.width),
+                   len(self.buckets) - 1)
+
+
+class LadderQueue:
+    """Ladder queue (W. T. Tang, R. S. M. Goh, I. L.-J. Thng, 2005).
+
+    Far future entries are appended to the unsorted `top` list. When the
+    near future is exhausted, `top` is spread over the first rung of the
+    ladder, and heavy buckets are recursively spread over finer rungs.
+    Only a small bucket at a time is sorted into the `bottom` list that
+    entries are popped from.
+    """
+    name = 'ladder'
+
+    THRESHOLD = 50
+    MAX_RUNGS = 8
+
+    def __init__(self):
+        self._top = []
+        self._top_start = float('-inf')
+        self._rungs = []
+        self._bottom = []  # sorted in descending order, popped from the end
+        self._size = 0
+
+    def push(self, entry):
+        self._size += 1
+        time = entry[0]
+        if time >= self._top_start:
+            self._top.append(entry)
+            return
+        for rung in self._rungs:
+            # Entry past the rung range is not earlier than the entries of
+            # its other buckets, so it joins the last bucket. If even that
+            # bucket is drained, the entry goes to a finer rung or bottom:
+            index = min(int((time - rung.start) / rung.width),
+                        len(rung.buckets) - 1)
+            if index >= rung.current:
+                rung.buckets[index].append(entry)
+                rung.size += 1
+                return
+        self._insert_bottom(entry)
+
+    def push_many(self, entries):
+        for entry in entries:
+            self.push(entry)
+
+    def pop(self):
+        if not self._bottom:
+            self._refill_bottom()
+        self._size -= 1
+        return self._bottom.pop()
+
+    def peek(self):
+        if not self._bottom:
+            self._refill_bottom()
+        return self._bottom[-1]
+
+    def entries(self):
+        ret = list(self._top) + list(self._bottom)
+        for rung in self._rungs:
+            for bucket in rung.buckets:
+                ret.extend(bucket)
+        return ret
+
+    def rebuild(self, entries):
+        self._top = list(entries)
+        self._top_start = float('-inf')
+        self._rungs = []
+        self._bottom = []
+        self._size = len(self._top)
+
+    def clear(self):
+        self.rebuild(())
+
+    def __len__(self):
+        return self._size
+
+    def _insert_bottom(self, entry):
+        # Bottom is sorted descending, so insert the negated position:
+        bottom = self._bottom
+        lo, hi = 0, len(bottom)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if bottom[mid] < entry:
+                hi = mid
+            else:
+                lo = mid + 1
+        bottom.insert(lo, entry)
+
+    def _spawn_rung(self, entries, start, end):
+        """Spread entries over a new rung, return None if impossible."""
+        width = (end - start) / len(entries)
+        if width <= 0 or start + width == start:
+            return None
+        rung = _Rung(start, width, len(entries))
+        for entry in entries:
+            rung.buckets[rung.index(entry[0])].append(entry)
+        rung.size = len(entries)
+        return rung
+
+    def _refill_bottom(self):
+        while True:
+            # Find the first non-empty bucket in the finest rung:
+            while self._rungs and not self._rungs[-1].size:
+                self._rungs.pop()
+            if not self._rungs:
+                if not self._top:
+                    raise IndexError('pop from empty queue')
+                top = self._top
+                t_min = min(entry[0] for entry in top)
+                t_max = max(entry[0] for entry in top)
+                self._top, self._top_start = [], t_max
+                rung = (self._spawn_rung(top, t_min, t_max)
+                        if len(top) > self.THRESHOLD else None)
+                if rung is None:
+                    self._bottom = sorted(top, reverse=True)
+                    return
+                self._rungs.append(rung)
+
+            rung = self._rungs[-1]
+            while not rung.buckets[rung.current]:
+                rung.current += 1
+            bucket = rung.buckets[rung.current]
+            rung.buckets[rung.current] = []
+            rung.current += 1
+            rung.size -= len(bucket)
+
+            if len(bucket) > self.THRESHOLD and \
+                    len(self._rungs) < self.MAX_RUNGS:
+                end = max(entry[0] for entry in bucket)
+                # Entries of the same time can not be spread over a rung,
+                # they are just sorted by ID in the bottom:
+                if min(entry[0] for entry in bucket) < end:
+                    start = rung.start + (rung.current - 1) * rung.width
+                    child = self._spawn_rung(bucket, start, end)
+                    if child is not None:
+                        self._rungs.append(child)
+                        continue
+            self._bottom = sorted(bucket, reverse=True)
+            return
+
+
+QUEUES = {
+    BinaryHeapQueue.name: BinaryHeapQueue,
+    PairingHeapQueue.name: PairingHeapQueue,
+    CalendarQueue.name: CalendarQueue,
+    LadderQueue.name: LadderQueue,
+}
+
+
+def create_queue(queue=None):
+    """Create event queue by its name or class, default is a binary heap.
+
+    If `queue` is already a queue instance, it is returned as is.
+    """
+    if queue is None:
+        return BinaryHeapQueue()
+    if isinstance(queue, str):
+        try:
+            return QUEUES[queue]()
+        except KeyError:
+            raise ValueError(f'unknown queue "{queue}", '
+                             f'available: {", ".join(QUEUES)}')
+    if isinstance(queue, type):
+        return queue()
+    return queue
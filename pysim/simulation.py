@@ -1,14 +1,16 @@
+import time
 from math import pi, cos, sin
 from pprint import pprint
 
 from pysim import events
-from pysim.des import DES, Logger
+from pysim.des import DES, Logger, Replicator
 from pysim.model import Network
+from pysim.profiling import merge_profiles
+from pysim.queues import QUEUES
 from pysim.utils import random_hex_string
 
 
 def initialize(sim):
-    sim.schedule(events.UPDATE_POSITIONS)
     sim.schedule(events.START_ROUND)
 
 
@@ -26,25 +28,120 @@ def _extract_results(ret):
         'c1g2_stats': {'num_collisions': ret.data.reader.num_collisions},
         'read_timestamps': ret.data.reader.read_timestamps,
         'routes': ret.data.reader.routes,
+        'stop_reason': ret.stop_reason.name,
+        'profile': ret.profile,
     }
 
 
 def simulate(spec, sim_time_limit=None, logger_level=Logger.Level.WARNING,
-             pool_size=4):
+             pool_size=None, max_events=None, wall_time_limit=None,
+             pool='thread', seed=None, profile=False, tick=None,
+             backend='python'):
     # sim_time_limit = 0.1
-    ret = DES.simulate(Network, initialize=initialize, params=spec,
-                       sim_time_limit=sim_time_limit,
-                       logger_level=logger_level, pool_size=pool_size)
     # rounds = [ir for ir in ret.data.reader.rounds if ir['tags_on']]
     # for index, inventory_round in enumerate(rounds):
     #     print(index, ': ', inventory_round)
-    try:
-        return _extract_results(ret)
-    except AttributeError:
-        return [_extract_results(item) for item in ret]
+    return DES.simulate(Network, initialize=initialize, params=spec,
+                        sim_time_limit=sim_time_limit,
+                        logger_level=logger_level, pool_size=pool_size,
+                        max_events=max_events, wall_time_limit=wall_time_limit,
+                        pool=pool, extract=_extract_results, seed=seed,
+                        profile=profile, tick=tick, backend=backend)
+
+
+def simulate_iter(specs, sim_time_limit=None,
+                  logger_level=Logger.Level.WARNING, pool_size=None,
+                  chunksize=None, max_events=None, wall_time_limit=None,
+                  seed=None, profile=False, tick=None):
+    """Simulate specs on a process pool, yield `(index, result)` pairs.
+
+    Results are yielded as soon as each spec is simulated, so that callers
+    can aggregate them incrementally. `index` is the position of the spec
+    in `specs`.
+    """
+    yield from DES.simulate_iter(
+        Network, initialize=initialize, params=specs, pool_size=pool_size,
+        chunksize=chunksize, sim_time_limit=sim_time_limit,
+        logger_level=logger_level, max_events=max_events,
+        wall_time_limit=wall_time_limit, extract=_extract_results, seed=seed,
+        profile=profile, tick=tick)
+
+
+def replicate(spec, seeds, sim_time_limit=None,
+              logger_level=Logger.Level.WARNING, max_events=None,
+              wall_time_limit=None, profile=False, tick=None):
+    """Simulate the spec once per seed, yield results in seeds order.
+
+    Network is built once and reset before each replication (see
+    `pysim.des.Replicator`), so this is faster than simulating a list of
+    identical specs for short runs.
+    """
+    replicator = Replicator(
+        Network, initialize=initialize, params=spec,
+        sim_time_limit=sim_time_limit, logger_level=logger_level,
+        max_events=max_events, wall_time_limit=wall_time_limit,
+        profile=profile, tick=tick)
+    yield from replicator.replicate(seeds, extract=_extract_results)
+
+
+def benchmark_queues(spec, sim_time_limit=None, queues=None, seed=1):
+    """Run the spec with each event queue backend and measure events/s.
+
+    Every backend runs with the same `seed`, so that they simulate the same
+    events and their rates are comparable.
+
+    Returns a dictionary mapping queue name to a tuple
+    `(num_events, elapsed_seconds, events_per_second)`.
+    """
+    queues = tuple(QUEUES) if queues is None else queues
+    results = {}
+    for queue in queues:
+        t_start = time.perf_counter()
+        ret = DES.simulate(Network, initialize=initialize, params=spec,
+                           sim_time_limit=sim_time_limit,
+                           logger_level=Logger.Level.WARNING, seed=seed,
+                           queue=queue)
+        elapsed = time.perf_counter() - t_start
+        num_events = ret.data.sim.num_events
+        results[queue] = (num_events, elapsed, num_events / elapsed)
+    return results
+
+
+def benchmark_backends(spec, sim_time_limit=None,
+                       backends=('python', 'cython'), seed=1):
+    """Run the spec with each kernel backend and measure events/s.
+
+    Returns a dictionary mapping backend name to a tuple
+    `(num_events, elapsed_seconds, events_per_second, num_reads)`, where
+    `num_reads` maps tag IDs to read counts, to compare the results.
+    """
+    results = {}
+    for backend in backends:
+        t_start = time.perf_counter()
+        ret = DES.simulate(Network, initialize=initialize, params=spec,
+                           sim_time_limit=sim_time_limit,
+                           logger_level=Logger.Level.WARNING, seed=seed,
+                           backend=backend)
+        elapsed = time.perf_counter() - t_start
+        num_events = ret.data.sim.num_events
+        results[backend] = (num_events, elapsed, num_events / elapsed,
+                            dict(ret.data.reader.num_reads))
+    return results
 
 
 if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Simulate UAV-RFID network')
+    parser.add_argument('--benchmark', default=False, action='store_true',
+                        help='Measure events/s for each event queue backend')
+    parser.add_argument('--profile', default=False, action='store_true',
+                        help='Print time spent in each event and handler')
+    parser.add_argument('--benchmark-backends', default=False,
+                        action='store_true',
+                        help='Measure events/s for Python and Cython kernels')
+    args_ = parser.parse_args()
+
     R = 10    # circle radius
     H = 1.0   # reader altitude
     V = 10.0   # meters per second, reader velocity
@@ -119,7 +216,22 @@ if __name__ == '__main__':
     # to prohibit third attempt to connect to the first tag.
     sim_time_limit_ = (4 - 1/12 - 0.0001) * pi * R / V
 
-    # Running the simulation:
-    ret_ = simulate(specs, sim_time_limit=sim_time_limit_,
-                    logger_level=Logger.Level.INFO, pool_size=4)
-    pprint(ret_)
+    if args_.benchmark_backends:
+        for name_, (num_, elapsed_, rate_, reads_) in benchmark_backends(
+                spec_, sim_time_limit=sim_time_limit_).items():
+            print(f'{name_:10s} {num_:9d} events {elapsed_:8.3f} s '
+                  f'{rate_:10.0f} events/s, reads: {reads_}')
+    elif args_.benchmark:
+        for name_, (num_, elapsed_, rate_) in benchmark_queues(
+                spec_, sim_time_limit=sim_time_limit_).items():
+            print(f'{name_:10s} {num_:9d} events {elapsed_:8.3f} s '
+                  f'{rate_:10.0f} events/s')
+    else:
+        # Running the simulation:
+        ret_ = simulate(specs, sim_time_limit=sim_time_limit_,
+                        logger_level=Logger.Level.INFO, pool_size=4,
+                        profile=args_.profile)
+        if args_.profile:
+            print(merge_profiles(
+                item.pop('profile') for item in ret_).format())
+        pprint(ret_)
@@ -0,0 +1,93 @@
+"""Hierarchical timing wheel for short timeouts of `pysim.des.Kernel`.
+
+Timeouts are usually cancelled long before they expire, so the wheel keeps
+them out of the event queue. Level `L` of the wheel is a set of slots of
+width `resolution * num_slots ** L`, and a timeout is put into the slot of
+the finest level which spans its delay. Slots are kept in a dictionary by
+their absolute number, so arming and cancelling a timeout is O(1).
+
+For each non-empty slot the kernel pushes a single slot marker into the
+event queue, at the slot start time. When the marker is popped, the slot
+expires: its timeouts are spread over the finer level, or, at level 0,
+pushed into the event queue. Since the marker comes before any timeout of
+its slot, timeouts still run in (time, ID) order.
+"""
+
+
+class TimingWheel:
+    NUM_SLOTS = 64
+    NUM_LEVELS = 3
+
+    def __init__(self, resolution, num_slots=NUM_SLOTS, num_levels=NUM_LEVELS):
+        if resolution <= 0:
+            raise ValueError('timing wheel resolution must be positive')
+        self.__resolution = resolution
+        self.__widths = [resolution * num_slots ** level
+                         for level in range(num_levels)]
+        self.__spans = [width * num_slots for width in self.__widths]
+        self.__slots = [{} for _ in range(num_levels)]
+        self.__size = 0
+
+    @property
+    def resolution(self):
+        return self.__resolution
+
+    @property
+    def max_delay(self):
+        """Timeouts with delay not less than this go to the event queue."""
+        return self.__spans[-1]
+
+    def arm(self, event, delay, now, max_level=None):
+        """Put event into the wheel.
+
+        :param max_level: put the event to a level below this one (used when
+            a slot expires, so that rounding errors never return its events
+            to the same level)
+        :return: tuple `(marker_time, level, key)` if a new slot was started,
+            and its marker must be scheduled, None if the slot already has a
+            marker, or False if the delay is too large for the wheel.
+        """
+        num_levels = len(self.__spans) if max_level is None else max_level
+        for level in range(num_levels):
+            if delay < self.__spans[level] or level + 1 == max_level:
+                width = self.__widths[level]
+                time = event[0]
+                key = time // width
+                if key * width > time:  # float rounding
+                    key -= 1
+                slots = self.__slots[level]
+                self.__size += 1
+                try:
+                    slots[key].append(event)
+                    return None
+                except KeyError:
+                    slots[key] = [event]
+                # Slot may have started before now, but the marker must not
+                # be earlier than already popped events:
+                return max(key * width, now), level, key
+        return False
+
+    def expire(self, level, key):
+        """Remove the slot and return its events."""
+        events = self.__slots[level].pop(key)
+        self.__size -= len(events)
+        return events
+
+    def discard(self, predicate):
+        """Remove events matching the predicate, keep (maybe empty) slots.
+
+        Slots are kept, since their markers are still in the event queue.
+        """
+        for slots in self.__slots:
+            for key, slot in slots.items():
+                kept = [event for event in slot if not predicate(event)]
+                self.__size -= len(slot) - len(kept)
+                slots[key] = kept
+
+    def events(self):
+        """List events in all slots in arbitrary order."""
+        return [event for slots in self.__slots
+                for slot in slots.values() for event in slot]
+
+    def __len__(self):
+        return self.__size
@@ -1,13 +1,16 @@
 #include "Scheduler.h"
 #include <iostream>
+#include <new>
 #include <sstream>
 
 namespace model {
 namespace des {
 
 /******** EVEMT *******************/
-Event::Event(int id, int code, float time, int index, PyObject *att)
-: _id(id), _code(code), _time(time), _index(index), _att(att) {
+Event::Event(int64_t id, int code, double time, int index, PyObject *att,
+             EventHandle handle)
+: _id(id), _code(code), _time(time), _index(index), _att(att),
+  _handle(handle), _cancelled(false) {
     if (_att) {
         Py_INCREF(_att);
     }
@@ -15,7 +18,8 @@ Event::Event(int id, int code, float time, int index, PyObject *att)
 
 Event::Event(const Event& other)
 : _id(other._id), _code(other._code), _time(other._time),
-  _index(other._index), _att(other._att) {
+  _index(other._index), _att(other._att), _handle(other._handle),
+  _cancelled(other._cancelled) {
     if (_att) {
         Py_INCREF(_att);
     }
@@ -47,40 +51,116 @@ bool EventPtrComparator::operator()(Event* lside, Event* rside) {
 }
 
 
+/******* EVENT POOL *************/
+EventPool::EventPool()
+: _num_acquired(0), _num_released(0) {
+    ; // nop
+}
+
+EventPool::~EventPool() {
+    // Events still in use are released by their owner, so here slabs hold
+    // no constructed events:
+    for (auto slab: _slabs) {
+        ::operator delete(slab);
+    }
+}
+
+Event *EventPool::acquire(int64_t id, int code, double time, int index,
+                          PyObject *att) {
+    if (_free.empty()) {
+        _grow();
+    }
+    uint32_t slot = _free.back();
+    _free.pop_back();
+    _num_acquired++;
+    EventHandle handle =
+        (static_cast<EventHandle>(_generations[slot]) << 32) | slot;
+    return new (_slots[slot]) Event(id, code, time, index, att, handle);
+}
+
+void EventPool::release(Event *event) {
+    uint32_t slot = static_cast<uint32_t>(event->getHandle());
+    event->~Event();
+    // Generations are kept in 1..2^31-1, so handles stay positive:
+    uint32_t generation = (_generations[slot] + 1) & 0x7FFFFFFF;
+    _generations[slot] = generation ? generation : 1;
+    _free.push_back(slot);
+    _num_released++;
+}
+
+Event *EventPool::find(EventHandle handle) const {
+    if (handle < 0) {
+        return nullptr;
+    }
+    uint64_t slot = static_cast<uint32_t>(handle);
+    if (slot >= _slots.size() ||
+            _generations[slot] != static_cast<uint64_t>(handle) >> 32) {
+        return nullptr;
+    }
+    // Generation of a slot changes on release, so the event is alive:
+    return _slots[slot];
+}
+
+void EventPool::_grow() {
+    Event *slab = static_cast<Event*>(
+        ::operator new(sizeof(Event) * SLAB_SIZE));
+    _slabs.push_back(slab);
+    uint32_t first_slot = _slots.size();
+    _slots.reserve(get_capacity());
+    _generations.resize(get_capacity(), 1);
+    // Free list never grows when events are released:
+    _free.reserve(get_capacity());
+    for (int i = 0; i < SLAB_SIZE; i++) {
+        _slots.push_back(slab + i);
+    }
+    for (int i = SLAB_SIZE - 1; i >= 0; i--) {
+        _free.push_back(first_slot + i);
+    }
+}
+
+
 /******* SCHEDULER **************/
 Scheduler::Scheduler()
 : _callback_e(nullptr), _callback_i(nullptr), _callback_p(nullptr),
   _callback_ip(nullptr), _next_event_id(1), _time(0.0),
-  _context_owner(nullptr), _stopped(false) {
+  _context_owner(nullptr), _stopped(false), _started(false),
+  _exit_reason(EXIT_EMPTY) {
     ; // nop
 }
 
 Scheduler::~Scheduler() {
     while (!_queue.empty()) {
         Event *top = _queue.top();
-        delete top;
+        _event_pool.release(top);
         _queue.pop();
     }
 }
 
 
 void Scheduler::attach_handler_ip(int code, void *handler) {
-    struct HandlerDescriptor hd = {handler, SPECTYPE_INT_PYOBJ};
-    _handlers[code].push_back(hd);
+    _attach_handler(code, handler, _callback_ip);
 }
 
 void Scheduler::attach_handler_i(int code, void *handler) {
-    struct HandlerDescriptor hd = {handler, SPECTYPE_INT};
-    _handlers[code].push_back(hd);
+    _attach_handler(code, handler, _callback_i);
 }
 
 void Scheduler::attach_handler_p(int code, void *handler) {
-    struct HandlerDescriptor hd = {handler, SPECTYPE_PYOBJ};
-    _handlers[code].push_back(hd);
+    _attach_handler(code, handler, _callback_p);
 }
 
 void Scheduler::attach_handler_e(int code, void *handler) {
-    struct HandlerDescriptor hd = {handler, SPECTYPE_EMPTY};
+    _attach_handler(code, handler, _callback_e);
+}
+
+void Scheduler::_attach_handler(int code, void *handler, CyCallback callback) {
+    if (code < 0) {
+        return;  // events with negative codes are never dispatched
+    }
+    if (static_cast<size_t>(code) >= _handlers.size()) {
+        _handlers.resize(code + 1);
+    }
+    struct HandlerDescriptor hd = {handler, callback};
     _handlers[code].push_back(hd);
 }
 
@@ -89,67 +169,105 @@ void Scheduler::attach_init_handler(void *handler) {
 }
 
 
-int Scheduler::schedule(float time, int code, int index, PyObject *att) {
-    return _schedule(new Event(_next_event_id, code, time, index, att));
+EventHandle Scheduler::schedule(double time, int code, int index,
+                               PyObject *att) {
+    return _schedule(
+        _event_pool.acquire(_next_event_id, code, time, index, att));
 }
 
-int Scheduler::_schedule(Event *event) {
+EventHandle Scheduler::_schedule(Event *event) {
     _next_event_id++;
     _queue.push(event);
-    return event->getID();
+    return event->getHandle();
 }
 
 void Scheduler::stop() {
     _stopped = true;
 }
 
-void Scheduler::cancel(int event_id) {
-    _cancelled_event_ids.insert(event_id);
+void Scheduler::cancel(EventHandle handle) {
+    // Cancelled events stay in the queue and are released when popped:
+    Event *event = _event_pool.find(handle);
+    if (event) {
+        event->cancel();
+    }
 }
 
-void Scheduler::run()
+ExitReason Scheduler::run(double until, int64_t max_events)
 {
     _time = 0.0;
+    _started = true;
+    _stopped = false;
 
     // Initialization:
     for (auto& fn: _init_handlers) {
-        _callback_e(fn, _context_owner);
+        _callback_e(fn, _context_owner, -1, nullptr);
     }
 
+    return _run_until(until, max_events);
+}
+
+ExitReason Scheduler::continue_until(double until, int64_t max_events)
+{
+    _stopped = false;
+    return _run_until(until, max_events);
+}
+
+ExitReason Scheduler::_run_until(double until, int64_t max_events)
+{
+    int64_t budget = max_events <= 0 ?
+        std::numeric_limits<int64_t>::max() : max_events;
+    _exit_reason = EXIT_EMPTY;
+
     // Main loop:
-    while (!_queue.empty() && !_stopped)
+    while (!_queue.empty())
     {
+        if (_stopped) {
+            _exit_reason = EXIT_STOPPED;
+            break;
+        }
+
         Event *event = _queue.top();
+
+        if (event->isCancelled()) {
+            _queue.pop();
+            _event_pool.release(event);
+            continue;
+        }
+
+        if (event->getTime() > until) {
+            // Event crossing the horizon stays in the queue:
+            _time = until;
+            _exit_reason = EXIT_TIME_LIMIT;
+            break;
+        }
+
         _queue.pop();
+        _time = event->getTime();
 
-        auto cit = _cancelled_event_ids.find(event->getID());
-        if (cit != _cancelled_event_ids.end()) {
-            _cancelled_event_ids.erase(cit);
-        } else {
-            _time = event->getTime();
-            const auto& hs = _handlers[event->getCode()];
-
-            for (auto it = hs.begin(); it != hs.end(); it++) {
-                switch (it->spec_type) {
-                case SPECTYPE_EMPTY:
-                    _callback_e(it->handler, _context_owner);
-                    break;
-                case SPECTYPE_INT:
-                    _callback_i(it->handler, _context_owner, event->getIndex());
-                    break;
-                case SPECTYPE_PYOBJ:
-                    _callback_p(it->handler, _context_owner, event->getAtt());
-                    break;
-                default:
-                    _callback_ip(it->handler, _context_owner,
-                                 event->getIndex(), event->getAtt());
-                    break;
-                }
-            }
+        // Negative codes become huge unsigned indices, so they are skipped
+        // together with codes that have no handlers. Handlers are indexed
+        // on each step, since a handler may attach more handlers:
+        size_t code = static_cast<size_t>(event->getCode());
+        for (size_t i = 0; code < _handlers.size() &&
+                i < _handlers[code].size(); i++) {
+            const HandlerDescriptor hd = _handlers[code][i];
+            hd.callback(hd.handler, _context_owner, event->getIndex(),
+                        event->getAtt());
         }
 
-        delete event;
+        _event_pool.release(event);
+
+        if (--budget == 0) {
+            _exit_reason = EXIT_MAX_EVENTS;
+            break;
+        }
+    }
+    // Handler of the last event may have stopped the run too:
+    if (_stopped && _exit_reason == EXIT_EMPTY) {
+        _exit_reason = EXIT_STOPPED;
     }
+    return _exit_reason;
 }
 
 }}
@@ -1,9 +1,9 @@
 #ifndef SCHEDULER_H
 #define SCHEDULER_H
 
+#include <cstdint>
+#include <limits>
 #include <queue>
-#include <map>
-#include <unordered_set>
 #include <functional>
 #include <string>
 #include <Python.h>
@@ -12,35 +12,54 @@ namespace model {
 namespace des {
 
 
-#define SPECTYPE_INT_PYOBJ 0
-#define SPECTYPE_INT 1
-#define SPECTYPE_PYOBJ 2
-#define SPECTYPE_EMPTY 3
+/**
+ * Event handle returned by `Scheduler::schedule()`: pool slot index in the
+ * lower 32 bits and slot generation in the upper bits. Generation changes
+ * each time the slot is released, so handles of fired or cancelled events
+ * become stale. Valid handles are positive, any negative value is a null
+ * handle.
+ */
+typedef int64_t EventHandle;
+
+
+/** Why `Scheduler::run()` or `Scheduler::continue_until()` returned. */
+enum ExitReason {
+    EXIT_EMPTY = 0,       // no events left
+    EXIT_STOPPED = 1,     // a handler called `stop()`
+    EXIT_TIME_LIMIT = 2,  // next event is later than the horizon
+    EXIT_MAX_EVENTS = 3,  // event budget is exhausted
+};
 
 
 class Event
 {
   public:
-    Event(int id, int code, float time, int index, PyObject *att);
+    Event(int64_t id, int code, double time, int index, PyObject *att,
+          EventHandle handle = -1);
     Event(const Event& other);
     ~Event();
 
-    inline int getID() const { return _id; }
+    inline int64_t getID() const { return _id; }
     inline int getCode() const { return _code; }
-    inline float getTime() const { return _time; }
+    inline double getTime() const { return _time; }
     inline int getIndex() const { return _index; }
     inline PyObject *getAtt() const { return _att; }
+    inline EventHandle getHandle() const { return _handle; }
+    inline bool isCancelled() const { return _cancelled; }
+    inline void cancel() { _cancelled = true; }
 
     bool operator<(const Event& rside) const;
 
     std::string str() const;
 
   private:
-    int _id;
+    int64_t _id;
     int _code;
-    float _time;
+    double _time;
     int _index;
     PyObject *_att;
+    EventHandle _handle;
+    bool _cancelled;
 };
 
 
@@ -50,16 +69,66 @@ struct EventPtrComparator {
 };
 
 
-struct HandlerDescriptor {
-    void *handler;
-    int spec_type;
+/**
+ * Free-list allocator of events.
+ *
+ * Events are constructed in place in slabs of `SLAB_SIZE` events, and
+ * released events are kept in the free list for reuse. Memory is only
+ * allocated when all slabs are in use, so a run with a steady number of
+ * pending events does no heap allocations per event.
+ *
+ * Each event place is a slot with a generation counter, so `find()` gets
+ * an event by its handle in O(1), or null if the handle is stale.
+ */
+class EventPool
+{
+  public:
+    static const int SLAB_SIZE = 1024;
+
+    EventPool();
+    ~EventPool();
+
+    Event *acquire(int64_t id, int code, double time, int index,
+                   PyObject *att);
+    void release(Event *event);
+    Event *find(EventHandle handle) const;
+
+    inline int get_num_slabs() const { return _slabs.size(); }
+    inline int get_capacity() const { return _slabs.size() * SLAB_SIZE; }
+    inline int get_num_in_use() const {
+        return get_capacity() - static_cast<int>(_free.size());
+    }
+    inline long get_num_acquired() const { return _num_acquired; }
+    inline long get_num_released() const { return _num_released; }
+
+  private:
+    std::vector<Event*> _slabs;
+    std::vector<Event*> _slots;
+    std::vector<uint32_t> _generations;
+    std::vector<uint32_t> _free;
+    long _num_acquired;
+    long _num_released;
+
+    void _grow();
 };
 
 
-typedef void (*CyCallbackIP)(void*, PyObject*, int, PyObject*);
-typedef void (*CyCallbackI)(void*, PyObject*, int);
-typedef void (*CyCallbackP)(void*, PyObject*, PyObject*);
-typedef void (*CyCallbackE)(void*, PyObject*);
+/**
+ * Callback calling a Python handler: `(handler, context_owner, index, att)`.
+ * There is a callback per spec type, and each passes to the handler only
+ * the arguments of its spec type.
+ */
+typedef void (*CyCallback)(void*, PyObject*, int, PyObject*);
+
+
+/**
+ * Handler with its callback, resolved from the spec type when the handler
+ * is attached, so dispatching an event makes a single indirect call.
+ */
+struct HandlerDescriptor {
+    void *handler;
+    CyCallback callback;
+};
 
 
 class Scheduler
@@ -68,10 +137,11 @@ class Scheduler
     Scheduler();
     ~Scheduler();
 
-    inline void set_cy_callback_ip(CyCallbackIP fn) { _callback_ip = fn; }
-    inline void set_cy_callback_i(CyCallbackI fn) { _callback_i = fn; }
-    inline void set_cy_callback_p(CyCallbackP fn) { _callback_p = fn; }
-    inline void set_cy_callback_e(CyCallbackE fn) { _callback_e = fn; }
+    // Callbacks must be set before handlers are attached:
+    inline void set_cy_callback_ip(CyCallback fn) { _callback_ip = fn; }
+    inline void set_cy_callback_i(CyCallback fn) { _callback_i = fn; }
+    inline void set_cy_callback_p(CyCallback fn) { _callback_p = fn; }
+    inline void set_cy_callback_e(CyCallback fn) { _callback_e = fn; }
 
     void attach_handler_ip(int code, void *handler);
     void attach_handler_i(int code, void *handler);
@@ -81,31 +151,57 @@ class Scheduler
 
     inline void set_context_owner(PyObject* owner) { _context_owner = owner; }
 
-    int schedule(float time, int code, int index = -1, PyObject *att = nullptr);
+    EventHandle schedule(double time, int code, int index = -1,
+                         PyObject *att = nullptr);
     void stop();
 
-    void cancel(int event_id);
-
-    inline float get_time() const { return _time; }
-
-    void run();
+    /** Cancel a pending event, stale and null handles are ignored. */
+    void cancel(EventHandle handle);
+
+    inline double get_time() const { return _time; }
+    inline bool is_started() const { return _started; }
+    inline ExitReason get_exit_reason() const { return _exit_reason; }
+    inline const EventPool& get_event_pool() const { return _event_pool; }
+
+    /**
+     * Run init handlers and events up to time `until` (inclusive), but not
+     * more than `max_events` events (non-positive means no limit).
+     *
+     * Events later than `until` stay in the queue, and the time is set to
+     * `until`, so the run can be extended with `continue_until()`.
+     */
+    ExitReason run(double until = std::numeric_limits<double>::infinity(),
+                   int64_t max_events = -1);
+
+    /**
+     * Continue a started run up to time `until`, without resetting time or
+     * calling init handlers. Events run in the same order as if the first
+     * run was made up to `until`. `max_events` limits the number of events
+     * run by this call.
+     */
+    ExitReason continue_until(double until, int64_t max_events = -1);
 
   private:
-    CyCallbackE _callback_e;
-    CyCallbackI _callback_i;
-    CyCallbackP _callback_p;
-    CyCallbackIP _callback_ip;
+    CyCallback _callback_e;
+    CyCallback _callback_i;
+    CyCallback _callback_p;
+    CyCallback _callback_ip;
 
+    EventPool _event_pool;
     std::priority_queue<Event*, std::vector<Event*>, EventPtrComparator> _queue;
-    std::unordered_set<int> _cancelled_event_ids;
-    int _next_event_id;
-    std::map<int, std::vector<HandlerDescriptor> > _handlers;
+    int64_t _next_event_id;
+    // Handlers lists indexed by event code (codes are small integers):
+    std::vector<std::vector<HandlerDescriptor> > _handlers;
     std::vector<void*> _init_handlers;
-    float _time;
+    double _time;
     PyObject *_context_owner;
     bool _stopped;
+    bool _started;
+    ExitReason _exit_reason;
 
-    int _schedule(Event *event);
+    EventHandle _schedule(Event *event);
+    void _attach_handler(int code, void *handler, CyCallback callback);
+    ExitReason _run_until(double until, int64_t max_events);
 };
 
 
@@ -1,4 +1,5 @@
 from cpython.ref cimport PyObject
+from libc.stdint cimport int64_t
 
 
 cdef extern from "Scheduler.cpp":
@@ -6,26 +7,41 @@ cdef extern from "Scheduler.cpp":
 
 
 cdef extern from "Scheduler.h" namespace "model::des":
-    ctypedef void (*CyCallbackE)(void*, PyObject*)
-    ctypedef void (*CyCallbackI)(void*, PyObject*, int)
-    ctypedef void (*CyCallbackP)(void*, PyObject*, PyObject*)
-    ctypedef void (*CyCallbackIP)(void*, PyObject*, int, PyObject*)
+    ctypedef int64_t EventHandle
+    ctypedef void (*CyCallback)(void*, PyObject*, int, PyObject*)
+
+    cdef enum ExitReason:
+        EXIT_EMPTY
+        EXIT_STOPPED
+        EXIT_TIME_LIMIT
+        EXIT_MAX_EVENTS
+
+    cdef cppclass EventPool:
+        int get_num_slabs() const
+        int get_capacity() const
+        int get_num_in_use() const
+        long get_num_acquired() const
+        long get_num_released() const
 
     cdef cppclass Scheduler:
         # noinspection PyPep8Naming
         Scheduler()
-        void set_cy_callback_e(CyCallbackE fn)
-        void set_cy_callback_i(CyCallbackI fn)
-        void set_cy_callback_p(CyCallbackP fn)
-        void set_cy_callback_ip(CyCallbackIP fn)
+        void set_cy_callback_e(CyCallback fn)
+        void set_cy_callback_i(CyCallback fn)
+        void set_cy_callback_p(CyCallback fn)
+        void set_cy_callback_ip(CyCallback fn)
         void set_context_owner(PyObject *owner)
         void attach_handler_e(int code, void *handler)
         void attach_handler_i(int code, void *handler)
         void attach_handler_p(int code, void *handler)
         void attach_handler_ip(int code, void *handler)
         void attach_init_handler(void *handler)
-        int schedule(float time, int code, int index, PyObject *att)
-        void cancel(int event_id)
-        float get_time()
-        void run()
+        EventHandle schedule(double time, int code, int index, PyObject *att)
+        void cancel(EventHandle handle)
+        double get_time()
+        bint is_started()
+        ExitReason get_exit_reason()
+        const EventPool& get_event_pool()
+        ExitReason run(double until, int64_t max_events)
+        ExitReason continue_until(double until, int64_t max_events)
         void stop();
@@ -1,12 +1,9 @@
-/* Generated by Cython 0.29.19 */
+/* Generated by Cython 0.29.37 */
 
 /* BEGIN: Cython Metadata
 {
     "distutils": {
-        "depends": [
-            "src/model/des/Scheduler.cpp",
-            "src/model/des/Scheduler.h"
-        ],
+        "depends": [],
         "extra_compile_args": [
             "-std=c++11"
         ],
@@ -14,7 +11,6 @@
             "-std=c++11"
         ],
         "include_dirs": [
-            "src/model/des",
             "src/model/des/"
         ],
         "language": "c++",
@@ -27,15 +23,17 @@
 }
 END: Cython Metadata */
 
+#ifndef PY_SSIZE_T_CLEAN
 #define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
 #include "Python.h"
 #ifndef Py_PYTHON_H
     #error Python headers needed to compile C extensions, please install development version of Python.
 #elif PY_VERSION_HEX < 0x02060000 || (0x03000000 <= PY_VERSION_HEX && PY_VERSION_HEX < 0x03030000)
     #error Cython requires Python 2.6+ or Python 3.3+.
 #else
-#define CYTHON_ABI "0_29_19"
-#define CYTHON_HEX_VERSION 0x001D13F0
+#define CYTHON_ABI "0_29_37"
+#define CYTHON_HEX_VERSION 0x001D25F0
 #define CYTHON_FUTURE_DIVISION 1
 #include <stddef.h>
 #ifndef offsetof
@@ -74,6 +72,7 @@ END: Cython Metadata */
   #define CYTHON_COMPILING_IN_PYPY 1
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #undef CYTHON_USE_TYPE_SLOTS
   #define CYTHON_USE_TYPE_SLOTS 0
   #undef CYTHON_USE_PYTYPE_LOOKUP
@@ -102,18 +101,26 @@ END: Cython Metadata */
   #define CYTHON_FAST_THREAD_STATE 0
   #undef CYTHON_FAST_PYCALL
   #define CYTHON_FAST_PYCALL 0
-  #undef CYTHON_PEP489_MULTI_PHASE_INIT
-  #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
   #undef CYTHON_USE_TP_FINALIZE
-  #define CYTHON_USE_TP_FINALIZE 0
+  #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1 && PYPY_VERSION_NUM >= 0x07030C00)
   #undef CYTHON_USE_DICT_VERSIONS
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
 #elif defined(PYSTON_VERSION)
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 1
   #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -151,10 +158,59 @@ END: Cython Metadata */
   #define CYTHON_USE_DICT_VERSIONS 0
   #undef CYTHON_USE_EXC_INFO_STACK
   #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+#elif defined(PY_NOGIL)
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_PYSTON 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_NOGIL 1
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #ifndef CYTHON_USE_ASYNC_SLOTS
+    #define CYTHON_USE_ASYNC_SLOTS 1
+  #endif
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
 #else
   #define CYTHON_COMPILING_IN_PYPY 0
   #define CYTHON_COMPILING_IN_PYSTON 0
   #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_NOGIL 0
   #ifndef CYTHON_USE_TYPE_SLOTS
     #define CYTHON_USE_TYPE_SLOTS 1
   #endif
@@ -174,7 +230,7 @@ END: Cython Metadata */
     #undef CYTHON_USE_PYLONG_INTERNALS
     #define CYTHON_USE_PYLONG_INTERNALS 0
   #elif !defined(CYTHON_USE_PYLONG_INTERNALS)
-    #define CYTHON_USE_PYLONG_INTERNALS 1
+    #define CYTHON_USE_PYLONG_INTERNALS (PY_VERSION_HEX < 0x030C00A5)
   #endif
   #ifndef CYTHON_USE_PYLIST_INTERNALS
     #define CYTHON_USE_PYLIST_INTERNALS 1
@@ -182,7 +238,7 @@ END: Cython Metadata */
   #ifndef CYTHON_USE_UNICODE_INTERNALS
     #define CYTHON_USE_UNICODE_INTERNALS 1
   #endif
-  #if PY_VERSION_HEX < 0x030300F0
+  #if PY_VERSION_HEX < 0x030300F0 || PY_VERSION_HEX >= 0x030B00A2
     #undef CYTHON_USE_UNICODE_WRITER
     #define CYTHON_USE_UNICODE_WRITER 0
   #elif !defined(CYTHON_USE_UNICODE_WRITER)
@@ -197,11 +253,14 @@ END: Cython Metadata */
   #ifndef CYTHON_UNPACK_METHODS
     #define CYTHON_UNPACK_METHODS 1
   #endif
-  #ifndef CYTHON_FAST_THREAD_STATE
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 0
+  #elif !defined(CYTHON_FAST_THREAD_STATE)
     #define CYTHON_FAST_THREAD_STATE 1
   #endif
   #ifndef CYTHON_FAST_PYCALL
-    #define CYTHON_FAST_PYCALL 1
+    #define CYTHON_FAST_PYCALL (PY_VERSION_HEX < 0x030A0000)
   #endif
   #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
     #define CYTHON_PEP489_MULTI_PHASE_INIT (PY_VERSION_HEX >= 0x03050000)
@@ -210,17 +269,25 @@ END: Cython Metadata */
     #define CYTHON_USE_TP_FINALIZE (PY_VERSION_HEX >= 0x030400a1)
   #endif
   #ifndef CYTHON_USE_DICT_VERSIONS
-    #define CYTHON_USE_DICT_VERSIONS (PY_VERSION_HEX >= 0x030600B1)
+    #define CYTHON_USE_DICT_VERSIONS ((PY_VERSION_HEX >= 0x030600B1) && (PY_VERSION_HEX < 0x030C00A5))
   #endif
-  #ifndef CYTHON_USE_EXC_INFO_STACK
+  #if PY_VERSION_HEX >= 0x030B00A4
+    #undef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 0
+  #elif !defined(CYTHON_USE_EXC_INFO_STACK)
     #define CYTHON_USE_EXC_INFO_STACK (PY_VERSION_HEX >= 0x030700A3)
   #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
 #endif
 #if !defined(CYTHON_FAST_PYCCALL)
 #define CYTHON_FAST_PYCCALL  (CYTHON_FAST_PYCALL && PY_VERSION_HEX >= 0x030600B1)
 #endif
 #if CYTHON_USE_PYLONG_INTERNALS
-  #include "longintrepr.h"
+  #if PY_MAJOR_VERSION < 3
+    #include "longintrepr.h"
+  #endif
   #undef SHIFT
   #undef BASE
   #undef MASK
@@ -339,9 +406,6 @@ class __Pyx_FakeReference {
     T *ptr;
 };
 
-#if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x02070600 && !defined(Py_OptimizeFlag)
-  #define Py_OptimizeFlag 0
-#endif
 #define __PYX_BUILD_PY_SSIZE_T "n"
 #define CYTHON_FORMAT_SSIZE_T "z"
 #if PY_MAJOR_VERSION < 3
@@ -351,15 +415,79 @@ class __Pyx_FakeReference {
   #define __Pyx_DefaultClassType PyClass_Type
 #else
   #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-#if PY_VERSION_HEX >= 0x030800A4 && PY_VERSION_HEX < 0x030800B2
-  #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
-          PyCode_New(a, 0, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+  #define __Pyx_DefaultClassType PyType_Type
+#if PY_VERSION_HEX >= 0x030B00A1
+    static CYTHON_INLINE PyCodeObject* __Pyx_PyCode_New(int a, int k, int l, int s, int f,
+                                                    PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                                    PyObject *fv, PyObject *cell, PyObject* fn,
+                                                    PyObject *name, int fline, PyObject *lnos) {
+        PyObject *kwds=NULL, *argcount=NULL, *posonlyargcount=NULL, *kwonlyargcount=NULL;
+        PyObject *nlocals=NULL, *stacksize=NULL, *flags=NULL, *replace=NULL, *call_result=NULL, *empty=NULL;
+        const char *fn_cstr=NULL;
+        const char *name_cstr=NULL;
+        PyCodeObject* co=NULL;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        if (!(kwds=PyDict_New())) goto end;
+        if (!(argcount=PyLong_FromLong(a))) goto end;
+        if (PyDict_SetItemString(kwds, "co_argcount", argcount) != 0) goto end;
+        if (!(posonlyargcount=PyLong_FromLong(0))) goto end;
+        if (PyDict_SetItemString(kwds, "co_posonlyargcount", posonlyargcount) != 0) goto end;
+        if (!(kwonlyargcount=PyLong_FromLong(k))) goto end;
+        if (PyDict_SetItemString(kwds, "co_kwonlyargcount", kwonlyargcount) != 0) goto end;
+        if (!(nlocals=PyLong_FromLong(l))) goto end;
+        if (PyDict_SetItemString(kwds, "co_nlocals", nlocals) != 0) goto end;
+        if (!(stacksize=PyLong_FromLong(s))) goto end;
+        if (PyDict_SetItemString(kwds, "co_stacksize", stacksize) != 0) goto end;
+        if (!(flags=PyLong_FromLong(f))) goto end;
+        if (PyDict_SetItemString(kwds, "co_flags", flags) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_code", code) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_consts", c) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_names", n) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_varnames", v) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_freevars", fv) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_cellvars", cell) != 0) goto end;
+        if (PyDict_SetItemString(kwds, "co_linetable", lnos) != 0) goto end;
+        if (!(fn_cstr=PyUnicode_AsUTF8AndSize(fn, NULL))) goto end;
+        if (!(name_cstr=PyUnicode_AsUTF8AndSize(name, NULL))) goto end;
+        if (!(co = PyCode_NewEmpty(fn_cstr, name_cstr, fline))) goto end;
+        if (!(replace = PyObject_GetAttrString((PyObject*)co, "replace"))) goto cleanup_code_too;
+        if (!(empty = PyTuple_New(0))) goto cleanup_code_too; // unfortunately __pyx_empty_tuple isn't available here
+        if (!(call_result = PyObject_Call(replace, empty, kwds))) goto cleanup_code_too;
+        Py_XDECREF((PyObject*)co);
+        co = (PyCodeObject*)call_result;
+        call_result = NULL;
+        if (0) {
+            cleanup_code_too:
+            Py_XDECREF((PyObject*)co);
+            co = NULL;
+        }
+        end:
+        Py_XDECREF(kwds);
+        Py_XDECREF(argcount);
+        Py_XDECREF(posonlyargcount);
+        Py_XDECREF(kwonlyargcount);
+        Py_XDECREF(nlocals);
+        Py_XDECREF(stacksize);
+        Py_XDECREF(replace);
+        Py_XDECREF(call_result);
+        Py_XDECREF(empty);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return co;
+    }
 #else
   #define __Pyx_PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
           PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
 #endif
   #define __Pyx_DefaultClassType PyType_Type
 #endif
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
 #ifndef Py_TPFLAGS_CHECKTYPES
   #define Py_TPFLAGS_CHECKTYPES 0
 #endif
@@ -467,8 +595,12 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #endif
 #if PY_VERSION_HEX > 0x03030000 && defined(PyUnicode_KIND)
   #define CYTHON_PEP393_ENABLED 1
-  #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
-                                              0 : _PyUnicode_Ready((PyObject *)(op)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
   #define __Pyx_PyUnicode_GET_LENGTH(u)   PyUnicode_GET_LENGTH(u)
   #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
   #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
@@ -476,7 +608,15 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
   #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
   #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
   #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, ch)
-  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
 #else
   #define CYTHON_PEP393_ENABLED 0
   #define PyUnicode_1BYTE_KIND  1
@@ -539,6 +679,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #ifndef PySet_CheckExact
   #define PySet_CheckExact(obj)        (Py_TYPE(obj) == &PySet_Type)
 #endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
 #if CYTHON_ASSUME_SAFE_MACROS
   #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
 #else
@@ -572,13 +719,13 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
 #if PY_VERSION_HEX < 0x030200A4
   typedef long Py_hash_t;
   #define __Pyx_PyInt_FromHash_t PyInt_FromLong
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsLong
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsHash_t
 #else
   #define __Pyx_PyInt_FromHash_t PyInt_FromSsize_t
-  #define __Pyx_PyInt_AsHash_t   PyInt_AsSsize_t
+  #define __Pyx_PyInt_AsHash_t   __Pyx_PyIndex_AsSsize_t
 #endif
 #if PY_MAJOR_VERSION >= 3
-  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? PyMethod_New(func, self) : (Py_INCREF(func), func))
+  #define __Pyx_PyMethod_New(func, self, klass) ((self) ? ((void)(klass), PyMethod_New(func, self)) : __Pyx_NewRef(func))
 #else
   #define __Pyx_PyMethod_New(func, self, klass) PyMethod_New(func, self, klass)
 #endif
@@ -600,8 +747,10 @@ static CYTHON_INLINE void * PyThread_tss_get(Py_tss_t *key) {
     } __Pyx_PyAsyncMethodsStruct;
 #endif
 
-#if defined(WIN32) || defined(MS_WINDOWS)
-  #define _USE_MATH_DEFINES
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #if !defined(_USE_MATH_DEFINES)
+    #define _USE_MATH_DEFINES
+  #endif
 #endif
 #include <math.h>
 #ifdef NAN
@@ -637,8 +786,10 @@ static CYTHON_INLINE float __PYX_NAN() {
 /* Early includes */
 #include <string.h>
 #include <stdio.h>
+#include <stdint.h>
 #include "Scheduler.cpp"
 #include "Scheduler.h"
+#include <math.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -735,6 +886,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyNumber_IntOrLong(PyObject* x);
     (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
 static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
 static CYTHON_INLINE PyObject * __Pyx_PyInt_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
 #if CYTHON_ASSUME_SAFE_MACROS
 #define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
 #else
@@ -847,21 +999,23 @@ static const char *__pyx_filename;
 
 
 static const char *__pyx_f[] = {
-  "stringsource",
   "src/model/des/cyscheduler.pyx",
-  "venv/lib/python3.8/site-packages/Cython/Includes/cpython/type.pxd",
+  "stringsource",
+  "type.pxd",
 };
 
 /*--- Type declarations ---*/
 struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler;
 struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule;
+struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_run;
+struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_continue_until;
 
-/* "model/des/cyscheduler.pyx":82
+/* "model/des/cyscheduler.pyx":95
  *         return self.c_scheduler.get_time()
  * 
- *     cpdef int schedule(self, float time, int code, int index = -1,             # <<<<<<<<<<<<<<
- *                        object att = None):
- *         cdef PyObject *c_att = NULL
+ *     cpdef EventHandle schedule(self, double time, int code, int index = -1,             # <<<<<<<<<<<<<<
+ *                                object att = None):
+ *         """Schedule an event and return its handle (a positive integer)."""
  */
 struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule {
   int __pyx_n;
@@ -869,7 +1023,32 @@ struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule {
   PyObject *att;
 };
 
-/* "model/des/cyscheduler.pyx":34
+/* "model/des/cyscheduler.pyx":126
+ *             pool.get_num_acquired(), pool.get_num_released())
+ * 
+ *     cpdef object run(self, until=None, max_events=None):             # <<<<<<<<<<<<<<
+ *         """Run init handlers and events up to `until` (inclusive).
+ * 
+ */
+struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_run {
+  int __pyx_n;
+  PyObject *until;
+  PyObject *max_events;
+};
+
+/* "model/des/cyscheduler.pyx":138
+ *         return ExitReason(self.c_scheduler.run(c_until, c_max_events))
+ * 
+ *     cpdef object continue_until(self, double until, max_events=None):             # <<<<<<<<<<<<<<
+ *         """Continue a started run up to `until`, keeping queue and state.
+ * 
+ */
+struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_continue_until {
+  int __pyx_n;
+  PyObject *max_events;
+};
+
+/* "model/des/cyscheduler.pyx":45
  * 
  * 
  * cdef class CyScheduler:             # <<<<<<<<<<<<<<
@@ -886,11 +1065,12 @@ struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler {
 
 
 struct __pyx_vtabstruct_5model_3des_11cyscheduler_CyScheduler {
-  float (*get_time)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int __pyx_skip_dispatch);
-  int (*schedule)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, float, int, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule *__pyx_optional_args);
-  void (*cancel)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int, int __pyx_skip_dispatch);
+  double (*get_time)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int __pyx_skip_dispatch);
+  model::des::EventHandle (*schedule)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, double, int, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule *__pyx_optional_args);
+  void (*cancel)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, model::des::EventHandle, int __pyx_skip_dispatch);
   void (*stop)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int __pyx_skip_dispatch);
-  void (*run)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int __pyx_skip_dispatch);
+  PyObject *(*run)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_run *__pyx_optional_args);
+  PyObject *(*continue_until)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_continue_until *__pyx_optional_args);
 };
 static struct __pyx_vtabstruct_5model_3des_11cyscheduler_CyScheduler *__pyx_vtabptr_5model_3des_11cyscheduler_CyScheduler;
 
@@ -968,6 +1148,13 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject
 /* GetBuiltinName.proto */
 static PyObject *__Pyx_GetBuiltinName(PyObject *name);
 
+/* PyCFunctionFastCall.proto */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
+#else
+#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
+#endif
+
 /* PyFunctionFastCall.proto */
 #if CYTHON_FAST_PYCALL
 #define __Pyx_PyFunction_FastCall(func, args, nargs)\
@@ -982,13 +1169,21 @@ static PyObject *__Pyx_PyFunction_FastCallDict(PyObject *func, PyObject **args,
 #ifndef Py_MEMBER_SIZE
 #define Py_MEMBER_SIZE(type, member) sizeof(((type *)0)->member)
 #endif
+#if CYTHON_FAST_PYCALL
   static size_t __pyx_pyframe_localsplus_offset = 0;
   #include "frameobject.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
   #define __Pxy_PyFrame_Initialize_Offsets()\
     ((void)__Pyx_BUILD_ASSERT_EXPR(sizeof(PyFrameObject) == offsetof(PyFrameObject, f_localsplus) + Py_MEMBER_SIZE(PyFrameObject, f_localsplus)),\
      (void)(__pyx_pyframe_localsplus_offset = ((size_t)PyFrame_Type.tp_basicsize) - Py_MEMBER_SIZE(PyFrameObject, f_localsplus)))
   #define __Pyx_PyFrame_GetLocalsplus(frame)\
     (assert(__pyx_pyframe_localsplus_offset), (PyObject **)(((char *)(frame)) + __pyx_pyframe_localsplus_offset))
+#endif // CYTHON_FAST_PYCALL
 #endif
 
 /* PyObjectCall.proto */
@@ -998,31 +1193,17 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
 #define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
 #endif
 
+/* PyObjectCall2Args.proto */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
+
 /* PyObjectCallMethO.proto */
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
 #endif
 
-/* PyObjectCallNoArg.proto */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
-#else
-#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
-#endif
-
-/* PyCFunctionFastCall.proto */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject *__Pyx_PyCFunction_FastCall(PyObject *func, PyObject **args, Py_ssize_t nargs);
-#else
-#define __Pyx_PyCFunction_FastCall(func, args, nargs)  (assert(0), NULL)
-#endif
-
 /* PyObjectCallOneArg.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
-/* PyObjectCall2Args.proto */
-static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2);
-
 /* PyThreadStateGet.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
@@ -1099,18 +1280,18 @@ static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UIN
 
 /* GetModuleGlobalName.proto */
 #if CYTHON_USE_DICT_VERSIONS
-#define __Pyx_GetModuleGlobalName(var, name)  {\
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
     static PY_UINT64_T __pyx_dict_version = 0;\
     static PyObject *__pyx_dict_cached_value = NULL;\
     (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_d))) ?\
         (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
         __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
-#define __Pyx_GetModuleGlobalNameUncached(var, name)  {\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
     PY_UINT64_T __pyx_dict_version;\
     PyObject *__pyx_dict_cached_value;\
     (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
-}
+} while(0)
 static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
 #else
 #define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
@@ -1126,9 +1307,57 @@ static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],\
     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,\
     const char* function_name);
 
+/* GCCDiagnostics.proto */
+#if defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* BuildPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, char* chars, int clength,
+                                                int prepend_sign, char padding_char);
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* CIntToPyUnicode.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char);
+
+/* JoinPyUnicode.proto */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char);
+
 /* RaiseException.proto */
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
 
+/* PyObjectCallNoArg.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+#else
+#define __Pyx_PyObject_CallNoArg(func) __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL)
+#endif
+
+/* PyObjectFormatSimple.proto */
+#if CYTHON_COMPILING_IN_PYPY
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
+#elif PY_MAJOR_VERSION < 3
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        likely(PyString_CheckExact(s)) ? PyUnicode_FromEncodedObject(s, NULL, "strict") :\
+        PyObject_Format(s, f))
+#elif CYTHON_USE_TYPE_SLOTS
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        likely(PyLong_CheckExact(s)) ? PyLong_Type.tp_str(s) :\
+        likely(PyFloat_CheckExact(s)) ? PyFloat_Type.tp_str(s) :\
+        PyObject_Format(s, f))
+#else
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
+#endif
+
 /* PyObject_GenericGetAttrNoDict.proto */
 #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static CYTHON_INLINE PyObject* __Pyx_PyObject_GenericGetAttrNoDict(PyObject* obj, PyObject* attr_name);
@@ -1161,14 +1390,22 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, P
 static int __Pyx_setup_reduce(PyObject* type_obj);
 
 /* TypeImport.proto */
-#ifndef __PYX_HAVE_RT_ImportType_proto
-#define __PYX_HAVE_RT_ImportType_proto
-enum __Pyx_ImportType_CheckSize {
-   __Pyx_ImportType_CheckSize_Error = 0,
-   __Pyx_ImportType_CheckSize_Warn = 1,
-   __Pyx_ImportType_CheckSize_Ignore = 2
+#ifndef __PYX_HAVE_RT_ImportType_proto_0_29_37
+#define __PYX_HAVE_RT_ImportType_proto_0_29_37
+#if __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if __STDC_VERSION__ >= 201112L || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_0_29_37(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_0_29_37 {
+   __Pyx_ImportType_CheckSize_Error_0_29_37 = 0,
+   __Pyx_ImportType_CheckSize_Warn_0_29_37 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_0_29_37 = 2
 };
-static PyTypeObject *__Pyx_ImportType(PyObject* module, const char *module_name, const char *class_name, size_t size, enum __Pyx_ImportType_CheckSize check_size);
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size);
 #endif
 
 /* Import.proto */
@@ -1203,11 +1440,20 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object);
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
                                int py_line, const char *filename);
 
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int64_t __Pyx_PyInt_As_int64_t(PyObject *);
+
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value);
 
-/* CIntFromPy.proto */
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int64_t(int64_t value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__model_3a__3a_des_3a__3a_ExitReason(enum model::des::ExitReason value);
 
 /* CIntToPy.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value);
@@ -1234,11 +1480,12 @@ static int __Pyx_check_binary_version(void);
 /* InitStrings.proto */
 static int __Pyx_InitStrings(__Pyx_StringTabEntry *t);
 
-static float __pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, float __pyx_v_time, int __pyx_v_code, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule *__pyx_optional_args); /* proto*/
-static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_v_event_id, int __pyx_skip_dispatch); /* proto*/
+static double __pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static model::des::EventHandle __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, double __pyx_v_time, int __pyx_v_code, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule *__pyx_optional_args); /* proto*/
+static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, model::des::EventHandle __pyx_v_handle, int __pyx_skip_dispatch); /* proto*/
 static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_stop(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
-static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_run(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_5model_3des_11cyscheduler_11CyScheduler_run(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_run *__pyx_optional_args); /* proto*/
+static PyObject *__pyx_f_5model_3des_11cyscheduler_11CyScheduler_continue_until(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, double __pyx_v_until, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_continue_until *__pyx_optional_args); /* proto*/
 
 /* Module declarations from 'libc.string' */
 
@@ -1255,19 +1502,26 @@ static PyTypeObject *__pyx_ptype_7cpython_4type_type = 0;
 
 /* Module declarations from 'cpython.ref' */
 
+/* Module declarations from 'libc.stdint' */
+
 /* Module declarations from 'model.des.Scheduler' */
 
+/* Module declarations from 'libc.math' */
+
 /* Module declarations from 'model.des.cyscheduler' */
 static PyTypeObject *__pyx_ptype_5model_3des_11cyscheduler_CyScheduler = 0;
-static void __pyx_f_5model_3des_11cyscheduler_cy_callback_e(void *, PyObject *); /*proto*/
-static void __pyx_f_5model_3des_11cyscheduler_cy_callback_i(void *, PyObject *, int); /*proto*/
-static void __pyx_f_5model_3des_11cyscheduler_cy_callback_p(void *, PyObject *, PyObject *); /*proto*/
+static void __pyx_f_5model_3des_11cyscheduler_cy_callback_e(void *, PyObject *, int, PyObject *); /*proto*/
+static void __pyx_f_5model_3des_11cyscheduler_cy_callback_i(void *, PyObject *, int, PyObject *); /*proto*/
+static void __pyx_f_5model_3des_11cyscheduler_cy_callback_p(void *, PyObject *, int, PyObject *); /*proto*/
 static void __pyx_f_5model_3des_11cyscheduler_cy_callback_ip(void *, PyObject *, int, PyObject *); /*proto*/
+static int64_t __pyx_f_5model_3des_11cyscheduler__get_c_max_events(PyObject *); /*proto*/
 #define __Pyx_MODULE_NAME "model.des.cyscheduler"
 extern int __pyx_module_is_main_model__des__cyscheduler;
 int __pyx_module_is_main_model__des__cyscheduler = 0;
 
 /* Implementation of 'model.des.cyscheduler' */
+static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_RuntimeError;
 static PyObject *__pyx_builtin_TypeError;
 static const char __pyx_k_att[] = "att";
 static const char __pyx_k_run[] = "run";
@@ -1281,8 +1535,10 @@ static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_time[] = "time";
 static const char __pyx_k_EMPTY[] = "EMPTY";
 static const char __pyx_k_INDEX[] = "INDEX";
+static const char __pyx_k_given[] = " given";
 static const char __pyx_k_index[] = "index";
 static const char __pyx_k_state[] = "state";
+static const char __pyx_k_until[] = "until";
 static const char __pyx_k_OBJECT[] = "OBJECT";
 static const char __pyx_k_cancel[] = "cancel";
 static const char __pyx_k_import[] = "__import__";
@@ -1290,50 +1546,81 @@ static const char __pyx_k_params[] = "params";
 static const char __pyx_k_reduce[] = "__reduce__";
 static const char __pyx_k_Context[] = "Context";
 static const char __pyx_k_handler[] = "handler";
+static const char __pyx_k_horizon[] = "horizon ";
 static const char __pyx_k_SpecType[] = "SpecType";
+static const char __pyx_k_capacity[] = "capacity";
 static const char __pyx_k_get_time[] = "get_time";
 static const char __pyx_k_getstate[] = "__getstate__";
 static const char __pyx_k_schedule[] = "schedule";
 static const char __pyx_k_setstate[] = "__setstate__";
 static const char __pyx_k_TypeError[] = "TypeError";
+static const char __pyx_k_num_slabs[] = "num_slabs";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
 static const char __pyx_k_spec_type[] = "spec_type";
+static const char __pyx_k_ExitReason[] = "ExitReason";
+static const char __pyx_k_ValueError[] = "ValueError";
+static const char __pyx_k_max_events[] = "max_events";
 static const char __pyx_k_namedtuple[] = "namedtuple";
+static const char __pyx_k_num_in_use[] = "num_in_use";
 static const char __pyx_k_pyx_vtable[] = "__pyx_vtable__";
 static const char __pyx_k_CyScheduler[] = "CyScheduler";
 static const char __pyx_k_collections[] = "collections";
-static const char __pyx_k_get_context[] = "get_context";
 static const char __pyx_k_INDEX_OBJECT[] = "INDEX_OBJECT";
+static const char __pyx_k_RuntimeError[] = "RuntimeError";
+static const char __pyx_k_num_acquired[] = "num_acquired";
+static const char __pyx_k_num_released[] = "num_released";
 static const char __pyx_k_reduce_cython[] = "__reduce_cython__";
+static const char __pyx_k_EventPoolStats[] = "EventPoolStats";
+static const char __pyx_k_continue_until[] = "continue_until";
+static const char __pyx_k_is_in_the_past[] = " is in the past";
 static const char __pyx_k_setstate_cython[] = "__setstate_cython__";
 static const char __pyx_k_cline_in_traceback[] = "cline_in_traceback";
 static const char __pyx_k_model_des_pyscheduler[] = "model.des.pyscheduler";
+static const char __pyx_k_max_events_must_be_positive[] = "max events must be positive";
+static const char __pyx_k_event_code_must_be_non_negative[] = "event code must be non-negative, ";
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
+static const char __pyx_k_scheduler_was_not_started_call_r[] = "scheduler was not started, call run() first";
 static PyObject *__pyx_n_s_Context;
 static PyObject *__pyx_n_u_Context;
 static PyObject *__pyx_n_s_CyScheduler;
 static PyObject *__pyx_n_s_EMPTY;
+static PyObject *__pyx_n_s_EventPoolStats;
+static PyObject *__pyx_n_u_EventPoolStats;
+static PyObject *__pyx_n_s_ExitReason;
 static PyObject *__pyx_n_s_INDEX;
 static PyObject *__pyx_n_s_INDEX_OBJECT;
 static PyObject *__pyx_n_s_OBJECT;
+static PyObject *__pyx_n_s_RuntimeError;
 static PyObject *__pyx_n_s_SpecType;
 static PyObject *__pyx_n_s_TypeError;
+static PyObject *__pyx_n_s_ValueError;
 static PyObject *__pyx_n_s_att;
 static PyObject *__pyx_n_s_cancel;
+static PyObject *__pyx_n_u_capacity;
 static PyObject *__pyx_n_s_cline_in_traceback;
 static PyObject *__pyx_n_s_code;
 static PyObject *__pyx_n_s_collections;
-static PyObject *__pyx_n_s_get_context;
+static PyObject *__pyx_n_s_continue_until;
+static PyObject *__pyx_kp_u_event_code_must_be_non_negative;
 static PyObject *__pyx_n_s_get_time;
 static PyObject *__pyx_n_s_getstate;
+static PyObject *__pyx_kp_u_given;
 static PyObject *__pyx_n_s_handler;
+static PyObject *__pyx_kp_u_horizon;
 static PyObject *__pyx_n_s_import;
 static PyObject *__pyx_n_s_index;
+static PyObject *__pyx_kp_u_is_in_the_past;
 static PyObject *__pyx_n_s_main;
+static PyObject *__pyx_n_s_max_events;
+static PyObject *__pyx_kp_u_max_events_must_be_positive;
 static PyObject *__pyx_n_s_model_des_pyscheduler;
 static PyObject *__pyx_n_s_name;
 static PyObject *__pyx_n_s_namedtuple;
 static PyObject *__pyx_kp_s_no_default___reduce___due_to_non;
+static PyObject *__pyx_n_u_num_acquired;
+static PyObject *__pyx_n_u_num_in_use;
+static PyObject *__pyx_n_u_num_released;
+static PyObject *__pyx_n_u_num_slabs;
 static PyObject *__pyx_n_s_params;
 static PyObject *__pyx_n_u_params;
 static PyObject *__pyx_n_s_pyx_vtable;
@@ -1342,6 +1629,7 @@ static PyObject *__pyx_n_s_reduce_cython;
 static PyObject *__pyx_n_s_reduce_ex;
 static PyObject *__pyx_n_s_run;
 static PyObject *__pyx_n_s_schedule;
+static PyObject *__pyx_kp_u_scheduler_was_not_started_call_r;
 static PyObject *__pyx_n_s_setstate;
 static PyObject *__pyx_n_s_setstate_cython;
 static PyObject *__pyx_n_u_sim;
@@ -1352,6 +1640,7 @@ static PyObject *__pyx_n_s_stop;
 static PyObject *__pyx_n_s_sys;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_time;
+static PyObject *__pyx_n_s_until;
 static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self); /* proto */
 static void __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_2__dealloc__(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_7context___get__(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self); /* proto */
@@ -1361,30 +1650,38 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_6bind_init(str
 static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_8bind(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_v_code, PyObject *__pyx_v_handler, PyObject *__pyx_v_spec_type); /* proto */
 static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_10setup_context(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, PyObject *__pyx_v_state, PyObject *__pyx_v_params); /* proto */
 static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_12get_time(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_14schedule(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, float __pyx_v_time, int __pyx_v_code, int __pyx_v_index, PyObject *__pyx_v_att); /* proto */
-static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_16cancel(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_v_event_id); /* proto */
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_14schedule(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, double __pyx_v_time, int __pyx_v_code, int __pyx_v_index, PyObject *__pyx_v_att); /* proto */
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_16cancel(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, model::des::EventHandle __pyx_v_handle); /* proto */
 static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_18stop(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_20run(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_22__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self); /* proto */
-static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_24__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_7started___get__(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_11exit_reason___get__(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_20get_event_pool_stats(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_22run(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, PyObject *__pyx_v_until, PyObject *__pyx_v_max_events); /* proto */
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_24continue_until(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, double __pyx_v_until, PyObject *__pyx_v_max_events); /* proto */
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_26__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_28__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_tp_new_5model_3des_11cyscheduler_CyScheduler(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_int_0;
 static PyObject *__pyx_k_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
 static PyObject *__pyx_tuple__4;
 static PyObject *__pyx_tuple__5;
+static PyObject *__pyx_tuple__6;
+static PyObject *__pyx_tuple__7;
+static PyObject *__pyx_tuple__8;
+static PyObject *__pyx_tuple__9;
 /* Late includes */
 
-/* "model/des/cyscheduler.pyx":10
- * 
+/* "model/des/cyscheduler.pyx":16
+ * # with a Python method call:
  * 
- * cdef void cy_callback_e(void *handler, PyObject *scheduler):             # <<<<<<<<<<<<<<
- *     ctx = (<object>scheduler).get_context()
- *     (<object>handler)(ctx)
+ * cdef void cy_callback_e(void *handler, PyObject *scheduler, int index,             # <<<<<<<<<<<<<<
+ *                         PyObject *att):
+ *     (<object>handler)((<CyScheduler>scheduler).c_context)
  */
 
-static void __pyx_f_5model_3des_11cyscheduler_cy_callback_e(void *__pyx_v_handler, PyObject *__pyx_v_scheduler) {
-  PyObject *__pyx_v_ctx = NULL;
+static void __pyx_f_5model_3des_11cyscheduler_cy_callback_e(void *__pyx_v_handler, PyObject *__pyx_v_scheduler, CYTHON_UNUSED int __pyx_v_index, CYTHON_UNUSED PyObject *__pyx_v_att) {
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
@@ -1394,37 +1691,10 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_e(void *__pyx_v_handle
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("cy_callback_e", 0);
 
-  /* "model/des/cyscheduler.pyx":11
- * 
- * cdef void cy_callback_e(void *handler, PyObject *scheduler):
- *     ctx = (<object>scheduler).get_context()             # <<<<<<<<<<<<<<
- *     (<object>handler)(ctx)
- * 
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_scheduler), __pyx_n_s_get_context); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 11, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
-  }
-  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 11, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_ctx = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "model/des/cyscheduler.pyx":12
- * cdef void cy_callback_e(void *handler, PyObject *scheduler):
- *     ctx = (<object>scheduler).get_context()
- *     (<object>handler)(ctx)             # <<<<<<<<<<<<<<
+  /* "model/des/cyscheduler.pyx":18
+ * cdef void cy_callback_e(void *handler, PyObject *scheduler, int index,
+ *                         PyObject *att):
+ *     (<object>handler)((<CyScheduler>scheduler).c_context)             # <<<<<<<<<<<<<<
  * 
  * 
  */
@@ -1439,19 +1709,19 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_e(void *__pyx_v_handle
       __Pyx_DECREF_SET(__pyx_t_2, function);
     }
   }
-  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_v_ctx) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_v_ctx);
+  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, ((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context) : __Pyx_PyObject_CallOneArg(__pyx_t_2, ((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 12, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 18, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "model/des/cyscheduler.pyx":10
- * 
+  /* "model/des/cyscheduler.pyx":16
+ * # with a Python method call:
  * 
- * cdef void cy_callback_e(void *handler, PyObject *scheduler):             # <<<<<<<<<<<<<<
- *     ctx = (<object>scheduler).get_context()
- *     (<object>handler)(ctx)
+ * cdef void cy_callback_e(void *handler, PyObject *scheduler, int index,             # <<<<<<<<<<<<<<
+ *                         PyObject *att):
+ *     (<object>handler)((<CyScheduler>scheduler).c_context)
  */
 
   /* function exit code */
@@ -1462,20 +1732,18 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_e(void *__pyx_v_handle
   __Pyx_XDECREF(__pyx_t_3);
   __Pyx_WriteUnraisable("model.des.cyscheduler.cy_callback_e", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_ctx);
   __Pyx_RefNannyFinishContext();
 }
 
-/* "model/des/cyscheduler.pyx":15
+/* "model/des/cyscheduler.pyx":21
  * 
  * 
- * cdef void cy_callback_i(void *handler, PyObject *scheduler, int index):             # <<<<<<<<<<<<<<
- *     ctx = (<object>scheduler).get_context()
- *     (<object>handler)(ctx, index)
+ * cdef void cy_callback_i(void *handler, PyObject *scheduler, int index,             # <<<<<<<<<<<<<<
+ *                         PyObject *att):
+ *     (<object>handler)((<CyScheduler>scheduler).c_context, index)
  */
 
-static void __pyx_f_5model_3des_11cyscheduler_cy_callback_i(void *__pyx_v_handler, PyObject *__pyx_v_scheduler, int __pyx_v_index) {
-  PyObject *__pyx_v_ctx = NULL;
+static void __pyx_f_5model_3des_11cyscheduler_cy_callback_i(void *__pyx_v_handler, PyObject *__pyx_v_scheduler, int __pyx_v_index, CYTHON_UNUSED PyObject *__pyx_v_att) {
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
@@ -1488,41 +1756,14 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_i(void *__pyx_v_handle
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("cy_callback_i", 0);
 
-  /* "model/des/cyscheduler.pyx":16
- * 
- * cdef void cy_callback_i(void *handler, PyObject *scheduler, int index):
- *     ctx = (<object>scheduler).get_context()             # <<<<<<<<<<<<<<
- *     (<object>handler)(ctx, index)
- * 
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_scheduler), __pyx_n_s_get_context); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 16, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
-  }
-  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 16, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_ctx = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "model/des/cyscheduler.pyx":17
- * cdef void cy_callback_i(void *handler, PyObject *scheduler, int index):
- *     ctx = (<object>scheduler).get_context()
- *     (<object>handler)(ctx, index)             # <<<<<<<<<<<<<<
+  /* "model/des/cyscheduler.pyx":23
+ * cdef void cy_callback_i(void *handler, PyObject *scheduler, int index,
+ *                         PyObject *att):
+ *     (<object>handler)((<CyScheduler>scheduler).c_context, index)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 17, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_v_handler));
   __pyx_t_3 = ((PyObject *)__pyx_v_handler); __pyx_t_4 = NULL;
@@ -1539,8 +1780,8 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_i(void *__pyx_v_handle
   }
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_ctx, __pyx_t_2};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+    PyObject *__pyx_temp[3] = {__pyx_t_4, ((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context, __pyx_t_2};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 23, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -1548,38 +1789,38 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_i(void *__pyx_v_handle
   #endif
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_ctx, __pyx_t_2};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+    PyObject *__pyx_temp[3] = {__pyx_t_4, ((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context, __pyx_t_2};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 23, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   } else
   #endif
   {
-    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 17, __pyx_L1_error)
+    __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 23, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
     }
-    __Pyx_INCREF(__pyx_v_ctx);
-    __Pyx_GIVEREF(__pyx_v_ctx);
-    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, __pyx_v_ctx);
+    __Pyx_INCREF(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context);
+    __Pyx_GIVEREF(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context);
+    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, ((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context);
     __Pyx_GIVEREF(__pyx_t_2);
     PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_t_2);
     __pyx_t_2 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 17, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 23, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "model/des/cyscheduler.pyx":15
+  /* "model/des/cyscheduler.pyx":21
  * 
  * 
- * cdef void cy_callback_i(void *handler, PyObject *scheduler, int index):             # <<<<<<<<<<<<<<
- *     ctx = (<object>scheduler).get_context()
- *     (<object>handler)(ctx, index)
+ * cdef void cy_callback_i(void *handler, PyObject *scheduler, int index,             # <<<<<<<<<<<<<<
+ *                         PyObject *att):
+ *     (<object>handler)((<CyScheduler>scheduler).c_context, index)
  */
 
   /* function exit code */
@@ -1592,20 +1833,18 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_i(void *__pyx_v_handle
   __Pyx_XDECREF(__pyx_t_6);
   __Pyx_WriteUnraisable("model.des.cyscheduler.cy_callback_i", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_ctx);
   __Pyx_RefNannyFinishContext();
 }
 
-/* "model/des/cyscheduler.pyx":20
+/* "model/des/cyscheduler.pyx":26
  * 
  * 
- * cdef void cy_callback_p(void *handler, PyObject *scheduler, PyObject *att):             # <<<<<<<<<<<<<<
- *     ctx = (<object>scheduler).get_context()
- *     (<object>handler)(ctx, <object>att)
+ * cdef void cy_callback_p(void *handler, PyObject *scheduler, int index,             # <<<<<<<<<<<<<<
+ *                         PyObject *att):
+ *     (<object>handler)((<CyScheduler>scheduler).c_context, <object>att)
  */
 
-static void __pyx_f_5model_3des_11cyscheduler_cy_callback_p(void *__pyx_v_handler, PyObject *__pyx_v_scheduler, PyObject *__pyx_v_att) {
-  PyObject *__pyx_v_ctx = NULL;
+static void __pyx_f_5model_3des_11cyscheduler_cy_callback_p(void *__pyx_v_handler, PyObject *__pyx_v_scheduler, CYTHON_UNUSED int __pyx_v_index, PyObject *__pyx_v_att) {
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
@@ -1617,37 +1856,10 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_p(void *__pyx_v_handle
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("cy_callback_p", 0);
 
-  /* "model/des/cyscheduler.pyx":21
- * 
- * cdef void cy_callback_p(void *handler, PyObject *scheduler, PyObject *att):
- *     ctx = (<object>scheduler).get_context()             # <<<<<<<<<<<<<<
- *     (<object>handler)(ctx, <object>att)
- * 
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_scheduler), __pyx_n_s_get_context); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 21, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
-  }
-  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 21, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_ctx = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "model/des/cyscheduler.pyx":22
- * cdef void cy_callback_p(void *handler, PyObject *scheduler, PyObject *att):
- *     ctx = (<object>scheduler).get_context()
- *     (<object>handler)(ctx, <object>att)             # <<<<<<<<<<<<<<
+  /* "model/des/cyscheduler.pyx":28
+ * cdef void cy_callback_p(void *handler, PyObject *scheduler, int index,
+ *                         PyObject *att):
+ *     (<object>handler)((<CyScheduler>scheduler).c_context, <object>att)             # <<<<<<<<<<<<<<
  * 
  * 
  */
@@ -1666,45 +1878,45 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_p(void *__pyx_v_handle
   }
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_ctx, ((PyObject *)__pyx_v_att)};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 22, __pyx_L1_error)
+    PyObject *__pyx_temp[3] = {__pyx_t_3, ((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context, ((PyObject *)__pyx_v_att)};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 28, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
   #endif
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
-    PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_v_ctx, ((PyObject *)__pyx_v_att)};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 22, __pyx_L1_error)
+    PyObject *__pyx_temp[3] = {__pyx_t_3, ((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context, ((PyObject *)__pyx_v_att)};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 2+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 28, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 22, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(2+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 28, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_3) {
       __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
     }
-    __Pyx_INCREF(__pyx_v_ctx);
-    __Pyx_GIVEREF(__pyx_v_ctx);
-    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_4, __pyx_v_ctx);
+    __Pyx_INCREF(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context);
+    __Pyx_GIVEREF(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context);
+    PyTuple_SET_ITEM(__pyx_t_5, 0+__pyx_t_4, ((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context);
     __Pyx_INCREF(((PyObject *)__pyx_v_att));
     __Pyx_GIVEREF(((PyObject *)__pyx_v_att));
     PyTuple_SET_ITEM(__pyx_t_5, 1+__pyx_t_4, ((PyObject *)__pyx_v_att));
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 22, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 28, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "model/des/cyscheduler.pyx":20
+  /* "model/des/cyscheduler.pyx":26
  * 
  * 
- * cdef void cy_callback_p(void *handler, PyObject *scheduler, PyObject *att):             # <<<<<<<<<<<<<<
- *     ctx = (<object>scheduler).get_context()
- *     (<object>handler)(ctx, <object>att)
+ * cdef void cy_callback_p(void *handler, PyObject *scheduler, int index,             # <<<<<<<<<<<<<<
+ *                         PyObject *att):
+ *     (<object>handler)((<CyScheduler>scheduler).c_context, <object>att)
  */
 
   /* function exit code */
@@ -1716,20 +1928,18 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_p(void *__pyx_v_handle
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_WriteUnraisable("model.des.cyscheduler.cy_callback_p", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_ctx);
   __Pyx_RefNannyFinishContext();
 }
 
-/* "model/des/cyscheduler.pyx":25
+/* "model/des/cyscheduler.pyx":31
  * 
  * 
  * cdef void cy_callback_ip(void *handler, PyObject *scheduler, int index,             # <<<<<<<<<<<<<<
  *                          PyObject *att):
- *     ctx = (<object>scheduler).get_context()
+ *     (<object>handler)((<CyScheduler>scheduler).c_context, index, <object>att)
  */
 
 static void __pyx_f_5model_3des_11cyscheduler_cy_callback_ip(void *__pyx_v_handler, PyObject *__pyx_v_scheduler, int __pyx_v_index, PyObject *__pyx_v_att) {
-  PyObject *__pyx_v_ctx = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
@@ -1742,41 +1952,14 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_ip(void *__pyx_v_handl
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("cy_callback_ip", 0);
 
-  /* "model/des/cyscheduler.pyx":27
+  /* "model/des/cyscheduler.pyx":33
  * cdef void cy_callback_ip(void *handler, PyObject *scheduler, int index,
  *                          PyObject *att):
- *     ctx = (<object>scheduler).get_context()             # <<<<<<<<<<<<<<
- *     (<object>handler)(ctx, index, <object>att)
- * 
- */
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_scheduler), __pyx_n_s_get_context); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 27, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = NULL;
-  if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
-    __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_2);
-    if (likely(__pyx_t_3)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
-      __Pyx_INCREF(__pyx_t_3);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_2, function);
-    }
-  }
-  __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallNoArg(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 27, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_ctx = __pyx_t_1;
-  __pyx_t_1 = 0;
-
-  /* "model/des/cyscheduler.pyx":28
- *                          PyObject *att):
- *     ctx = (<object>scheduler).get_context()
- *     (<object>handler)(ctx, index, <object>att)             # <<<<<<<<<<<<<<
+ *     (<object>handler)((<CyScheduler>scheduler).c_context, index, <object>att)             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 28, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_int(__pyx_v_index); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 33, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_v_handler));
   __pyx_t_3 = ((PyObject *)__pyx_v_handler); __pyx_t_4 = NULL;
@@ -1793,8 +1976,8 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_ip(void *__pyx_v_handl
   }
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_v_ctx, __pyx_t_2, ((PyObject *)__pyx_v_att)};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 28, __pyx_L1_error)
+    PyObject *__pyx_temp[4] = {__pyx_t_4, ((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context, __pyx_t_2, ((PyObject *)__pyx_v_att)};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 33, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -1802,41 +1985,41 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_ip(void *__pyx_v_handl
   #endif
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
-    PyObject *__pyx_temp[4] = {__pyx_t_4, __pyx_v_ctx, __pyx_t_2, ((PyObject *)__pyx_v_att)};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 28, __pyx_L1_error)
+    PyObject *__pyx_temp[4] = {__pyx_t_4, ((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context, __pyx_t_2, ((PyObject *)__pyx_v_att)};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 3+__pyx_t_5); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 33, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   } else
   #endif
   {
-    __pyx_t_6 = PyTuple_New(3+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(1, 28, __pyx_L1_error)
+    __pyx_t_6 = PyTuple_New(3+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 33, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     if (__pyx_t_4) {
       __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
     }
-    __Pyx_INCREF(__pyx_v_ctx);
-    __Pyx_GIVEREF(__pyx_v_ctx);
-    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, __pyx_v_ctx);
+    __Pyx_INCREF(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context);
+    __Pyx_GIVEREF(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context);
+    PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, ((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_scheduler)->c_context);
     __Pyx_GIVEREF(__pyx_t_2);
     PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_t_2);
     __Pyx_INCREF(((PyObject *)__pyx_v_att));
     __Pyx_GIVEREF(((PyObject *)__pyx_v_att));
     PyTuple_SET_ITEM(__pyx_t_6, 2+__pyx_t_5, ((PyObject *)__pyx_v_att));
     __pyx_t_2 = 0;
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 28, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 33, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   }
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "model/des/cyscheduler.pyx":25
+  /* "model/des/cyscheduler.pyx":31
  * 
  * 
  * cdef void cy_callback_ip(void *handler, PyObject *scheduler, int index,             # <<<<<<<<<<<<<<
  *                          PyObject *att):
- *     ctx = (<object>scheduler).get_context()
+ *     (<object>handler)((<CyScheduler>scheduler).c_context, index, <object>att)
  */
 
   /* function exit code */
@@ -1849,11 +2032,10 @@ static void __pyx_f_5model_3des_11cyscheduler_cy_callback_ip(void *__pyx_v_handl
   __Pyx_XDECREF(__pyx_t_6);
   __Pyx_WriteUnraisable("model.des.cyscheduler.cy_callback_ip", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v_ctx);
   __Pyx_RefNannyFinishContext();
 }
 
-/* "model/des/cyscheduler.pyx":38
+/* "model/des/cyscheduler.pyx":49
  *     cdef object c_context
  * 
  *     def __cinit__(self):             # <<<<<<<<<<<<<<
@@ -1890,7 +2072,7 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__cinit__", 0);
 
-  /* "model/des/cyscheduler.pyx":39
+  /* "model/des/cyscheduler.pyx":50
  * 
  *     def __cinit__(self):
  *         self.c_scheduler = new Scheduler()             # <<<<<<<<<<<<<<
@@ -1899,7 +2081,7 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
  */
   __pyx_v_self->c_scheduler = new model::des::Scheduler();
 
-  /* "model/des/cyscheduler.pyx":40
+  /* "model/des/cyscheduler.pyx":51
  *     def __cinit__(self):
  *         self.c_scheduler = new Scheduler()
  *         self.c_scheduler.set_cy_callback_e(cy_callback_e)             # <<<<<<<<<<<<<<
@@ -1908,7 +2090,7 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
  */
   __pyx_v_self->c_scheduler->set_cy_callback_e(__pyx_f_5model_3des_11cyscheduler_cy_callback_e);
 
-  /* "model/des/cyscheduler.pyx":41
+  /* "model/des/cyscheduler.pyx":52
  *         self.c_scheduler = new Scheduler()
  *         self.c_scheduler.set_cy_callback_e(cy_callback_e)
  *         self.c_scheduler.set_cy_callback_i(cy_callback_i)             # <<<<<<<<<<<<<<
@@ -1917,7 +2099,7 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
  */
   __pyx_v_self->c_scheduler->set_cy_callback_i(__pyx_f_5model_3des_11cyscheduler_cy_callback_i);
 
-  /* "model/des/cyscheduler.pyx":42
+  /* "model/des/cyscheduler.pyx":53
  *         self.c_scheduler.set_cy_callback_e(cy_callback_e)
  *         self.c_scheduler.set_cy_callback_i(cy_callback_i)
  *         self.c_scheduler.set_cy_callback_p(cy_callback_p)             # <<<<<<<<<<<<<<
@@ -1926,7 +2108,7 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
  */
   __pyx_v_self->c_scheduler->set_cy_callback_p(__pyx_f_5model_3des_11cyscheduler_cy_callback_p);
 
-  /* "model/des/cyscheduler.pyx":43
+  /* "model/des/cyscheduler.pyx":54
  *         self.c_scheduler.set_cy_callback_i(cy_callback_i)
  *         self.c_scheduler.set_cy_callback_p(cy_callback_p)
  *         self.c_scheduler.set_cy_callback_ip(cy_callback_ip)             # <<<<<<<<<<<<<<
@@ -1935,7 +2117,7 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
  */
   __pyx_v_self->c_scheduler->set_cy_callback_ip(__pyx_f_5model_3des_11cyscheduler_cy_callback_ip);
 
-  /* "model/des/cyscheduler.pyx":44
+  /* "model/des/cyscheduler.pyx":55
  *         self.c_scheduler.set_cy_callback_p(cy_callback_p)
  *         self.c_scheduler.set_cy_callback_ip(cy_callback_ip)
  *         self.c_scheduler.set_context_owner(<PyObject*>self)             # <<<<<<<<<<<<<<
@@ -1944,14 +2126,14 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
  */
   __pyx_v_self->c_scheduler->set_context_owner(((PyObject *)__pyx_v_self));
 
-  /* "model/des/cyscheduler.pyx":45
+  /* "model/des/cyscheduler.pyx":56
  *         self.c_scheduler.set_cy_callback_ip(cy_callback_ip)
  *         self.c_scheduler.set_context_owner(<PyObject*>self)
  *         self.c_context = Context(self, None, None)             # <<<<<<<<<<<<<<
  * 
  *     def __dealloc__(self):
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Context); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 45, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Context); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 56, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   __pyx_t_4 = 0;
@@ -1968,7 +2150,7 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_3, ((PyObject *)__pyx_v_self), Py_None, Py_None};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 45, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 56, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
@@ -1976,13 +2158,13 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_3, ((PyObject *)__pyx_v_self), Py_None, Py_None};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 45, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 56, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(3+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 45, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(3+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 56, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_3) {
       __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -1996,7 +2178,7 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
     __Pyx_INCREF(Py_None);
     __Pyx_GIVEREF(Py_None);
     PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_4, Py_None);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 45, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 56, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
@@ -2007,7 +2189,7 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
   __pyx_v_self->c_context = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "model/des/cyscheduler.pyx":38
+  /* "model/des/cyscheduler.pyx":49
  *     cdef object c_context
  * 
  *     def __cinit__(self):             # <<<<<<<<<<<<<<
@@ -2030,7 +2212,7 @@ static int __pyx_pf_5model_3des_11cyscheduler_11CyScheduler___cinit__(struct __p
   return __pyx_r;
 }
 
-/* "model/des/cyscheduler.pyx":47
+/* "model/des/cyscheduler.pyx":58
  *         self.c_context = Context(self, None, None)
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -2053,7 +2235,7 @@ static void __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_2__dealloc__(struct
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "model/des/cyscheduler.pyx":48
+  /* "model/des/cyscheduler.pyx":59
  * 
  *     def __dealloc__(self):
  *         del self.c_scheduler             # <<<<<<<<<<<<<<
@@ -2062,7 +2244,7 @@ static void __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_2__dealloc__(struct
  */
   delete __pyx_v_self->c_scheduler;
 
-  /* "model/des/cyscheduler.pyx":47
+  /* "model/des/cyscheduler.pyx":58
  *         self.c_context = Context(self, None, None)
  * 
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
@@ -2074,7 +2256,7 @@ static void __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_2__dealloc__(struct
   __Pyx_RefNannyFinishContext();
 }
 
-/* "model/des/cyscheduler.pyx":51
+/* "model/des/cyscheduler.pyx":62
  * 
  *     @property
  *     def context(self):             # <<<<<<<<<<<<<<
@@ -2100,7 +2282,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_7context___get
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "model/des/cyscheduler.pyx":52
+  /* "model/des/cyscheduler.pyx":63
  *     @property
  *     def context(self):
  *         return self.c_context             # <<<<<<<<<<<<<<
@@ -2112,7 +2294,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_7context___get
   __pyx_r = __pyx_v_self->c_context;
   goto __pyx_L0;
 
-  /* "model/des/cyscheduler.pyx":51
+  /* "model/des/cyscheduler.pyx":62
  * 
  *     @property
  *     def context(self):             # <<<<<<<<<<<<<<
@@ -2127,7 +2309,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_7context___get
   return __pyx_r;
 }
 
-/* "model/des/cyscheduler.pyx":54
+/* "model/des/cyscheduler.pyx":65
  *         return self.c_context
  * 
  *     def get_context(self):             # <<<<<<<<<<<<<<
@@ -2154,7 +2336,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_4get_context(s
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("get_context", 0);
 
-  /* "model/des/cyscheduler.pyx":55
+  /* "model/des/cyscheduler.pyx":66
  * 
  *     def get_context(self):
  *         return self.c_context             # <<<<<<<<<<<<<<
@@ -2166,7 +2348,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_4get_context(s
   __pyx_r = __pyx_v_self->c_context;
   goto __pyx_L0;
 
-  /* "model/des/cyscheduler.pyx":54
+  /* "model/des/cyscheduler.pyx":65
  *         return self.c_context
  * 
  *     def get_context(self):             # <<<<<<<<<<<<<<
@@ -2181,7 +2363,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_4get_context(s
   return __pyx_r;
 }
 
-/* "model/des/cyscheduler.pyx":58
+/* "model/des/cyscheduler.pyx":69
  * 
  *     @property
  *     def time(self):             # <<<<<<<<<<<<<<
@@ -2211,7 +2393,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_4time___get__(
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "model/des/cyscheduler.pyx":59
+  /* "model/des/cyscheduler.pyx":70
  *     @property
  *     def time(self):
  *         return self.get_time()             # <<<<<<<<<<<<<<
@@ -2219,13 +2401,13 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_4time___get__(
  *     def bind_init(self, object handler):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(((struct __pyx_vtabstruct_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self->__pyx_vtab)->get_time(__pyx_v_self, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 59, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(((struct __pyx_vtabstruct_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self->__pyx_vtab)->get_time(__pyx_v_self, 0)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "model/des/cyscheduler.pyx":58
+  /* "model/des/cyscheduler.pyx":69
  * 
  *     @property
  *     def time(self):             # <<<<<<<<<<<<<<
@@ -2244,7 +2426,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_4time___get__(
   return __pyx_r;
 }
 
-/* "model/des/cyscheduler.pyx":61
+/* "model/des/cyscheduler.pyx":72
  *         return self.get_time()
  * 
  *     def bind_init(self, object handler):             # <<<<<<<<<<<<<<
@@ -2271,7 +2453,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_6bind_init(str
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("bind_init", 0);
 
-  /* "model/des/cyscheduler.pyx":62
+  /* "model/des/cyscheduler.pyx":73
  * 
  *     def bind_init(self, object handler):
  *         self.c_scheduler.attach_init_handler(<void*>handler)             # <<<<<<<<<<<<<<
@@ -2280,7 +2462,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_6bind_init(str
  */
   __pyx_v_self->c_scheduler->attach_init_handler(((void *)__pyx_v_handler));
 
-  /* "model/des/cyscheduler.pyx":61
+  /* "model/des/cyscheduler.pyx":72
  *         return self.get_time()
  * 
  *     def bind_init(self, object handler):             # <<<<<<<<<<<<<<
@@ -2295,12 +2477,12 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_6bind_init(str
   return __pyx_r;
 }
 
-/* "model/des/cyscheduler.pyx":64
+/* "model/des/cyscheduler.pyx":75
  *         self.c_scheduler.attach_init_handler(<void*>handler)
  * 
  *     def bind(self, int code, object handler, spec_type=SpecType.EMPTY):             # <<<<<<<<<<<<<<
- *         cdef void* handler_ptr = <void*>handler
- *         if spec_type is SpecType.EMPTY:
+ *         if code < 0:
+ *             raise ValueError(f'event code must be non-negative, {code} given')
  */
 
 /* Python wrapper */
@@ -2342,7 +2524,7 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_9bind(PyObject
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_handler)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("bind", 0, 2, 3, 1); __PYX_ERR(1, 64, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("bind", 0, 2, 3, 1); __PYX_ERR(0, 75, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -2352,7 +2534,7 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_9bind(PyObject
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "bind") < 0)) __PYX_ERR(1, 64, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "bind") < 0)) __PYX_ERR(0, 75, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -2364,13 +2546,13 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_9bind(PyObject
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_code = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_code == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 64, __pyx_L3_error)
+    __pyx_v_code = __Pyx_PyInt_As_int(values[0]); if (unlikely((__pyx_v_code == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 75, __pyx_L3_error)
     __pyx_v_handler = values[1];
     __pyx_v_spec_type = values[2];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("bind", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 64, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("bind", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 75, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.bind", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -2387,42 +2569,98 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_8bind(struct _
   void *__pyx_v_handler_ptr;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  int __pyx_t_4;
+  Py_ssize_t __pyx_t_3;
+  Py_UCS4 __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("bind", 0);
 
-  /* "model/des/cyscheduler.pyx":65
+  /* "model/des/cyscheduler.pyx":76
+ * 
+ *     def bind(self, int code, object handler, spec_type=SpecType.EMPTY):
+ *         if code < 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError(f'event code must be non-negative, {code} given')
+ *         cdef void* handler_ptr = <void*>handler
+ */
+  __pyx_t_1 = ((__pyx_v_code < 0) != 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "model/des/cyscheduler.pyx":77
+ *     def bind(self, int code, object handler, spec_type=SpecType.EMPTY):
+ *         if code < 0:
+ *             raise ValueError(f'event code must be non-negative, {code} given')             # <<<<<<<<<<<<<<
+ *         cdef void* handler_ptr = <void*>handler
+ *         if spec_type is SpecType.EMPTY:
+ */
+    __pyx_t_2 = PyTuple_New(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 127;
+    __Pyx_INCREF(__pyx_kp_u_event_code_must_be_non_negative);
+    __pyx_t_3 += 33;
+    __Pyx_GIVEREF(__pyx_kp_u_event_code_must_be_non_negative);
+    PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_kp_u_event_code_must_be_non_negative);
+    __pyx_t_5 = __Pyx_PyUnicode_From_int(__pyx_v_code, 0, ' ', 'd'); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_3 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_5);
+    __pyx_t_5 = 0;
+    __Pyx_INCREF(__pyx_kp_u_given);
+    __pyx_t_3 += 6;
+    __Pyx_GIVEREF(__pyx_kp_u_given);
+    PyTuple_SET_ITEM(__pyx_t_2, 2, __pyx_kp_u_given);
+    __pyx_t_5 = __Pyx_PyUnicode_Join(__pyx_t_2, 3, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 77, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 77, __pyx_L1_error)
+
+    /* "model/des/cyscheduler.pyx":76
  * 
  *     def bind(self, int code, object handler, spec_type=SpecType.EMPTY):
+ *         if code < 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError(f'event code must be non-negative, {code} given')
+ *         cdef void* handler_ptr = <void*>handler
+ */
+  }
+
+  /* "model/des/cyscheduler.pyx":78
+ *         if code < 0:
+ *             raise ValueError(f'event code must be non-negative, {code} given')
  *         cdef void* handler_ptr = <void*>handler             # <<<<<<<<<<<<<<
  *         if spec_type is SpecType.EMPTY:
  *             self.c_scheduler.attach_handler_e(code, handler_ptr)
  */
   __pyx_v_handler_ptr = ((void *)__pyx_v_handler);
 
-  /* "model/des/cyscheduler.pyx":66
- *     def bind(self, int code, object handler, spec_type=SpecType.EMPTY):
+  /* "model/des/cyscheduler.pyx":79
+ *             raise ValueError(f'event code must be non-negative, {code} given')
  *         cdef void* handler_ptr = <void*>handler
  *         if spec_type is SpecType.EMPTY:             # <<<<<<<<<<<<<<
  *             self.c_scheduler.attach_handler_e(code, handler_ptr)
  *         elif spec_type is SpecType.INDEX:
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 66, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_EMPTY); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 66, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = (__pyx_v_spec_type == __pyx_t_2);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_EMPTY); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 79, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_4 = (__pyx_t_3 != 0);
-  if (__pyx_t_4) {
+  __pyx_t_1 = (__pyx_v_spec_type == __pyx_t_5);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_6 = (__pyx_t_1 != 0);
+  if (__pyx_t_6) {
 
-    /* "model/des/cyscheduler.pyx":67
+    /* "model/des/cyscheduler.pyx":80
  *         cdef void* handler_ptr = <void*>handler
  *         if spec_type is SpecType.EMPTY:
  *             self.c_scheduler.attach_handler_e(code, handler_ptr)             # <<<<<<<<<<<<<<
@@ -2431,34 +2669,34 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_8bind(struct _
  */
     __pyx_v_self->c_scheduler->attach_handler_e(__pyx_v_code, __pyx_v_handler_ptr);
 
-    /* "model/des/cyscheduler.pyx":66
- *     def bind(self, int code, object handler, spec_type=SpecType.EMPTY):
+    /* "model/des/cyscheduler.pyx":79
+ *             raise ValueError(f'event code must be non-negative, {code} given')
  *         cdef void* handler_ptr = <void*>handler
  *         if spec_type is SpecType.EMPTY:             # <<<<<<<<<<<<<<
  *             self.c_scheduler.attach_handler_e(code, handler_ptr)
  *         elif spec_type is SpecType.INDEX:
  */
-    goto __pyx_L3;
+    goto __pyx_L4;
   }
 
-  /* "model/des/cyscheduler.pyx":68
+  /* "model/des/cyscheduler.pyx":81
  *         if spec_type is SpecType.EMPTY:
  *             self.c_scheduler.attach_handler_e(code, handler_ptr)
  *         elif spec_type is SpecType.INDEX:             # <<<<<<<<<<<<<<
  *             self.c_scheduler.attach_handler_i(code, handler_ptr)
  *         elif spec_type is SpecType.OBJECT:
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 68, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 81, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_INDEX); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 81, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_INDEX); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 68, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_6 = (__pyx_v_spec_type == __pyx_t_2);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_4 = (__pyx_v_spec_type == __pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = (__pyx_t_4 != 0);
-  if (__pyx_t_3) {
+  __pyx_t_1 = (__pyx_t_6 != 0);
+  if (__pyx_t_1) {
 
-    /* "model/des/cyscheduler.pyx":69
+    /* "model/des/cyscheduler.pyx":82
  *             self.c_scheduler.attach_handler_e(code, handler_ptr)
  *         elif spec_type is SpecType.INDEX:
  *             self.c_scheduler.attach_handler_i(code, handler_ptr)             # <<<<<<<<<<<<<<
@@ -2467,34 +2705,34 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_8bind(struct _
  */
     __pyx_v_self->c_scheduler->attach_handler_i(__pyx_v_code, __pyx_v_handler_ptr);
 
-    /* "model/des/cyscheduler.pyx":68
+    /* "model/des/cyscheduler.pyx":81
  *         if spec_type is SpecType.EMPTY:
  *             self.c_scheduler.attach_handler_e(code, handler_ptr)
  *         elif spec_type is SpecType.INDEX:             # <<<<<<<<<<<<<<
  *             self.c_scheduler.attach_handler_i(code, handler_ptr)
  *         elif spec_type is SpecType.OBJECT:
  */
-    goto __pyx_L3;
+    goto __pyx_L4;
   }
 
-  /* "model/des/cyscheduler.pyx":70
+  /* "model/des/cyscheduler.pyx":83
  *         elif spec_type is SpecType.INDEX:
  *             self.c_scheduler.attach_handler_i(code, handler_ptr)
  *         elif spec_type is SpecType.OBJECT:             # <<<<<<<<<<<<<<
  *             self.c_scheduler.attach_handler_p(code, handler_ptr)
  *         elif spec_type is SpecType.INDEX_OBJECT:
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 70, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_OBJECT); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 70, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 83, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = (__pyx_v_spec_type == __pyx_t_2);
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_OBJECT); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 83, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_4 = (__pyx_t_3 != 0);
-  if (__pyx_t_4) {
+  __pyx_t_1 = (__pyx_v_spec_type == __pyx_t_5);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_6 = (__pyx_t_1 != 0);
+  if (__pyx_t_6) {
 
-    /* "model/des/cyscheduler.pyx":71
+    /* "model/des/cyscheduler.pyx":84
  *             self.c_scheduler.attach_handler_i(code, handler_ptr)
  *         elif spec_type is SpecType.OBJECT:
  *             self.c_scheduler.attach_handler_p(code, handler_ptr)             # <<<<<<<<<<<<<<
@@ -2503,34 +2741,34 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_8bind(struct _
  */
     __pyx_v_self->c_scheduler->attach_handler_p(__pyx_v_code, __pyx_v_handler_ptr);
 
-    /* "model/des/cyscheduler.pyx":70
+    /* "model/des/cyscheduler.pyx":83
  *         elif spec_type is SpecType.INDEX:
  *             self.c_scheduler.attach_handler_i(code, handler_ptr)
  *         elif spec_type is SpecType.OBJECT:             # <<<<<<<<<<<<<<
  *             self.c_scheduler.attach_handler_p(code, handler_ptr)
  *         elif spec_type is SpecType.INDEX_OBJECT:
  */
-    goto __pyx_L3;
+    goto __pyx_L4;
   }
 
-  /* "model/des/cyscheduler.pyx":72
+  /* "model/des/cyscheduler.pyx":85
  *         elif spec_type is SpecType.OBJECT:
  *             self.c_scheduler.attach_handler_p(code, handler_ptr)
  *         elif spec_type is SpecType.INDEX_OBJECT:             # <<<<<<<<<<<<<<
  *             self.c_scheduler.attach_handler_ip(code, handler_ptr)
  * 
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 72, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 85, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_INDEX_OBJECT); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 85, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_INDEX_OBJECT); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 72, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+  __pyx_t_6 = (__pyx_v_spec_type == __pyx_t_2);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_4 = (__pyx_v_spec_type == __pyx_t_1);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_3 = (__pyx_t_4 != 0);
-  if (__pyx_t_3) {
+  __pyx_t_1 = (__pyx_t_6 != 0);
+  if (__pyx_t_1) {
 
-    /* "model/des/cyscheduler.pyx":73
+    /* "model/des/cyscheduler.pyx":86
  *             self.c_scheduler.attach_handler_p(code, handler_ptr)
  *         elif spec_type is SpecType.INDEX_OBJECT:
  *             self.c_scheduler.attach_handler_ip(code, handler_ptr)             # <<<<<<<<<<<<<<
@@ -2539,7 +2777,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_8bind(struct _
  */
     __pyx_v_self->c_scheduler->attach_handler_ip(__pyx_v_code, __pyx_v_handler_ptr);
 
-    /* "model/des/cyscheduler.pyx":72
+    /* "model/des/cyscheduler.pyx":85
  *         elif spec_type is SpecType.OBJECT:
  *             self.c_scheduler.attach_handler_p(code, handler_ptr)
  *         elif spec_type is SpecType.INDEX_OBJECT:             # <<<<<<<<<<<<<<
@@ -2547,22 +2785,22 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_8bind(struct _
  * 
  */
   }
-  __pyx_L3:;
+  __pyx_L4:;
 
-  /* "model/des/cyscheduler.pyx":64
+  /* "model/des/cyscheduler.pyx":75
  *         self.c_scheduler.attach_init_handler(<void*>handler)
  * 
  *     def bind(self, int code, object handler, spec_type=SpecType.EMPTY):             # <<<<<<<<<<<<<<
- *         cdef void* handler_ptr = <void*>handler
- *         if spec_type is SpecType.EMPTY:
+ *         if code < 0:
+ *             raise ValueError(f'event code must be non-negative, {code} given')
  */
 
   /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
   __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.bind", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
@@ -2571,7 +2809,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_8bind(struct _
   return __pyx_r;
 }
 
-/* "model/des/cyscheduler.pyx":75
+/* "model/des/cyscheduler.pyx":88
  *             self.c_scheduler.attach_handler_ip(code, handler_ptr)
  * 
  *     def setup_context(self, state, params):             # <<<<<<<<<<<<<<
@@ -2614,11 +2852,11 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_11setup_contex
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_params)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("setup_context", 1, 2, 2, 1); __PYX_ERR(1, 75, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("setup_context", 1, 2, 2, 1); __PYX_ERR(0, 88, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "setup_context") < 0)) __PYX_ERR(1, 75, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "setup_context") < 0)) __PYX_ERR(0, 88, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -2631,7 +2869,7 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_11setup_contex
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("setup_context", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 75, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("setup_context", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 88, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.setup_context", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -2657,14 +2895,14 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_10setup_contex
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("setup_context", 0);
 
-  /* "model/des/cyscheduler.pyx":77
+  /* "model/des/cyscheduler.pyx":90
  *     def setup_context(self, state, params):
  *         # noinspection PyAttributeOutsideInit
  *         self.c_context = Context(self, state, params)             # <<<<<<<<<<<<<<
  * 
- *     cpdef float get_time(self):
+ *     cpdef double get_time(self):
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Context); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 77, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_Context); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 90, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_3 = NULL;
   __pyx_t_4 = 0;
@@ -2681,7 +2919,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_10setup_contex
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_3, ((PyObject *)__pyx_v_self), __pyx_v_state, __pyx_v_params};
-    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 77, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
@@ -2689,13 +2927,13 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_10setup_contex
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
     PyObject *__pyx_temp[4] = {__pyx_t_3, ((PyObject *)__pyx_v_self), __pyx_v_state, __pyx_v_params};
-    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 77, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_4, 3+__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_1);
   } else
   #endif
   {
-    __pyx_t_5 = PyTuple_New(3+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 77, __pyx_L1_error)
+    __pyx_t_5 = PyTuple_New(3+__pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 90, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
     if (__pyx_t_3) {
       __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -2709,7 +2947,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_10setup_contex
     __Pyx_INCREF(__pyx_v_params);
     __Pyx_GIVEREF(__pyx_v_params);
     PyTuple_SET_ITEM(__pyx_t_5, 2+__pyx_t_4, __pyx_v_params);
-    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 77, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_5, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 90, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
     __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   }
@@ -2720,7 +2958,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_10setup_contex
   __pyx_v_self->c_context = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "model/des/cyscheduler.pyx":75
+  /* "model/des/cyscheduler.pyx":88
  *             self.c_scheduler.attach_handler_ip(code, handler_ptr)
  * 
  *     def setup_context(self, state, params):             # <<<<<<<<<<<<<<
@@ -2744,23 +2982,23 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_10setup_contex
   return __pyx_r;
 }
 
-/* "model/des/cyscheduler.pyx":79
+/* "model/des/cyscheduler.pyx":92
  *         self.c_context = Context(self, state, params)
  * 
- *     cpdef float get_time(self):             # <<<<<<<<<<<<<<
+ *     cpdef double get_time(self):             # <<<<<<<<<<<<<<
  *         return self.c_scheduler.get_time()
  * 
  */
 
 static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_13get_time(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static float __pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_skip_dispatch) {
-  float __pyx_r;
+static double __pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_skip_dispatch) {
+  double __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   PyObject *__pyx_t_4 = NULL;
-  float __pyx_t_5;
+  double __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2774,7 +3012,7 @@ static float __pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time(struct __p
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_time); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 79, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_get_time); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_13get_time)) {
         __Pyx_INCREF(__pyx_t_1);
@@ -2790,10 +3028,10 @@ static float __pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time(struct __p
         }
         __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 79, __pyx_L1_error)
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 92, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __pyx_t_5 = __pyx_PyFloat_AsFloat(__pyx_t_2); if (unlikely((__pyx_t_5 == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 79, __pyx_L1_error)
+        __pyx_t_5 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely((__pyx_t_5 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 92, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
         __pyx_r = __pyx_t_5;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -2812,20 +3050,20 @@ static float __pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time(struct __p
     #endif
   }
 
-  /* "model/des/cyscheduler.pyx":80
+  /* "model/des/cyscheduler.pyx":93
  * 
- *     cpdef float get_time(self):
+ *     cpdef double get_time(self):
  *         return self.c_scheduler.get_time()             # <<<<<<<<<<<<<<
  * 
- *     cpdef int schedule(self, float time, int code, int index = -1,
+ *     cpdef EventHandle schedule(self, double time, int code, int index = -1,
  */
   __pyx_r = __pyx_v_self->c_scheduler->get_time();
   goto __pyx_L0;
 
-  /* "model/des/cyscheduler.pyx":79
+  /* "model/des/cyscheduler.pyx":92
  *         self.c_context = Context(self, state, params)
  * 
- *     cpdef float get_time(self):             # <<<<<<<<<<<<<<
+ *     cpdef double get_time(self):             # <<<<<<<<<<<<<<
  *         return self.c_scheduler.get_time()
  * 
  */
@@ -2845,7 +3083,7 @@ static float __pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time(struct __p
 
 /* Python wrapper */
 static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_13get_time(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_12get_time[] = "CyScheduler.get_time(self) -> float";
+static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_12get_time[] = "CyScheduler.get_time(self) -> double";
 static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_13get_time(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
@@ -2866,7 +3104,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_12get_time(str
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("get_time", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 79, __pyx_L1_error)
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -2883,28 +3121,28 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_12get_time(str
   return __pyx_r;
 }
 
-/* "model/des/cyscheduler.pyx":82
+/* "model/des/cyscheduler.pyx":95
  *         return self.c_scheduler.get_time()
  * 
- *     cpdef int schedule(self, float time, int code, int index = -1,             # <<<<<<<<<<<<<<
- *                        object att = None):
- *         cdef PyObject *c_att = NULL
+ *     cpdef EventHandle schedule(self, double time, int code, int index = -1,             # <<<<<<<<<<<<<<
+ *                                object att = None):
+ *         """Schedule an event and return its handle (a positive integer)."""
  */
 
 static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, float __pyx_v_time, int __pyx_v_code, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule *__pyx_optional_args) {
+static model::des::EventHandle __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, double __pyx_v_time, int __pyx_v_code, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule *__pyx_optional_args) {
   int __pyx_v_index = ((int)-1);
 
-  /* "model/des/cyscheduler.pyx":83
+  /* "model/des/cyscheduler.pyx":96
  * 
- *     cpdef int schedule(self, float time, int code, int index = -1,
- *                        object att = None):             # <<<<<<<<<<<<<<
+ *     cpdef EventHandle schedule(self, double time, int code, int index = -1,
+ *                                object att = None):             # <<<<<<<<<<<<<<
+ *         """Schedule an event and return its handle (a positive integer)."""
  *         cdef PyObject *c_att = NULL
- * 
  */
   PyObject *__pyx_v_att = ((PyObject *)Py_None);
   PyObject *__pyx_v_c_att;
-  int __pyx_r;
+  model::des::EventHandle __pyx_r;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
@@ -2915,8 +3153,9 @@ static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx
   PyObject *__pyx_t_7 = NULL;
   int __pyx_t_8;
   PyObject *__pyx_t_9 = NULL;
-  int __pyx_t_10;
+  model::des::EventHandle __pyx_t_10;
   int __pyx_t_11;
+  int __pyx_t_12;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2930,12 +3169,12 @@ static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx
     }
   }
 
-  /* "model/des/cyscheduler.pyx":82
+  /* "model/des/cyscheduler.pyx":95
  *         return self.c_scheduler.get_time()
  * 
- *     cpdef int schedule(self, float time, int code, int index = -1,             # <<<<<<<<<<<<<<
- *                        object att = None):
- *         cdef PyObject *c_att = NULL
+ *     cpdef EventHandle schedule(self, double time, int code, int index = -1,             # <<<<<<<<<<<<<<
+ *                                object att = None):
+ *         """Schedule an event and return its handle (a positive integer)."""
  */
   /* Check if called by wrapper */
   if (unlikely(__pyx_skip_dispatch)) ;
@@ -2946,14 +3185,14 @@ static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_schedule); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 82, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_schedule); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule)) {
-        __pyx_t_3 = PyFloat_FromDouble(__pyx_v_time); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 82, __pyx_L1_error)
+        __pyx_t_3 = PyFloat_FromDouble(__pyx_v_time); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 95, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_code); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 82, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_code); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 95, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
-        __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_index); if (unlikely(!__pyx_t_5)) __PYX_ERR(1, 82, __pyx_L1_error)
+        __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_index); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 95, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_5);
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_6 = __pyx_t_1; __pyx_t_7 = NULL;
@@ -2971,7 +3210,7 @@ static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx
         #if CYTHON_FAST_PYCALL
         if (PyFunction_Check(__pyx_t_6)) {
           PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_att};
-          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 82, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
           __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2982,7 +3221,7 @@ static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx
         #if CYTHON_FAST_PYCCALL
         if (__Pyx_PyFastCFunction_Check(__pyx_t_6)) {
           PyObject *__pyx_temp[5] = {__pyx_t_7, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_att};
-          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 82, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_6, __pyx_temp+1-__pyx_t_8, 4+__pyx_t_8); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
           __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -2991,7 +3230,7 @@ static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx
         } else
         #endif
         {
-          __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(1, 82, __pyx_L1_error)
+          __pyx_t_9 = PyTuple_New(4+__pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 95, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_9);
           if (__pyx_t_7) {
             __Pyx_GIVEREF(__pyx_t_7); PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7); __pyx_t_7 = NULL;
@@ -3008,14 +3247,14 @@ static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx
           __pyx_t_3 = 0;
           __pyx_t_4 = 0;
           __pyx_t_5 = 0;
-          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 82, __pyx_L1_error)
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_6, __pyx_t_9, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_2);
           __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
         }
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_t_8 = __Pyx_PyInt_As_int(__pyx_t_2); if (unlikely((__pyx_t_8 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 82, __pyx_L1_error)
+        __pyx_t_10 = __Pyx_PyInt_As_int64_t(__pyx_t_2); if (unlikely((__pyx_t_10 == ((model::des::EventHandle)-1)) && PyErr_Occurred())) __PYX_ERR(0, 95, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __pyx_r = __pyx_t_8;
+        __pyx_r = __pyx_t_10;
         __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         goto __pyx_L0;
       }
@@ -3032,27 +3271,27 @@ static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx
     #endif
   }
 
-  /* "model/des/cyscheduler.pyx":84
- *     cpdef int schedule(self, float time, int code, int index = -1,
- *                        object att = None):
+  /* "model/des/cyscheduler.pyx":98
+ *                                object att = None):
+ *         """Schedule an event and return its handle (a positive integer)."""
  *         cdef PyObject *c_att = NULL             # <<<<<<<<<<<<<<
  * 
  *         if att is not None:
  */
   __pyx_v_c_att = NULL;
 
-  /* "model/des/cyscheduler.pyx":86
+  /* "model/des/cyscheduler.pyx":100
  *         cdef PyObject *c_att = NULL
  * 
  *         if att is not None:             # <<<<<<<<<<<<<<
  *             c_att = <PyObject*>att
  * 
  */
-  __pyx_t_10 = (__pyx_v_att != Py_None);
-  __pyx_t_11 = (__pyx_t_10 != 0);
-  if (__pyx_t_11) {
+  __pyx_t_11 = (__pyx_v_att != Py_None);
+  __pyx_t_12 = (__pyx_t_11 != 0);
+  if (__pyx_t_12) {
 
-    /* "model/des/cyscheduler.pyx":87
+    /* "model/des/cyscheduler.pyx":101
  * 
  *         if att is not None:
  *             c_att = <PyObject*>att             # <<<<<<<<<<<<<<
@@ -3061,7 +3300,7 @@ static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx
  */
     __pyx_v_c_att = ((PyObject *)__pyx_v_att);
 
-    /* "model/des/cyscheduler.pyx":86
+    /* "model/des/cyscheduler.pyx":100
  *         cdef PyObject *c_att = NULL
  * 
  *         if att is not None:             # <<<<<<<<<<<<<<
@@ -3070,22 +3309,22 @@ static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx
  */
   }
 
-  /* "model/des/cyscheduler.pyx":89
+  /* "model/des/cyscheduler.pyx":103
  *             c_att = <PyObject*>att
  * 
  *         return self.c_scheduler.schedule(time, code, index, c_att)             # <<<<<<<<<<<<<<
  * 
- *     cpdef void cancel(self, int event_id):
+ *     cpdef void cancel(self, EventHandle handle):
  */
   __pyx_r = __pyx_v_self->c_scheduler->schedule(__pyx_v_time, __pyx_v_code, __pyx_v_index, __pyx_v_c_att);
   goto __pyx_L0;
 
-  /* "model/des/cyscheduler.pyx":82
+  /* "model/des/cyscheduler.pyx":95
  *         return self.c_scheduler.get_time()
  * 
- *     cpdef int schedule(self, float time, int code, int index = -1,             # <<<<<<<<<<<<<<
- *                        object att = None):
- *         cdef PyObject *c_att = NULL
+ *     cpdef EventHandle schedule(self, double time, int code, int index = -1,             # <<<<<<<<<<<<<<
+ *                                object att = None):
+ *         """Schedule an event and return its handle (a positive integer)."""
  */
 
   /* function exit code */
@@ -3107,9 +3346,9 @@ static int __pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule(struct __pyx
 
 /* Python wrapper */
 static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_14schedule[] = "CyScheduler.schedule(self, float time, int code, int index=-1, att=None) -> int";
+static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_14schedule[] = "CyScheduler.schedule(self, double time, int code, int index=-1, att=None) -> EventHandle\nSchedule an event and return its handle (a positive integer).";
 static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  float __pyx_v_time;
+  double __pyx_v_time;
   int __pyx_v_code;
   int __pyx_v_index;
   PyObject *__pyx_v_att = 0;
@@ -3123,12 +3362,12 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule(PyO
     static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_time,&__pyx_n_s_code,&__pyx_n_s_index,&__pyx_n_s_att,0};
     PyObject* values[4] = {0,0,0,0};
 
-    /* "model/des/cyscheduler.pyx":83
+    /* "model/des/cyscheduler.pyx":96
  * 
- *     cpdef int schedule(self, float time, int code, int index = -1,
- *                        object att = None):             # <<<<<<<<<<<<<<
+ *     cpdef EventHandle schedule(self, double time, int code, int index = -1,
+ *                                object att = None):             # <<<<<<<<<<<<<<
+ *         """Schedule an event and return its handle (a positive integer)."""
  *         cdef PyObject *c_att = NULL
- * 
  */
     values[3] = ((PyObject *)Py_None);
     if (unlikely(__pyx_kwds)) {
@@ -3155,7 +3394,7 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule(PyO
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_code)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("schedule", 0, 2, 4, 1); __PYX_ERR(1, 82, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("schedule", 0, 2, 4, 1); __PYX_ERR(0, 95, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -3171,7 +3410,7 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule(PyO
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "schedule") < 0)) __PYX_ERR(1, 82, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "schedule") < 0)) __PYX_ERR(0, 95, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -3185,10 +3424,10 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule(PyO
         default: goto __pyx_L5_argtuple_error;
       }
     }
-    __pyx_v_time = __pyx_PyFloat_AsFloat(values[0]); if (unlikely((__pyx_v_time == (float)-1) && PyErr_Occurred())) __PYX_ERR(1, 82, __pyx_L3_error)
-    __pyx_v_code = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_code == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 82, __pyx_L3_error)
+    __pyx_v_time = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_time == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 95, __pyx_L3_error)
+    __pyx_v_code = __Pyx_PyInt_As_int(values[1]); if (unlikely((__pyx_v_code == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 95, __pyx_L3_error)
     if (values[2]) {
-      __pyx_v_index = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_index == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 82, __pyx_L3_error)
+      __pyx_v_index = __Pyx_PyInt_As_int(values[2]); if (unlikely((__pyx_v_index == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 95, __pyx_L3_error)
     } else {
       __pyx_v_index = ((int)-1);
     }
@@ -3196,7 +3435,7 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule(PyO
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("schedule", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(1, 82, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("schedule", 0, 2, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 95, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.schedule", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -3204,12 +3443,12 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule(PyO
   __pyx_L4_argument_unpacking_done:;
   __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_14schedule(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self), __pyx_v_time, __pyx_v_code, __pyx_v_index, __pyx_v_att);
 
-  /* "model/des/cyscheduler.pyx":82
+  /* "model/des/cyscheduler.pyx":95
  *         return self.c_scheduler.get_time()
  * 
- *     cpdef int schedule(self, float time, int code, int index = -1,             # <<<<<<<<<<<<<<
- *                        object att = None):
- *         cdef PyObject *c_att = NULL
+ *     cpdef EventHandle schedule(self, double time, int code, int index = -1,             # <<<<<<<<<<<<<<
+ *                                object att = None):
+ *         """Schedule an event and return its handle (a positive integer)."""
  */
 
   /* function exit code */
@@ -3217,10 +3456,10 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule(PyO
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_14schedule(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, float __pyx_v_time, int __pyx_v_code, int __pyx_v_index, PyObject *__pyx_v_att) {
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_14schedule(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, double __pyx_v_time, int __pyx_v_code, int __pyx_v_index, PyObject *__pyx_v_att) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
+  model::des::EventHandle __pyx_t_1;
   struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
   int __pyx_lineno = 0;
@@ -3232,7 +3471,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_14schedule(str
   __pyx_t_2.index = __pyx_v_index;
   __pyx_t_2.att = __pyx_v_att;
   __pyx_t_1 = __pyx_vtabptr_5model_3des_11cyscheduler_CyScheduler->schedule(__pyx_v_self, __pyx_v_time, __pyx_v_code, 1, &__pyx_t_2); 
-  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 82, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_int64_t(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_r = __pyx_t_3;
   __pyx_t_3 = 0;
@@ -3249,16 +3488,16 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_14schedule(str
   return __pyx_r;
 }
 
-/* "model/des/cyscheduler.pyx":91
+/* "model/des/cyscheduler.pyx":105
  *         return self.c_scheduler.schedule(time, code, index, c_att)
  * 
- *     cpdef void cancel(self, int event_id):             # <<<<<<<<<<<<<<
- *         self.c_scheduler.cancel(event_id)
- * 
+ *     cpdef void cancel(self, EventHandle handle):             # <<<<<<<<<<<<<<
+ *         """Cancel a pending event, stale and negative handles are ignored."""
+ *         self.c_scheduler.cancel(handle)
  */
 
-static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_17cancel(PyObject *__pyx_v_self, PyObject *__pyx_arg_event_id); /*proto*/
-static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_v_event_id, int __pyx_skip_dispatch) {
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_17cancel(PyObject *__pyx_v_self, PyObject *__pyx_arg_handle); /*proto*/
+static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, model::des::EventHandle __pyx_v_handle, int __pyx_skip_dispatch) {
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   PyObject *__pyx_t_2 = NULL;
@@ -3278,10 +3517,10 @@ static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel(struct __pyx_
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_cancel); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 91, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_cancel); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_17cancel)) {
-        __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_event_id); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 91, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyInt_From_int64_t(__pyx_v_handle); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 105, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
         __Pyx_INCREF(__pyx_t_1);
         __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
@@ -3297,7 +3536,7 @@ static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel(struct __pyx_
         __pyx_t_2 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_3);
         __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 91, __pyx_L1_error)
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 105, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -3317,21 +3556,21 @@ static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel(struct __pyx_
     #endif
   }
 
-  /* "model/des/cyscheduler.pyx":92
- * 
- *     cpdef void cancel(self, int event_id):
- *         self.c_scheduler.cancel(event_id)             # <<<<<<<<<<<<<<
+  /* "model/des/cyscheduler.pyx":107
+ *     cpdef void cancel(self, EventHandle handle):
+ *         """Cancel a pending event, stale and negative handles are ignored."""
+ *         self.c_scheduler.cancel(handle)             # <<<<<<<<<<<<<<
  * 
  *     cpdef void stop(self):
  */
-  __pyx_v_self->c_scheduler->cancel(__pyx_v_event_id);
+  __pyx_v_self->c_scheduler->cancel(__pyx_v_handle);
 
-  /* "model/des/cyscheduler.pyx":91
+  /* "model/des/cyscheduler.pyx":105
  *         return self.c_scheduler.schedule(time, code, index, c_att)
  * 
- *     cpdef void cancel(self, int event_id):             # <<<<<<<<<<<<<<
- *         self.c_scheduler.cancel(event_id)
- * 
+ *     cpdef void cancel(self, EventHandle handle):             # <<<<<<<<<<<<<<
+ *         """Cancel a pending event, stale and negative handles are ignored."""
+ *         self.c_scheduler.cancel(handle)
  */
 
   /* function exit code */
@@ -3348,18 +3587,18 @@ static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel(struct __pyx_
 }
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_17cancel(PyObject *__pyx_v_self, PyObject *__pyx_arg_event_id); /*proto*/
-static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_16cancel[] = "CyScheduler.cancel(self, int event_id) -> void";
-static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_17cancel(PyObject *__pyx_v_self, PyObject *__pyx_arg_event_id) {
-  int __pyx_v_event_id;
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_17cancel(PyObject *__pyx_v_self, PyObject *__pyx_arg_handle); /*proto*/
+static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_16cancel[] = "CyScheduler.cancel(self, EventHandle handle) -> void\nCancel a pending event, stale and negative handles are ignored.";
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_17cancel(PyObject *__pyx_v_self, PyObject *__pyx_arg_handle) {
+  model::des::EventHandle __pyx_v_handle;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("cancel (wrapper)", 0);
-  assert(__pyx_arg_event_id); {
-    __pyx_v_event_id = __Pyx_PyInt_As_int(__pyx_arg_event_id); if (unlikely((__pyx_v_event_id == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 91, __pyx_L3_error)
+  assert(__pyx_arg_handle); {
+    __pyx_v_handle = __Pyx_PyInt_As_int64_t(__pyx_arg_handle); if (unlikely((__pyx_v_handle == ((model::des::EventHandle)-1)) && PyErr_Occurred())) __PYX_ERR(0, 105, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -3367,14 +3606,14 @@ static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_17cancel(PyObj
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_16cancel(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self), ((int)__pyx_v_event_id));
+  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_16cancel(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self), ((model::des::EventHandle)__pyx_v_handle));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_16cancel(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_v_event_id) {
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_16cancel(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, model::des::EventHandle __pyx_v_handle) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
@@ -3383,7 +3622,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_16cancel(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("cancel", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_void_to_None(__pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel(__pyx_v_self, __pyx_v_event_id, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 91, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_void_to_None(__pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel(__pyx_v_self, __pyx_v_handle, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 105, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3400,8 +3639,8 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_16cancel(struc
   return __pyx_r;
 }
 
-/* "model/des/cyscheduler.pyx":94
- *         self.c_scheduler.cancel(event_id)
+/* "model/des/cyscheduler.pyx":109
+ *         self.c_scheduler.cancel(handle)
  * 
  *     cpdef void stop(self):             # <<<<<<<<<<<<<<
  *         self.c_scheduler.stop()
@@ -3428,7 +3667,7 @@ static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_stop(struct __pyx_ob
     if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
       PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
       #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_stop); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 94, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_stop); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 109, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
       if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_19stop)) {
         __Pyx_INCREF(__pyx_t_1);
@@ -3444,7 +3683,7 @@ static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_stop(struct __pyx_ob
         }
         __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 94, __pyx_L1_error)
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 109, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_2);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -3464,17 +3703,17 @@ static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_stop(struct __pyx_ob
     #endif
   }
 
-  /* "model/des/cyscheduler.pyx":95
+  /* "model/des/cyscheduler.pyx":110
  * 
  *     cpdef void stop(self):
  *         self.c_scheduler.stop()             # <<<<<<<<<<<<<<
  * 
- *     cpdef void run(self):
+ *     @property
  */
   __pyx_v_self->c_scheduler->stop();
 
-  /* "model/des/cyscheduler.pyx":94
- *         self.c_scheduler.cancel(event_id)
+  /* "model/des/cyscheduler.pyx":109
+ *         self.c_scheduler.cancel(handle)
  * 
  *     cpdef void stop(self):             # <<<<<<<<<<<<<<
  *         self.c_scheduler.stop()
@@ -3516,7 +3755,7 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_18stop(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("stop", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_void_to_None(__pyx_f_5model_3des_11cyscheduler_11CyScheduler_stop(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 94, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_void_to_None(__pyx_f_5model_3des_11cyscheduler_11CyScheduler_stop(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 109, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3533,128 +3772,62 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_18stop(struct
   return __pyx_r;
 }
 
-/* "model/des/cyscheduler.pyx":97
- *         self.c_scheduler.stop()
- * 
- *     cpdef void run(self):             # <<<<<<<<<<<<<<
- *         self.c_scheduler.run()
- */
-
-static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_21run(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static void __pyx_f_5model_3des_11cyscheduler_11CyScheduler_run(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_skip_dispatch) {
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("run", 0);
-  /* Check if called by wrapper */
-  if (unlikely(__pyx_skip_dispatch)) ;
-  /* Check if overridden in Python */
-  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
-    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
-    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
-    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
-      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
-      #endif
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_run); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 97, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_21run)) {
-        __Pyx_INCREF(__pyx_t_1);
-        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
-        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
-          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
-          if (likely(__pyx_t_4)) {
-            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
-            __Pyx_INCREF(__pyx_t_4);
-            __Pyx_INCREF(function);
-            __Pyx_DECREF_SET(__pyx_t_3, function);
-          }
-        }
-        __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_4) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 97, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        goto __pyx_L0;
-      }
-      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
-      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
-      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
-      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
-        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
-      }
-      #endif
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
-    }
-    #endif
-  }
-
-  /* "model/des/cyscheduler.pyx":98
+/* "model/des/cyscheduler.pyx":113
  * 
- *     cpdef void run(self):
- *         self.c_scheduler.run()             # <<<<<<<<<<<<<<
- */
-  __pyx_v_self->c_scheduler->run();
-
-  /* "model/des/cyscheduler.pyx":97
- *         self.c_scheduler.stop()
+ *     @property
+ *     def started(self):             # <<<<<<<<<<<<<<
+ *         return self.c_scheduler.is_started()
  * 
- *     cpdef void run(self):             # <<<<<<<<<<<<<<
- *         self.c_scheduler.run()
  */
 
-  /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_WriteUnraisable("model.des.cyscheduler.CyScheduler.run", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
-  __pyx_L0:;
-  __Pyx_RefNannyFinishContext();
-}
-
 /* Python wrapper */
-static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_21run(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_20run[] = "CyScheduler.run(self) -> void";
-static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_21run(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_7started_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_7started_1__get__(PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("run (wrapper)", 0);
-  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_20run(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_7started___get__(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_20run(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self) {
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_7started___get__(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("run", 0);
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "model/des/cyscheduler.pyx":114
+ *     @property
+ *     def started(self):
+ *         return self.c_scheduler.is_started()             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+ */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_void_to_None(__pyx_f_5model_3des_11cyscheduler_11CyScheduler_run(__pyx_v_self, 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 97, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->c_scheduler->is_started()); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 114, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
+  /* "model/des/cyscheduler.pyx":113
+ * 
+ *     @property
+ *     def started(self):             # <<<<<<<<<<<<<<
+ *         return self.c_scheduler.is_started()
+ * 
+ */
+
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.run", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.started.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -3662,128 +3835,1182 @@ static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_20run(struct _
   return __pyx_r;
 }
 
-/* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
+/* "model/des/cyscheduler.pyx":117
+ * 
+ *     @property
+ *     def exit_reason(self):             # <<<<<<<<<<<<<<
+ *         return ExitReason(self.c_scheduler.get_exit_reason())
+ * 
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_23__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
-static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_22__reduce_cython__[] = "CyScheduler.__reduce_cython__(self)";
-static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_23__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_11exit_reason_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_11exit_reason_1__get__(PyObject *__pyx_v_self) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_22__reduce_cython__(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self));
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_11exit_reason___get__(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_22__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self) {
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_11exit_reason___get__(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+  __Pyx_RefNannySetupContext("__get__", 0);
 
-  /* "(tree fragment)":2
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+  /* "model/des/cyscheduler.pyx":118
+ *     @property
+ *     def exit_reason(self):
+ *         return ExitReason(self.c_scheduler.get_exit_reason())             # <<<<<<<<<<<<<<
+ * 
+ *     def get_event_pool_stats(self):
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_ExitReason); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 118, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyInt_From_enum__model_3a__3a_des_3a__3a_ExitReason(__pyx_v_self->c_scheduler->get_exit_reason()); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 118, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_4)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_4);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_4, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 118, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 2, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-  /* "(tree fragment)":1
- * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
+  /* "model/des/cyscheduler.pyx":117
+ * 
+ *     @property
+ *     def exit_reason(self):             # <<<<<<<<<<<<<<
+ *         return ExitReason(self.c_scheduler.get_exit_reason())
+ * 
  */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.exit_reason.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
+  __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+/* "model/des/cyscheduler.pyx":120
+ *         return ExitReason(self.c_scheduler.get_exit_reason())
+ * 
+ *     def get_event_pool_stats(self):             # <<<<<<<<<<<<<<
+ *         pool = &self.c_scheduler.get_event_pool()
+ *         return EventPoolStats(
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_25__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
-static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_24__setstate_cython__[] = "CyScheduler.__setstate_cython__(self, __pyx_state)";
-static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_25__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_21get_event_pool_stats(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_20get_event_pool_stats[] = "CyScheduler.get_event_pool_stats(self)";
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_21get_event_pool_stats(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
-  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_24__setstate_cython__(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+  __Pyx_RefNannySetupContext("get_event_pool_stats (wrapper)", 0);
+  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_20get_event_pool_stats(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self));
 
   /* function exit code */
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_24__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_20get_event_pool_stats(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self) {
+  model::des::EventPool const *__pyx_v_pool;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_t_9;
+  PyObject *__pyx_t_10 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+  __Pyx_RefNannySetupContext("get_event_pool_stats", 0);
 
-  /* "(tree fragment)":4
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+  /* "model/des/cyscheduler.pyx":121
+ * 
+ *     def get_event_pool_stats(self):
+ *         pool = &self.c_scheduler.get_event_pool()             # <<<<<<<<<<<<<<
+ *         return EventPoolStats(
+ *             pool.get_num_slabs(), pool.get_capacity(), pool.get_num_in_use(),
  */
-  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __PYX_ERR(0, 4, __pyx_L1_error)
-
-  /* "(tree fragment)":3
- * def __reduce_cython__(self):
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
- * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
- *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+  __pyx_v_pool = (&__pyx_v_self->c_scheduler->get_event_pool());
+
+  /* "model/des/cyscheduler.pyx":122
+ *     def get_event_pool_stats(self):
+ *         pool = &self.c_scheduler.get_event_pool()
+ *         return EventPoolStats(             # <<<<<<<<<<<<<<
+ *             pool.get_num_slabs(), pool.get_capacity(), pool.get_num_in_use(),
+ *             pool.get_num_acquired(), pool.get_num_released())
  */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_EventPoolStats); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
-static struct __pyx_vtabstruct_5model_3des_11cyscheduler_CyScheduler __pyx_vtable_5model_3des_11cyscheduler_CyScheduler;
+  /* "model/des/cyscheduler.pyx":123
+ *         pool = &self.c_scheduler.get_event_pool()
+ *         return EventPoolStats(
+ *             pool.get_num_slabs(), pool.get_capacity(), pool.get_num_in_use(),             # <<<<<<<<<<<<<<
+ *             pool.get_num_acquired(), pool.get_num_released())
+ * 
+ */
+  __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_pool->get_num_slabs()); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 123, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_pool->get_capacity()); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 123, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = __Pyx_PyInt_From_int(__pyx_v_pool->get_num_in_use()); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 123, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
 
-static PyObject *__pyx_tp_new_5model_3des_11cyscheduler_CyScheduler(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *p;
-  PyObject *o;
-  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
-    o = (*t->tp_alloc)(t, 0);
-  } else {
+  /* "model/des/cyscheduler.pyx":124
+ *         return EventPoolStats(
+ *             pool.get_num_slabs(), pool.get_capacity(), pool.get_num_in_use(),
+ *             pool.get_num_acquired(), pool.get_num_released())             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef object run(self, until=None, max_events=None):
+ */
+  __pyx_t_6 = __Pyx_PyInt_From_long(__pyx_v_pool->get_num_acquired()); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyInt_From_long(__pyx_v_pool->get_num_released()); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 124, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = NULL;
+  __pyx_t_9 = 0;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_8 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_8)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_8);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+      __pyx_t_9 = 1;
+    }
+  }
+  #if CYTHON_FAST_PYCALL
+  if (PyFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[6] = {__pyx_t_8, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_t_7};
+    __pyx_t_1 = __Pyx_PyFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_9, 5+__pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 122, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  } else
+  #endif
+  #if CYTHON_FAST_PYCCALL
+  if (__Pyx_PyFastCFunction_Check(__pyx_t_2)) {
+    PyObject *__pyx_temp[6] = {__pyx_t_8, __pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_t_7};
+    __pyx_t_1 = __Pyx_PyCFunction_FastCall(__pyx_t_2, __pyx_temp+1-__pyx_t_9, 5+__pyx_t_9); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 122, __pyx_L1_error)
+    __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  } else
+  #endif
+  {
+    __pyx_t_10 = PyTuple_New(5+__pyx_t_9); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 122, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_10);
+    if (__pyx_t_8) {
+      __Pyx_GIVEREF(__pyx_t_8); PyTuple_SET_ITEM(__pyx_t_10, 0, __pyx_t_8); __pyx_t_8 = NULL;
+    }
+    __Pyx_GIVEREF(__pyx_t_3);
+    PyTuple_SET_ITEM(__pyx_t_10, 0+__pyx_t_9, __pyx_t_3);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_10, 1+__pyx_t_9, __pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_5);
+    PyTuple_SET_ITEM(__pyx_t_10, 2+__pyx_t_9, __pyx_t_5);
+    __Pyx_GIVEREF(__pyx_t_6);
+    PyTuple_SET_ITEM(__pyx_t_10, 3+__pyx_t_9, __pyx_t_6);
+    __Pyx_GIVEREF(__pyx_t_7);
+    PyTuple_SET_ITEM(__pyx_t_10, 4+__pyx_t_9, __pyx_t_7);
+    __pyx_t_3 = 0;
+    __pyx_t_4 = 0;
+    __pyx_t_5 = 0;
+    __pyx_t_6 = 0;
+    __pyx_t_7 = 0;
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_10, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 122, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "model/des/cyscheduler.pyx":120
+ *         return ExitReason(self.c_scheduler.get_exit_reason())
+ * 
+ *     def get_event_pool_stats(self):             # <<<<<<<<<<<<<<
+ *         pool = &self.c_scheduler.get_event_pool()
+ *         return EventPoolStats(
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_10);
+  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.get_event_pool_stats", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "model/des/cyscheduler.pyx":126
+ *             pool.get_num_acquired(), pool.get_num_released())
+ * 
+ *     cpdef object run(self, until=None, max_events=None):             # <<<<<<<<<<<<<<
+ *         """Run init handlers and events up to `until` (inclusive).
+ * 
+ */
+
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_23run(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_f_5model_3des_11cyscheduler_11CyScheduler_run(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_run *__pyx_optional_args) {
+  PyObject *__pyx_v_until = ((PyObject *)Py_None);
+  PyObject *__pyx_v_max_events = ((PyObject *)Py_None);
+  double __pyx_v_c_until;
+  int64_t __pyx_v_c_max_events;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  double __pyx_t_7;
+  int __pyx_t_8;
+  double __pyx_t_9;
+  int64_t __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("run", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_until = __pyx_optional_args->until;
+      if (__pyx_optional_args->__pyx_n > 1) {
+        __pyx_v_max_events = __pyx_optional_args->max_events;
+      }
+    }
+  }
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_run); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 126, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_23run)) {
+        __Pyx_XDECREF(__pyx_r);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_3 = __pyx_t_1; __pyx_t_4 = NULL;
+        __pyx_t_5 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+          __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+          if (likely(__pyx_t_4)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+            __Pyx_INCREF(__pyx_t_4);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_3, function);
+            __pyx_t_5 = 1;
+          }
+        }
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_3)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_until, __pyx_v_max_events};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 126, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_3)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_4, __pyx_v_until, __pyx_v_max_events};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_3, __pyx_temp+1-__pyx_t_5, 2+__pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 126, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+        } else
+        #endif
+        {
+          __pyx_t_6 = PyTuple_New(2+__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 126, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_6);
+          if (__pyx_t_4) {
+            __Pyx_GIVEREF(__pyx_t_4); PyTuple_SET_ITEM(__pyx_t_6, 0, __pyx_t_4); __pyx_t_4 = NULL;
+          }
+          __Pyx_INCREF(__pyx_v_until);
+          __Pyx_GIVEREF(__pyx_v_until);
+          PyTuple_SET_ITEM(__pyx_t_6, 0+__pyx_t_5, __pyx_v_until);
+          __Pyx_INCREF(__pyx_v_max_events);
+          __Pyx_GIVEREF(__pyx_v_max_events);
+          PyTuple_SET_ITEM(__pyx_t_6, 1+__pyx_t_5, __pyx_v_max_events);
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_6, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 126, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "model/des/cyscheduler.pyx":134
+ *         :return: `ExitReason`
+ *         """
+ *         cdef double c_until = INFINITY if until is None else until             # <<<<<<<<<<<<<<
+ *         cdef int64_t c_max_events = _get_c_max_events(max_events)
+ *         return ExitReason(self.c_scheduler.run(c_until, c_max_events))
+ */
+  __pyx_t_8 = (__pyx_v_until == Py_None);
+  if ((__pyx_t_8 != 0)) {
+    __pyx_t_7 = INFINITY;
+  } else {
+    __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_v_until); if (unlikely((__pyx_t_9 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 134, __pyx_L1_error)
+    __pyx_t_7 = __pyx_t_9;
+  }
+  __pyx_v_c_until = __pyx_t_7;
+
+  /* "model/des/cyscheduler.pyx":135
+ *         """
+ *         cdef double c_until = INFINITY if until is None else until
+ *         cdef int64_t c_max_events = _get_c_max_events(max_events)             # <<<<<<<<<<<<<<
+ *         return ExitReason(self.c_scheduler.run(c_until, c_max_events))
+ * 
+ */
+  __pyx_t_10 = __pyx_f_5model_3des_11cyscheduler__get_c_max_events(__pyx_v_max_events); if (unlikely(__pyx_t_10 == ((int64_t)-1L) && PyErr_Occurred())) __PYX_ERR(0, 135, __pyx_L1_error)
+  __pyx_v_c_max_events = __pyx_t_10;
+
+  /* "model/des/cyscheduler.pyx":136
+ *         cdef double c_until = INFINITY if until is None else until
+ *         cdef int64_t c_max_events = _get_c_max_events(max_events)
+ *         return ExitReason(self.c_scheduler.run(c_until, c_max_events))             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef object continue_until(self, double until, max_events=None):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_ExitReason); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_3 = __Pyx_PyInt_From_enum__model_3a__3a_des_3a__3a_ExitReason(__pyx_v_self->c_scheduler->run(__pyx_v_c_until, __pyx_v_c_max_events)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_6 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
+    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_2);
+    if (likely(__pyx_t_6)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_6);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_2, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_6, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "model/des/cyscheduler.pyx":126
+ *             pool.get_num_acquired(), pool.get_num_released())
+ * 
+ *     cpdef object run(self, until=None, max_events=None):             # <<<<<<<<<<<<<<
+ *         """Run init handlers and events up to `until` (inclusive).
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.run", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_23run(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_22run[] = "CyScheduler.run(self, until=None, max_events=None)\nRun init handlers and events up to `until` (inclusive).\n\n        Later events stay in the queue, use `continue_until()` to go on.\n        Horizon and `max_events` are checked in the C++ loop.\n\n        :return: `ExitReason`\n        ";
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_23run(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_until = 0;
+  PyObject *__pyx_v_max_events = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("run (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_until,&__pyx_n_s_max_events,0};
+    PyObject* values[2] = {0,0};
+    values[0] = ((PyObject *)Py_None);
+    values[1] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_until);
+          if (value) { values[0] = value; kw_args--; }
+        }
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_max_events);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "run") < 0)) __PYX_ERR(0, 126, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_until = values[0];
+    __pyx_v_max_events = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("run", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 126, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.run", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_22run(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self), __pyx_v_until, __pyx_v_max_events);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_22run(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, PyObject *__pyx_v_until, PyObject *__pyx_v_max_events) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_run __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("run", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 2;
+  __pyx_t_2.until = __pyx_v_until;
+  __pyx_t_2.max_events = __pyx_v_max_events;
+  __pyx_t_1 = __pyx_vtabptr_5model_3des_11cyscheduler_CyScheduler->run(__pyx_v_self, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.run", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "model/des/cyscheduler.pyx":138
+ *         return ExitReason(self.c_scheduler.run(c_until, c_max_events))
+ * 
+ *     cpdef object continue_until(self, double until, max_events=None):             # <<<<<<<<<<<<<<
+ *         """Continue a started run up to `until`, keeping queue and state.
+ * 
+ */
+
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_25continue_until(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyObject *__pyx_f_5model_3des_11cyscheduler_11CyScheduler_continue_until(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, double __pyx_v_until, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_continue_until *__pyx_optional_args) {
+  PyObject *__pyx_v_max_events = ((PyObject *)Py_None);
+  int64_t __pyx_v_c_max_events;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  int __pyx_t_8;
+  Py_ssize_t __pyx_t_9;
+  Py_UCS4 __pyx_t_10;
+  int64_t __pyx_t_11;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("continue_until", 0);
+  if (__pyx_optional_args) {
+    if (__pyx_optional_args->__pyx_n > 0) {
+      __pyx_v_max_events = __pyx_optional_args->max_events;
+    }
+  }
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (unlikely((Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0) || (Py_TYPE(((PyObject *)__pyx_v_self))->tp_flags & (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_type_dict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_continue_until); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!PyCFunction_Check(__pyx_t_1) || (PyCFunction_GET_FUNCTION(__pyx_t_1) != (PyCFunction)(void*)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_25continue_until)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = PyFloat_FromDouble(__pyx_v_until); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 138, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_4 = __pyx_t_1; __pyx_t_5 = NULL;
+        __pyx_t_6 = 0;
+        if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
+          if (likely(__pyx_t_5)) {
+            PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+            __Pyx_INCREF(__pyx_t_5);
+            __Pyx_INCREF(function);
+            __Pyx_DECREF_SET(__pyx_t_4, function);
+            __pyx_t_6 = 1;
+          }
+        }
+        #if CYTHON_FAST_PYCALL
+        if (PyFunction_Check(__pyx_t_4)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_3, __pyx_v_max_events};
+          __pyx_t_2 = __Pyx_PyFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 138, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        } else
+        #endif
+        #if CYTHON_FAST_PYCCALL
+        if (__Pyx_PyFastCFunction_Check(__pyx_t_4)) {
+          PyObject *__pyx_temp[3] = {__pyx_t_5, __pyx_t_3, __pyx_v_max_events};
+          __pyx_t_2 = __Pyx_PyCFunction_FastCall(__pyx_t_4, __pyx_temp+1-__pyx_t_6, 2+__pyx_t_6); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 138, __pyx_L1_error)
+          __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        } else
+        #endif
+        {
+          __pyx_t_7 = PyTuple_New(2+__pyx_t_6); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 138, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_7);
+          if (__pyx_t_5) {
+            __Pyx_GIVEREF(__pyx_t_5); PyTuple_SET_ITEM(__pyx_t_7, 0, __pyx_t_5); __pyx_t_5 = NULL;
+          }
+          __Pyx_GIVEREF(__pyx_t_3);
+          PyTuple_SET_ITEM(__pyx_t_7, 0+__pyx_t_6, __pyx_t_3);
+          __Pyx_INCREF(__pyx_v_max_events);
+          __Pyx_GIVEREF(__pyx_v_max_events);
+          PyTuple_SET_ITEM(__pyx_t_7, 1+__pyx_t_6, __pyx_v_max_events);
+          __pyx_t_3 = 0;
+          __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 138, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+        }
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_r = __pyx_t_2;
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_type_dict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "model/des/cyscheduler.pyx":143
+ *         :return: `ExitReason`
+ *         """
+ *         if not self.c_scheduler.is_started():             # <<<<<<<<<<<<<<
+ *             raise RuntimeError('scheduler was not started, call run() first')
+ *         if until < self.c_scheduler.get_time():
+ */
+  __pyx_t_8 = ((!(__pyx_v_self->c_scheduler->is_started() != 0)) != 0);
+  if (unlikely(__pyx_t_8)) {
+
+    /* "model/des/cyscheduler.pyx":144
+ *         """
+ *         if not self.c_scheduler.is_started():
+ *             raise RuntimeError('scheduler was not started, call run() first')             # <<<<<<<<<<<<<<
+ *         if until < self.c_scheduler.get_time():
+ *             raise ValueError(f'horizon {until} is in the past')
+ */
+    __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 144, __pyx_L1_error)
+
+    /* "model/des/cyscheduler.pyx":143
+ *         :return: `ExitReason`
+ *         """
+ *         if not self.c_scheduler.is_started():             # <<<<<<<<<<<<<<
+ *             raise RuntimeError('scheduler was not started, call run() first')
+ *         if until < self.c_scheduler.get_time():
+ */
+  }
+
+  /* "model/des/cyscheduler.pyx":145
+ *         if not self.c_scheduler.is_started():
+ *             raise RuntimeError('scheduler was not started, call run() first')
+ *         if until < self.c_scheduler.get_time():             # <<<<<<<<<<<<<<
+ *             raise ValueError(f'horizon {until} is in the past')
+ *         cdef int64_t c_max_events = _get_c_max_events(max_events)
+ */
+  __pyx_t_8 = ((__pyx_v_until < __pyx_v_self->c_scheduler->get_time()) != 0);
+  if (unlikely(__pyx_t_8)) {
+
+    /* "model/des/cyscheduler.pyx":146
+ *             raise RuntimeError('scheduler was not started, call run() first')
+ *         if until < self.c_scheduler.get_time():
+ *             raise ValueError(f'horizon {until} is in the past')             # <<<<<<<<<<<<<<
+ *         cdef int64_t c_max_events = _get_c_max_events(max_events)
+ *         return ExitReason(
+ */
+    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 146, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_9 = 0;
+    __pyx_t_10 = 127;
+    __Pyx_INCREF(__pyx_kp_u_horizon);
+    __pyx_t_9 += 8;
+    __Pyx_GIVEREF(__pyx_kp_u_horizon);
+    PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_kp_u_horizon);
+    __pyx_t_2 = PyFloat_FromDouble(__pyx_v_until); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 146, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __pyx_t_4 = __Pyx_PyObject_FormatSimple(__pyx_t_2, __pyx_empty_unicode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 146, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_t_10 = (__Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) > __pyx_t_10) ? __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) : __pyx_t_10;
+    __pyx_t_9 += __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4);
+    __Pyx_GIVEREF(__pyx_t_4);
+    PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_4);
+    __pyx_t_4 = 0;
+    __Pyx_INCREF(__pyx_kp_u_is_in_the_past);
+    __pyx_t_9 += 15;
+    __Pyx_GIVEREF(__pyx_kp_u_is_in_the_past);
+    PyTuple_SET_ITEM(__pyx_t_1, 2, __pyx_kp_u_is_in_the_past);
+    __pyx_t_4 = __Pyx_PyUnicode_Join(__pyx_t_1, 3, __pyx_t_9, __pyx_t_10); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 146, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __pyx_t_1 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 146, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 146, __pyx_L1_error)
+
+    /* "model/des/cyscheduler.pyx":145
+ *         if not self.c_scheduler.is_started():
+ *             raise RuntimeError('scheduler was not started, call run() first')
+ *         if until < self.c_scheduler.get_time():             # <<<<<<<<<<<<<<
+ *             raise ValueError(f'horizon {until} is in the past')
+ *         cdef int64_t c_max_events = _get_c_max_events(max_events)
+ */
+  }
+
+  /* "model/des/cyscheduler.pyx":147
+ *         if until < self.c_scheduler.get_time():
+ *             raise ValueError(f'horizon {until} is in the past')
+ *         cdef int64_t c_max_events = _get_c_max_events(max_events)             # <<<<<<<<<<<<<<
+ *         return ExitReason(
+ *             self.c_scheduler.continue_until(until, c_max_events))
+ */
+  __pyx_t_11 = __pyx_f_5model_3des_11cyscheduler__get_c_max_events(__pyx_v_max_events); if (unlikely(__pyx_t_11 == ((int64_t)-1L) && PyErr_Occurred())) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_v_c_max_events = __pyx_t_11;
+
+  /* "model/des/cyscheduler.pyx":148
+ *             raise ValueError(f'horizon {until} is in the past')
+ *         cdef int64_t c_max_events = _get_c_max_events(max_events)
+ *         return ExitReason(             # <<<<<<<<<<<<<<
+ *             self.c_scheduler.continue_until(until, c_max_events))
+ * 
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_ExitReason); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+
+  /* "model/des/cyscheduler.pyx":149
+ *         cdef int64_t c_max_events = _get_c_max_events(max_events)
+ *         return ExitReason(
+ *             self.c_scheduler.continue_until(until, c_max_events))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_2 = __Pyx_PyInt_From_enum__model_3a__3a_des_3a__3a_ExitReason(__pyx_v_self->c_scheduler->continue_until(__pyx_v_until, __pyx_v_c_max_events)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 149, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_7 = NULL;
+  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+    __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_4);
+    if (likely(__pyx_t_7)) {
+      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(function);
+      __Pyx_DECREF_SET(__pyx_t_4, function);
+    }
+  }
+  __pyx_t_1 = (__pyx_t_7) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_7, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 148, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "model/des/cyscheduler.pyx":138
+ *         return ExitReason(self.c_scheduler.run(c_until, c_max_events))
+ * 
+ *     cpdef object continue_until(self, double until, max_events=None):             # <<<<<<<<<<<<<<
+ *         """Continue a started run up to `until`, keeping queue and state.
+ * 
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.continue_until", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_25continue_until(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_24continue_until[] = "CyScheduler.continue_until(self, double until, max_events=None)\nContinue a started run up to `until`, keeping queue and state.\n\n        :return: `ExitReason`\n        ";
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_25continue_until(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  double __pyx_v_until;
+  PyObject *__pyx_v_max_events = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("continue_until (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_until,&__pyx_n_s_max_events,0};
+    PyObject* values[2] = {0,0};
+    values[1] = ((PyObject *)Py_None);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_until)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (kw_args > 0) {
+          PyObject* value = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_max_events);
+          if (value) { values[1] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "continue_until") < 0)) __PYX_ERR(0, 138, __pyx_L3_error)
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_until = __pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_until == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 138, __pyx_L3_error)
+    __pyx_v_max_events = values[1];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("continue_until", 0, 1, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 138, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.continue_until", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_24continue_until(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self), __pyx_v_until, __pyx_v_max_events);
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_24continue_until(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, double __pyx_v_until, PyObject *__pyx_v_max_events) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_continue_until __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("continue_until", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2.__pyx_n = 1;
+  __pyx_t_2.max_events = __pyx_v_max_events;
+  __pyx_t_1 = __pyx_vtabptr_5model_3des_11cyscheduler_CyScheduler->continue_until(__pyx_v_self, __pyx_v_until, 1, &__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.continue_until", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_27__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused); /*proto*/
+static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_26__reduce_cython__[] = "CyScheduler.__reduce_cython__(self)";
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_27__reduce_cython__(PyObject *__pyx_v_self, CYTHON_UNUSED PyObject *unused) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_26__reduce_cython__(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_26__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__3, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_29__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state); /*proto*/
+static char __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_28__setstate_cython__[] = "CyScheduler.__setstate_cython__(self, __pyx_state)";
+static PyObject *__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_29__setstate_cython__(PyObject *__pyx_v_self, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5model_3des_11cyscheduler_11CyScheduler_28__setstate_cython__(((struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)__pyx_v_self), ((PyObject *)__pyx_v___pyx_state));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5model_3des_11cyscheduler_11CyScheduler_28__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_builtin_TypeError, __pyx_tuple__4, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("model.des.cyscheduler.CyScheduler.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "model/des/cyscheduler.pyx":152
+ * 
+ * 
+ * cdef int64_t _get_c_max_events(max_events) except? -1:             # <<<<<<<<<<<<<<
+ *     if max_events is None:
+ *         return 0
+ */
+
+static int64_t __pyx_f_5model_3des_11cyscheduler__get_c_max_events(PyObject *__pyx_v_max_events) {
+  int64_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int64_t __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_get_c_max_events", 0);
+
+  /* "model/des/cyscheduler.pyx":153
+ * 
+ * cdef int64_t _get_c_max_events(max_events) except? -1:
+ *     if max_events is None:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     if max_events <= 0:
+ */
+  __pyx_t_1 = (__pyx_v_max_events == Py_None);
+  __pyx_t_2 = (__pyx_t_1 != 0);
+  if (__pyx_t_2) {
+
+    /* "model/des/cyscheduler.pyx":154
+ * cdef int64_t _get_c_max_events(max_events) except? -1:
+ *     if max_events is None:
+ *         return 0             # <<<<<<<<<<<<<<
+ *     if max_events <= 0:
+ *         raise ValueError('max events must be positive')
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "model/des/cyscheduler.pyx":153
+ * 
+ * cdef int64_t _get_c_max_events(max_events) except? -1:
+ *     if max_events is None:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     if max_events <= 0:
+ */
+  }
+
+  /* "model/des/cyscheduler.pyx":155
+ *     if max_events is None:
+ *         return 0
+ *     if max_events <= 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError('max events must be positive')
+ *     return max_events
+ */
+  __pyx_t_3 = PyObject_RichCompare(__pyx_v_max_events, __pyx_int_0, Py_LE); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_2 < 0)) __PYX_ERR(0, 155, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "model/des/cyscheduler.pyx":156
+ *         return 0
+ *     if max_events <= 0:
+ *         raise ValueError('max events must be positive')             # <<<<<<<<<<<<<<
+ *     return max_events
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 156, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(0, 156, __pyx_L1_error)
+
+    /* "model/des/cyscheduler.pyx":155
+ *     if max_events is None:
+ *         return 0
+ *     if max_events <= 0:             # <<<<<<<<<<<<<<
+ *         raise ValueError('max events must be positive')
+ *     return max_events
+ */
+  }
+
+  /* "model/des/cyscheduler.pyx":157
+ *     if max_events <= 0:
+ *         raise ValueError('max events must be positive')
+ *     return max_events             # <<<<<<<<<<<<<<
+ */
+  __pyx_t_4 = __Pyx_PyInt_As_int64_t(__pyx_v_max_events); if (unlikely((__pyx_t_4 == ((int64_t)-1)) && PyErr_Occurred())) __PYX_ERR(0, 157, __pyx_L1_error)
+  __pyx_r = __pyx_t_4;
+  goto __pyx_L0;
+
+  /* "model/des/cyscheduler.pyx":152
+ * 
+ * 
+ * cdef int64_t _get_c_max_events(max_events) except? -1:             # <<<<<<<<<<<<<<
+ *     if max_events is None:
+ *         return 0
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("model.des.cyscheduler._get_c_max_events", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1L;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+static struct __pyx_vtabstruct_5model_3des_11cyscheduler_CyScheduler __pyx_vtable_5model_3des_11cyscheduler_CyScheduler;
+
+static PyObject *__pyx_tp_new_5model_3des_11cyscheduler_CyScheduler(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *p;
+  PyObject *o;
+  if (likely((t->tp_flags & Py_TPFLAGS_IS_ABSTRACT) == 0)) {
+    o = (*t->tp_alloc)(t, 0);
+  } else {
     o = (PyObject *) PyBaseObject_Type.tp_new(t, __pyx_empty_tuple, 0);
   }
   if (unlikely(!o)) return 0;
@@ -3800,7 +5027,7 @@ static PyObject *__pyx_tp_new_5model_3des_11cyscheduler_CyScheduler(PyTypeObject
 static void __pyx_tp_dealloc_5model_3des_11cyscheduler_CyScheduler(PyObject *o) {
   struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *p = (struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *)o;
   #if CYTHON_USE_TP_FINALIZE
-  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
+  if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !__Pyx_PyObject_GC_IsFinalized(o)) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
   }
   #endif
@@ -3808,9 +5035,9 @@ static void __pyx_tp_dealloc_5model_3des_11cyscheduler_CyScheduler(PyObject *o)
   {
     PyObject *etype, *eval, *etb;
     PyErr_Fetch(&etype, &eval, &etb);
-    ++Py_REFCNT(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
     __pyx_pw_5model_3des_11cyscheduler_11CyScheduler_3__dealloc__(o);
-    --Py_REFCNT(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
     PyErr_Restore(etype, eval, etb);
   }
   Py_CLEAR(p->c_context);
@@ -3843,6 +5070,14 @@ static PyObject *__pyx_getprop_5model_3des_11cyscheduler_11CyScheduler_time(PyOb
   return __pyx_pw_5model_3des_11cyscheduler_11CyScheduler_4time_1__get__(o);
 }
 
+static PyObject *__pyx_getprop_5model_3des_11cyscheduler_11CyScheduler_started(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5model_3des_11cyscheduler_11CyScheduler_7started_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_5model_3des_11cyscheduler_11CyScheduler_exit_reason(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_5model_3des_11cyscheduler_11CyScheduler_11exit_reason_1__get__(o);
+}
+
 static PyMethodDef __pyx_methods_5model_3des_11cyscheduler_CyScheduler[] = {
   {"get_context", (PyCFunction)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_5get_context, METH_NOARGS, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_4get_context},
   {"bind_init", (PyCFunction)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_7bind_init, METH_O, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_6bind_init},
@@ -3852,15 +5087,19 @@ static PyMethodDef __pyx_methods_5model_3des_11cyscheduler_CyScheduler[] = {
   {"schedule", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_15schedule, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_14schedule},
   {"cancel", (PyCFunction)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_17cancel, METH_O, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_16cancel},
   {"stop", (PyCFunction)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_19stop, METH_NOARGS, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_18stop},
-  {"run", (PyCFunction)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_21run, METH_NOARGS, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_20run},
-  {"__reduce_cython__", (PyCFunction)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_23__reduce_cython__, METH_NOARGS, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_22__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_25__setstate_cython__, METH_O, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_24__setstate_cython__},
+  {"get_event_pool_stats", (PyCFunction)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_21get_event_pool_stats, METH_NOARGS, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_20get_event_pool_stats},
+  {"run", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_23run, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_22run},
+  {"continue_until", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_25continue_until, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_24continue_until},
+  {"__reduce_cython__", (PyCFunction)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_27__reduce_cython__, METH_NOARGS, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_26__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)__pyx_pw_5model_3des_11cyscheduler_11CyScheduler_29__setstate_cython__, METH_O, __pyx_doc_5model_3des_11cyscheduler_11CyScheduler_28__setstate_cython__},
   {0, 0, 0, 0}
 };
 
 static struct PyGetSetDef __pyx_getsets_5model_3des_11cyscheduler_CyScheduler[] = {
   {(char *)"context", __pyx_getprop_5model_3des_11cyscheduler_11CyScheduler_context, 0, (char *)0, 0},
   {(char *)"time", __pyx_getprop_5model_3des_11cyscheduler_11CyScheduler_time, 0, (char *)0, 0},
+  {(char *)"started", __pyx_getprop_5model_3des_11cyscheduler_11CyScheduler_started, 0, (char *)0, 0},
+  {(char *)"exit_reason", __pyx_getprop_5model_3des_11cyscheduler_11CyScheduler_exit_reason, 0, (char *)0, 0},
   {0, 0, 0, 0, 0}
 };
 
@@ -3925,12 +5164,15 @@ static PyTypeObject __pyx_type_5model_3des_11cyscheduler_CyScheduler = {
   #if PY_VERSION_HEX >= 0x030400a1
   0, /*tp_finalize*/
   #endif
-  #if PY_VERSION_HEX >= 0x030800b1
+  #if PY_VERSION_HEX >= 0x030800b1 && (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800)
   0, /*tp_vectorcall*/
   #endif
   #if PY_VERSION_HEX >= 0x030800b4 && PY_VERSION_HEX < 0x03090000
   0, /*tp_print*/
   #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
 };
 
 static PyMethodDef __pyx_methods[] = {
@@ -3983,27 +5225,43 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_u_Context, __pyx_k_Context, sizeof(__pyx_k_Context), 0, 1, 0, 1},
   {&__pyx_n_s_CyScheduler, __pyx_k_CyScheduler, sizeof(__pyx_k_CyScheduler), 0, 0, 1, 1},
   {&__pyx_n_s_EMPTY, __pyx_k_EMPTY, sizeof(__pyx_k_EMPTY), 0, 0, 1, 1},
+  {&__pyx_n_s_EventPoolStats, __pyx_k_EventPoolStats, sizeof(__pyx_k_EventPoolStats), 0, 0, 1, 1},
+  {&__pyx_n_u_EventPoolStats, __pyx_k_EventPoolStats, sizeof(__pyx_k_EventPoolStats), 0, 1, 0, 1},
+  {&__pyx_n_s_ExitReason, __pyx_k_ExitReason, sizeof(__pyx_k_ExitReason), 0, 0, 1, 1},
   {&__pyx_n_s_INDEX, __pyx_k_INDEX, sizeof(__pyx_k_INDEX), 0, 0, 1, 1},
   {&__pyx_n_s_INDEX_OBJECT, __pyx_k_INDEX_OBJECT, sizeof(__pyx_k_INDEX_OBJECT), 0, 0, 1, 1},
   {&__pyx_n_s_OBJECT, __pyx_k_OBJECT, sizeof(__pyx_k_OBJECT), 0, 0, 1, 1},
+  {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
   {&__pyx_n_s_SpecType, __pyx_k_SpecType, sizeof(__pyx_k_SpecType), 0, 0, 1, 1},
   {&__pyx_n_s_TypeError, __pyx_k_TypeError, sizeof(__pyx_k_TypeError), 0, 0, 1, 1},
+  {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
   {&__pyx_n_s_att, __pyx_k_att, sizeof(__pyx_k_att), 0, 0, 1, 1},
   {&__pyx_n_s_cancel, __pyx_k_cancel, sizeof(__pyx_k_cancel), 0, 0, 1, 1},
+  {&__pyx_n_u_capacity, __pyx_k_capacity, sizeof(__pyx_k_capacity), 0, 1, 0, 1},
   {&__pyx_n_s_cline_in_traceback, __pyx_k_cline_in_traceback, sizeof(__pyx_k_cline_in_traceback), 0, 0, 1, 1},
   {&__pyx_n_s_code, __pyx_k_code, sizeof(__pyx_k_code), 0, 0, 1, 1},
   {&__pyx_n_s_collections, __pyx_k_collections, sizeof(__pyx_k_collections), 0, 0, 1, 1},
-  {&__pyx_n_s_get_context, __pyx_k_get_context, sizeof(__pyx_k_get_context), 0, 0, 1, 1},
+  {&__pyx_n_s_continue_until, __pyx_k_continue_until, sizeof(__pyx_k_continue_until), 0, 0, 1, 1},
+  {&__pyx_kp_u_event_code_must_be_non_negative, __pyx_k_event_code_must_be_non_negative, sizeof(__pyx_k_event_code_must_be_non_negative), 0, 1, 0, 0},
   {&__pyx_n_s_get_time, __pyx_k_get_time, sizeof(__pyx_k_get_time), 0, 0, 1, 1},
   {&__pyx_n_s_getstate, __pyx_k_getstate, sizeof(__pyx_k_getstate), 0, 0, 1, 1},
+  {&__pyx_kp_u_given, __pyx_k_given, sizeof(__pyx_k_given), 0, 1, 0, 0},
   {&__pyx_n_s_handler, __pyx_k_handler, sizeof(__pyx_k_handler), 0, 0, 1, 1},
+  {&__pyx_kp_u_horizon, __pyx_k_horizon, sizeof(__pyx_k_horizon), 0, 1, 0, 0},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
   {&__pyx_n_s_index, __pyx_k_index, sizeof(__pyx_k_index), 0, 0, 1, 1},
+  {&__pyx_kp_u_is_in_the_past, __pyx_k_is_in_the_past, sizeof(__pyx_k_is_in_the_past), 0, 1, 0, 0},
   {&__pyx_n_s_main, __pyx_k_main, sizeof(__pyx_k_main), 0, 0, 1, 1},
+  {&__pyx_n_s_max_events, __pyx_k_max_events, sizeof(__pyx_k_max_events), 0, 0, 1, 1},
+  {&__pyx_kp_u_max_events_must_be_positive, __pyx_k_max_events_must_be_positive, sizeof(__pyx_k_max_events_must_be_positive), 0, 1, 0, 0},
   {&__pyx_n_s_model_des_pyscheduler, __pyx_k_model_des_pyscheduler, sizeof(__pyx_k_model_des_pyscheduler), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
   {&__pyx_n_s_namedtuple, __pyx_k_namedtuple, sizeof(__pyx_k_namedtuple), 0, 0, 1, 1},
   {&__pyx_kp_s_no_default___reduce___due_to_non, __pyx_k_no_default___reduce___due_to_non, sizeof(__pyx_k_no_default___reduce___due_to_non), 0, 0, 1, 0},
+  {&__pyx_n_u_num_acquired, __pyx_k_num_acquired, sizeof(__pyx_k_num_acquired), 0, 1, 0, 1},
+  {&__pyx_n_u_num_in_use, __pyx_k_num_in_use, sizeof(__pyx_k_num_in_use), 0, 1, 0, 1},
+  {&__pyx_n_u_num_released, __pyx_k_num_released, sizeof(__pyx_k_num_released), 0, 1, 0, 1},
+  {&__pyx_n_u_num_slabs, __pyx_k_num_slabs, sizeof(__pyx_k_num_slabs), 0, 1, 0, 1},
   {&__pyx_n_s_params, __pyx_k_params, sizeof(__pyx_k_params), 0, 0, 1, 1},
   {&__pyx_n_u_params, __pyx_k_params, sizeof(__pyx_k_params), 0, 1, 0, 1},
   {&__pyx_n_s_pyx_vtable, __pyx_k_pyx_vtable, sizeof(__pyx_k_pyx_vtable), 0, 0, 1, 1},
@@ -4012,6 +5270,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_reduce_ex, __pyx_k_reduce_ex, sizeof(__pyx_k_reduce_ex), 0, 0, 1, 1},
   {&__pyx_n_s_run, __pyx_k_run, sizeof(__pyx_k_run), 0, 0, 1, 1},
   {&__pyx_n_s_schedule, __pyx_k_schedule, sizeof(__pyx_k_schedule), 0, 0, 1, 1},
+  {&__pyx_kp_u_scheduler_was_not_started_call_r, __pyx_k_scheduler_was_not_started_call_r, sizeof(__pyx_k_scheduler_was_not_started_call_r), 0, 1, 0, 0},
   {&__pyx_n_s_setstate, __pyx_k_setstate, sizeof(__pyx_k_setstate), 0, 0, 1, 1},
   {&__pyx_n_s_setstate_cython, __pyx_k_setstate_cython, sizeof(__pyx_k_setstate_cython), 0, 0, 1, 1},
   {&__pyx_n_u_sim, __pyx_k_sim, sizeof(__pyx_k_sim), 0, 1, 0, 1},
@@ -4022,10 +5281,13 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_sys, __pyx_k_sys, sizeof(__pyx_k_sys), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_time, __pyx_k_time, sizeof(__pyx_k_time), 0, 0, 1, 1},
+  {&__pyx_n_s_until, __pyx_k_until, sizeof(__pyx_k_until), 0, 0, 1, 1},
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 2, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(0, 77, __pyx_L1_error)
+  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(0, 144, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(1, 2, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -4035,38 +5297,81 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
+  /* "model/des/cyscheduler.pyx":144
+ *         """
+ *         if not self.c_scheduler.is_started():
+ *             raise RuntimeError('scheduler was not started, call run() first')             # <<<<<<<<<<<<<<
+ *         if until < self.c_scheduler.get_time():
+ *             raise ValueError(f'horizon {until} is in the past')
+ */
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_u_scheduler_was_not_started_call_r); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 144, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__2);
+  __Pyx_GIVEREF(__pyx_tuple__2);
+
   /* "(tree fragment)":2
  * def __reduce_cython__(self):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 2, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__2);
-  __Pyx_GIVEREF(__pyx_tuple__2);
+  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__3);
+  __Pyx_GIVEREF(__pyx_tuple__3);
 
   /* "(tree fragment)":4
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")
  * def __setstate_cython__(self, __pyx_state):
  *     raise TypeError("no default __reduce__ due to non-trivial __cinit__")             # <<<<<<<<<<<<<<
  */
-  __pyx_tuple__3 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__3)) __PYX_ERR(0, 4, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__3);
-  __Pyx_GIVEREF(__pyx_tuple__3);
+  __pyx_tuple__4 = PyTuple_Pack(1, __pyx_kp_s_no_default___reduce___due_to_non); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__4);
+  __Pyx_GIVEREF(__pyx_tuple__4);
 
-  /* "model/des/cyscheduler.pyx":31
+  /* "model/des/cyscheduler.pyx":156
+ *         return 0
+ *     if max_events <= 0:
+ *         raise ValueError('max events must be positive')             # <<<<<<<<<<<<<<
+ *     return max_events
+ */
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_max_events_must_be_positive); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(0, 156, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__5);
+  __Pyx_GIVEREF(__pyx_tuple__5);
+
+  /* "model/des/cyscheduler.pyx":36
  * 
  * 
  * Context = namedtuple('Context', ('sim', 'state', 'params'))             # <<<<<<<<<<<<<<
  * 
+ * # Event allocator counters: number of slabs (each slab is a single heap
+ */
+  __pyx_tuple__6 = PyTuple_Pack(3, __pyx_n_u_sim, __pyx_n_u_state, __pyx_n_u_params); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__6);
+  __Pyx_GIVEREF(__pyx_tuple__6);
+  __pyx_tuple__7 = PyTuple_Pack(2, __pyx_n_u_Context, __pyx_tuple__6); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+
+  /* "model/des/cyscheduler.pyx":42
+ * # since the scheduler was created:
+ * EventPoolStats = namedtuple('EventPoolStats', (
+ *     'num_slabs', 'capacity', 'num_in_use', 'num_acquired', 'num_released'))             # <<<<<<<<<<<<<<
+ * 
  * 
  */
-  __pyx_tuple__4 = PyTuple_Pack(3, __pyx_n_u_sim, __pyx_n_u_state, __pyx_n_u_params); if (unlikely(!__pyx_tuple__4)) __PYX_ERR(1, 31, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__4);
-  __Pyx_GIVEREF(__pyx_tuple__4);
-  __pyx_tuple__5 = PyTuple_Pack(2, __pyx_n_u_Context, __pyx_tuple__4); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 31, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__5);
-  __Pyx_GIVEREF(__pyx_tuple__5);
+  __pyx_tuple__8 = PyTuple_Pack(5, __pyx_n_u_num_slabs, __pyx_n_u_capacity, __pyx_n_u_num_in_use, __pyx_n_u_num_acquired, __pyx_n_u_num_released); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "model/des/cyscheduler.pyx":41
+ * # allocation), pool capacity, events in use, events acquired and released
+ * # since the scheduler was created:
+ * EventPoolStats = namedtuple('EventPoolStats', (             # <<<<<<<<<<<<<<
+ *     'num_slabs', 'capacity', 'num_in_use', 'num_acquired', 'num_released'))
+ * 
+ */
+  __pyx_tuple__9 = PyTuple_Pack(2, __pyx_n_u_EventPoolStats, __pyx_tuple__8); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(0, 41, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -4075,7 +5380,8 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
 }
 
 static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(1, 1, __pyx_L1_error);
+  if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -4121,21 +5427,22 @@ static int __Pyx_modinit_type_init_code(void) {
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
   __pyx_vtabptr_5model_3des_11cyscheduler_CyScheduler = &__pyx_vtable_5model_3des_11cyscheduler_CyScheduler;
-  __pyx_vtable_5model_3des_11cyscheduler_CyScheduler.get_time = (float (*)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int __pyx_skip_dispatch))__pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time;
-  __pyx_vtable_5model_3des_11cyscheduler_CyScheduler.schedule = (int (*)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, float, int, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule *__pyx_optional_args))__pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule;
-  __pyx_vtable_5model_3des_11cyscheduler_CyScheduler.cancel = (void (*)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int, int __pyx_skip_dispatch))__pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel;
+  __pyx_vtable_5model_3des_11cyscheduler_CyScheduler.get_time = (double (*)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int __pyx_skip_dispatch))__pyx_f_5model_3des_11cyscheduler_11CyScheduler_get_time;
+  __pyx_vtable_5model_3des_11cyscheduler_CyScheduler.schedule = (model::des::EventHandle (*)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, double, int, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_schedule *__pyx_optional_args))__pyx_f_5model_3des_11cyscheduler_11CyScheduler_schedule;
+  __pyx_vtable_5model_3des_11cyscheduler_CyScheduler.cancel = (void (*)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, model::des::EventHandle, int __pyx_skip_dispatch))__pyx_f_5model_3des_11cyscheduler_11CyScheduler_cancel;
   __pyx_vtable_5model_3des_11cyscheduler_CyScheduler.stop = (void (*)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int __pyx_skip_dispatch))__pyx_f_5model_3des_11cyscheduler_11CyScheduler_stop;
-  __pyx_vtable_5model_3des_11cyscheduler_CyScheduler.run = (void (*)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int __pyx_skip_dispatch))__pyx_f_5model_3des_11cyscheduler_11CyScheduler_run;
-  if (PyType_Ready(&__pyx_type_5model_3des_11cyscheduler_CyScheduler) < 0) __PYX_ERR(1, 34, __pyx_L1_error)
+  __pyx_vtable_5model_3des_11cyscheduler_CyScheduler.run = (PyObject *(*)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_run *__pyx_optional_args))__pyx_f_5model_3des_11cyscheduler_11CyScheduler_run;
+  __pyx_vtable_5model_3des_11cyscheduler_CyScheduler.continue_until = (PyObject *(*)(struct __pyx_obj_5model_3des_11cyscheduler_CyScheduler *, double, int __pyx_skip_dispatch, struct __pyx_opt_args_5model_3des_11cyscheduler_11CyScheduler_continue_until *__pyx_optional_args))__pyx_f_5model_3des_11cyscheduler_11CyScheduler_continue_until;
+  if (PyType_Ready(&__pyx_type_5model_3des_11cyscheduler_CyScheduler) < 0) __PYX_ERR(0, 45, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_5model_3des_11cyscheduler_CyScheduler.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_5model_3des_11cyscheduler_CyScheduler.tp_dictoffset && __pyx_type_5model_3des_11cyscheduler_CyScheduler.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_5model_3des_11cyscheduler_CyScheduler.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (__Pyx_SetVtable(__pyx_type_5model_3des_11cyscheduler_CyScheduler.tp_dict, __pyx_vtabptr_5model_3des_11cyscheduler_CyScheduler) < 0) __PYX_ERR(1, 34, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_CyScheduler, (PyObject *)&__pyx_type_5model_3des_11cyscheduler_CyScheduler) < 0) __PYX_ERR(1, 34, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5model_3des_11cyscheduler_CyScheduler) < 0) __PYX_ERR(1, 34, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_type_5model_3des_11cyscheduler_CyScheduler.tp_dict, __pyx_vtabptr_5model_3des_11cyscheduler_CyScheduler) < 0) __PYX_ERR(0, 45, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_CyScheduler, (PyObject *)&__pyx_type_5model_3des_11cyscheduler_CyScheduler) < 0) __PYX_ERR(0, 45, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_5model_3des_11cyscheduler_CyScheduler) < 0) __PYX_ERR(0, 45, __pyx_L1_error)
   __pyx_ptype_5model_3des_11cyscheduler_CyScheduler = &__pyx_type_5model_3des_11cyscheduler_CyScheduler;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -4154,14 +5461,13 @@ static int __Pyx_modinit_type_import_code(void) {
   /*--- Type import code ---*/
   __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
+  __pyx_ptype_7cpython_4type_type = __Pyx_ImportType_0_29_37(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type", 
   #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
-  sizeof(PyTypeObject),
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyTypeObject),
   #else
-  sizeof(PyHeapTypeObject),
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_0_29_37(PyHeapTypeObject),
   #endif
-  __Pyx_ImportType_CheckSize_Warn);
-   if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_ImportType_CheckSize_Warn_0_29_37); if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -4306,38 +5612,36 @@ if (!__Pyx_RefNanny) {
 }
 #endif
   __Pyx_RefNannySetupContext("__Pyx_PyMODINIT_FUNC PyInit_cyscheduler(void)", 0);
-  if (__Pyx_check_binary_version() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_check_binary_version() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #ifdef __Pxy_PyFrame_Initialize_Offsets
   __Pxy_PyFrame_Initialize_Offsets();
   #endif
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
   #ifdef __Pyx_CyFunction_USED
-  if (__pyx_CyFunction_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_CyFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_FusedFunction_USED
-  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_FusedFunction_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_Coroutine_USED
-  if (__pyx_Coroutine_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_Coroutine_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_Generator_USED
-  if (__pyx_Generator_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_Generator_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_AsyncGen_USED
-  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_AsyncGen_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   #ifdef __Pyx_StopAsyncIteration_USED
-  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__pyx_StopAsyncIteration_init() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   /*--- Library function declarations ---*/
   /*--- Threads initialization code ---*/
-  #if defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
-  #ifdef WITH_THREAD /* Python build with threading support? */
+  #if defined(WITH_THREAD) && PY_VERSION_HEX < 0x030700F0 && defined(__PYX_FORCE_INIT_THREADS) && __PYX_FORCE_INIT_THREADS
   PyEval_InitThreads();
   #endif
-  #endif
   /*--- Module creation code ---*/
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __pyx_m = __pyx_pyinit_module;
@@ -4348,46 +5652,46 @@ if (!__Pyx_RefNanny) {
   #else
   __pyx_m = PyModule_Create(&__pyx_moduledef);
   #endif
-  if (unlikely(!__pyx_m)) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (unlikely(!__pyx_m)) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
-  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
   Py_INCREF(__pyx_d);
-  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
   Py_INCREF(__pyx_b);
-  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_cython_runtime = PyImport_AddModule((char *) "cython_runtime"); if (unlikely(!__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
   Py_INCREF(__pyx_cython_runtime);
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(1, 1, __pyx_L1_error);
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Initialize various global constants etc. ---*/
-  if (__Pyx_InitGlobals() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_InitGlobals() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #if PY_MAJOR_VERSION < 3 && (__PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_DEFAULT)
-  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_init_sys_getdefaultencoding_params() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
   if (__pyx_module_is_main_model__des__cyscheduler) {
-    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+    if (PyObject_SetAttr(__pyx_m, __pyx_n_s_name, __pyx_n_s_main) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   }
   #if PY_MAJOR_VERSION >= 3
   {
-    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(1, 1, __pyx_L1_error)
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
     if (!PyDict_GetItemString(modules, "model.des.cyscheduler")) {
-      if (unlikely(PyDict_SetItemString(modules, "model.des.cyscheduler", __pyx_m) < 0)) __PYX_ERR(1, 1, __pyx_L1_error)
+      if (unlikely(PyDict_SetItemString(modules, "model.des.cyscheduler", __pyx_m) < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
     }
   }
   #endif
   /*--- Builtin init code ---*/
-  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_InitCachedBuiltins() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Constants init code ---*/
-  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_InitCachedConstants() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   /*--- Global type/function init code ---*/
   (void)__Pyx_modinit_global_init_code();
   (void)__Pyx_modinit_variable_export_code();
   (void)__Pyx_modinit_function_export_code();
-  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(1, 1, __pyx_L1_error)
-  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_init_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely(__Pyx_modinit_type_import_code() < 0)) __PYX_ERR(0, 1, __pyx_L1_error)
   (void)__Pyx_modinit_variable_import_code();
   (void)__Pyx_modinit_function_import_code();
   /*--- Execution code ---*/
   #if defined(__Pyx_Generator_USED) || defined(__Pyx_Coroutine_USED)
-  if (__Pyx_patch_abc() < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (__Pyx_patch_abc() < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   #endif
 
   /* "model/des/cyscheduler.pyx":1
@@ -4395,92 +5699,122 @@ if (!__Pyx_RefNanny) {
  * from collections import namedtuple
  * 
  */
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_sys, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_sys, 0, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sys, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_sys, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "model/des/cyscheduler.pyx":2
  * import sys
  * from collections import namedtuple             # <<<<<<<<<<<<<<
  * 
- * from model.des.Scheduler cimport Scheduler
+ * from model.des.Scheduler cimport EventHandle, Scheduler
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_s_namedtuple);
   __Pyx_GIVEREF(__pyx_n_s_namedtuple);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_namedtuple);
-  __pyx_t_2 = __Pyx_Import(__pyx_n_s_collections, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_collections, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_namedtuple); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 2, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_namedtuple); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 2, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_namedtuple, __pyx_t_1) < 0) __PYX_ERR(1, 2, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_namedtuple, __pyx_t_1) < 0) __PYX_ERR(0, 2, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "model/des/cyscheduler.pyx":7
- * from cpython.ref cimport PyObject
+  /* "model/des/cyscheduler.pyx":9
+ * from libc.stdint cimport int64_t
  * 
- * from model.des.pyscheduler import SpecType             # <<<<<<<<<<<<<<
+ * from model.des.pyscheduler import ExitReason, SpecType             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __pyx_t_2 = PyList_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_INCREF(__pyx_n_s_ExitReason);
+  __Pyx_GIVEREF(__pyx_n_s_ExitReason);
+  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_ExitReason);
   __Pyx_INCREF(__pyx_n_s_SpecType);
   __Pyx_GIVEREF(__pyx_n_s_SpecType);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_SpecType);
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_model_des_pyscheduler, __pyx_t_2, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 7, __pyx_L1_error)
+  PyList_SET_ITEM(__pyx_t_2, 1, __pyx_n_s_SpecType);
+  __pyx_t_1 = __Pyx_Import(__pyx_n_s_model_des_pyscheduler, __pyx_t_2, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_ExitReason); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ExitReason, __pyx_t_2) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_SpecType, __pyx_t_2) < 0) __PYX_ERR(1, 7, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_SpecType, __pyx_t_2) < 0) __PYX_ERR(0, 9, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "model/des/cyscheduler.pyx":31
+  /* "model/des/cyscheduler.pyx":36
  * 
  * 
  * Context = namedtuple('Context', ('sim', 'state', 'params'))             # <<<<<<<<<<<<<<
  * 
- * 
+ * # Event allocator counters: number of slabs (each slab is a single heap
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_namedtuple); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 31, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_namedtuple); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 36, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 31, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 36, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Context, __pyx_t_2) < 0) __PYX_ERR(1, 31, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_Context, __pyx_t_2) < 0) __PYX_ERR(0, 36, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "model/des/cyscheduler.pyx":64
- *         self.c_scheduler.attach_init_handler(<void*>handler)
+  /* "model/des/cyscheduler.pyx":41
+ * # allocation), pool capacity, events in use, events acquired and released
+ * # since the scheduler was created:
+ * EventPoolStats = namedtuple('EventPoolStats', (             # <<<<<<<<<<<<<<
+ *     'num_slabs', 'capacity', 'num_in_use', 'num_acquired', 'num_released'))
  * 
- *     def bind(self, int code, object handler, spec_type=SpecType.EMPTY):             # <<<<<<<<<<<<<<
- *         cdef void* handler_ptr = <void*>handler
- *         if spec_type is SpecType.EMPTY:
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 64, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_namedtuple); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_EMPTY); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 64, __pyx_L1_error)
+
+  /* "model/des/cyscheduler.pyx":42
+ * # since the scheduler was created:
+ * EventPoolStats = namedtuple('EventPoolStats', (
+ *     'num_slabs', 'capacity', 'num_in_use', 'num_acquired', 'num_released'))             # <<<<<<<<<<<<<<
+ * 
+ * 
+ */
+  __pyx_t_1 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_k_ = __pyx_t_1;
-  __Pyx_GIVEREF(__pyx_t_1);
-  __pyx_t_1 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_EventPoolStats, __pyx_t_1) < 0) __PYX_ERR(0, 41, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "model/des/cyscheduler.pyx":75
+ *         self.c_scheduler.attach_init_handler(<void*>handler)
+ * 
+ *     def bind(self, int code, object handler, spec_type=SpecType.EMPTY):             # <<<<<<<<<<<<<<
+ *         if code < 0:
+ *             raise ValueError(f'event code must be non-negative, {code} given')
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_SpecType); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_EMPTY); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 75, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_k_ = __pyx_t_2;
+  __Pyx_GIVEREF(__pyx_t_2);
+  __pyx_t_2 = 0;
 
   /* "model/des/cyscheduler.pyx":1
  * import sys             # <<<<<<<<<<<<<<
  * from collections import namedtuple
  * 
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(1, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /*--- Wrapped vars code ---*/
 
@@ -4553,6 +5887,29 @@ static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
     return result;
 }
 
+/* PyCFunctionFastCall */
+#if CYTHON_FAST_PYCCALL
+static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
+    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
+    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
+    PyObject *self = PyCFunction_GET_SELF(func);
+    int flags = PyCFunction_GET_FLAGS(func);
+    assert(PyCFunction_Check(func));
+    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
+    assert(nargs >= 0);
+    assert(nargs == 0 || args != NULL);
+    /* _PyCFunction_FastCallDict() must not be called with an exception set,
+       because it may clear it (directly or indirectly) and so the
+       caller loses its exception */
+    assert(!PyErr_Occurred());
+    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
+        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
+    } else {
+        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
+    }
+}
+#endif
+
 /* PyFunctionFastCall */
 #if CYTHON_FAST_PYCALL
 static PyObject* __Pyx_PyFunction_FastCallNoKw(PyCodeObject *co, PyObject **args, Py_ssize_t na,
@@ -4676,7 +6033,7 @@ done:
 #if CYTHON_COMPILING_IN_CPYTHON
 static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
     PyObject *result;
-    ternaryfunc call = func->ob_type->tp_call;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
     if (unlikely(!call))
         return PyObject_Call(func, arg, kw);
     if (unlikely(Py_EnterRecursiveCall((char*)" while calling a Python object")))
@@ -4690,7 +6047,36 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg
     }
     return result;
 }
-#endif
+#endif
+
+/* PyObjectCall2Args */
+static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
+    PyObject *args, *result = NULL;
+    #if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyFunction_FastCall(function, args, 2);
+    }
+    #endif
+    #if CYTHON_FAST_PYCCALL
+    if (__Pyx_PyFastCFunction_Check(function)) {
+        PyObject *args[2] = {arg1, arg2};
+        return __Pyx_PyCFunction_FastCall(function, args, 2);
+    }
+    #endif
+    args = PyTuple_New(2);
+    if (unlikely(!args)) goto done;
+    Py_INCREF(arg1);
+    PyTuple_SET_ITEM(args, 0, arg1);
+    Py_INCREF(arg2);
+    PyTuple_SET_ITEM(args, 1, arg2);
+    Py_INCREF(function);
+    result = __Pyx_PyObject_Call(function, args, NULL);
+    Py_DECREF(args);
+    Py_DECREF(function);
+done:
+    return result;
+}
 
 /* PyObjectCallMethO */
 #if CYTHON_COMPILING_IN_CPYTHON
@@ -4712,51 +6098,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 }
 #endif
 
-/* PyObjectCallNoArg */
-#if CYTHON_COMPILING_IN_CPYTHON
-static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
-#if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(func)) {
-        return __Pyx_PyFunction_FastCall(func, NULL, 0);
-    }
-#endif
-#ifdef __Pyx_CyFunction_USED
-    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
-#else
-    if (likely(PyCFunction_Check(func)))
-#endif
-    {
-        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
-            return __Pyx_PyObject_CallMethO(func, NULL);
-        }
-    }
-    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
-}
-#endif
-
-/* PyCFunctionFastCall */
-#if CYTHON_FAST_PYCCALL
-static CYTHON_INLINE PyObject * __Pyx_PyCFunction_FastCall(PyObject *func_obj, PyObject **args, Py_ssize_t nargs) {
-    PyCFunctionObject *func = (PyCFunctionObject*)func_obj;
-    PyCFunction meth = PyCFunction_GET_FUNCTION(func);
-    PyObject *self = PyCFunction_GET_SELF(func);
-    int flags = PyCFunction_GET_FLAGS(func);
-    assert(PyCFunction_Check(func));
-    assert(METH_FASTCALL == (flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_KEYWORDS | METH_STACKLESS)));
-    assert(nargs >= 0);
-    assert(nargs == 0 || args != NULL);
-    /* _PyCFunction_FastCallDict() must not be called with an exception set,
-       because it may clear it (directly or indirectly) and so the
-       caller loses its exception */
-    assert(!PyErr_Occurred());
-    if ((PY_VERSION_HEX < 0x030700A0) || unlikely(flags & METH_KEYWORDS)) {
-        return (*((__Pyx_PyCFunctionFastWithKeywords)(void*)meth)) (self, args, nargs, NULL);
-    } else {
-        return (*((__Pyx_PyCFunctionFast)(void*)meth)) (self, args, nargs);
-    }
-}
-#endif
-
 /* PyObjectCallOneArg */
 #if CYTHON_COMPILING_IN_CPYTHON
 static PyObject* __Pyx__PyObject_CallOneArg(PyObject *func, PyObject *arg) {
@@ -4779,7 +6120,7 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
         if (likely(PyCFunction_GET_FLAGS(func) & METH_O)) {
             return __Pyx_PyObject_CallMethO(func, arg);
 #if CYTHON_FAST_PYCCALL
-        } else if (PyCFunction_GET_FLAGS(func) & METH_FASTCALL) {
+        } else if (__Pyx_PyFastCFunction_Check(func)) {
             return __Pyx_PyCFunction_FastCall(func, &arg, 1);
 #endif
         }
@@ -4797,35 +6138,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
 }
 #endif
 
-/* PyObjectCall2Args */
-static CYTHON_UNUSED PyObject* __Pyx_PyObject_Call2Args(PyObject* function, PyObject* arg1, PyObject* arg2) {
-    PyObject *args, *result = NULL;
-    #if CYTHON_FAST_PYCALL
-    if (PyFunction_Check(function)) {
-        PyObject *args[2] = {arg1, arg2};
-        return __Pyx_PyFunction_FastCall(function, args, 2);
-    }
-    #endif
-    #if CYTHON_FAST_PYCCALL
-    if (__Pyx_PyFastCFunction_Check(function)) {
-        PyObject *args[2] = {arg1, arg2};
-        return __Pyx_PyCFunction_FastCall(function, args, 2);
-    }
-    #endif
-    args = PyTuple_New(2);
-    if (unlikely(!args)) goto done;
-    Py_INCREF(arg1);
-    PyTuple_SET_ITEM(args, 0, arg1);
-    Py_INCREF(arg2);
-    PyTuple_SET_ITEM(args, 1, arg2);
-    Py_INCREF(function);
-    result = __Pyx_PyObject_Call(function, args, NULL);
-    Py_DECREF(args);
-    Py_DECREF(function);
-done:
-    return result;
-}
-
 /* PyErrFetchRestore */
 #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
@@ -4861,9 +6173,7 @@ static void __Pyx_WriteUnraisable(const char *name, CYTHON_UNUSED int clineno,
     PyGILState_STATE state;
     if (nogil)
         state = PyGILState_Ensure();
-#ifdef _MSC_VER
-    else state = (PyGILState_STATE)-1;
-#endif
+    else state = (PyGILState_STATE)0;
 #endif
     __Pyx_PyThreadState_assign
     __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
@@ -5135,6 +6445,245 @@ bad:
     return -1;
 }
 
+/* CIntToDigits */
+static const char DIGIT_PAIRS_10[2*10*10+1] = {
+    "00010203040506070809"
+    "10111213141516171819"
+    "20212223242526272829"
+    "30313233343536373839"
+    "40414243444546474849"
+    "50515253545556575859"
+    "60616263646566676869"
+    "70717273747576777879"
+    "80818283848586878889"
+    "90919293949596979899"
+};
+static const char DIGIT_PAIRS_8[2*8*8+1] = {
+    "0001020304050607"
+    "1011121314151617"
+    "2021222324252627"
+    "3031323334353637"
+    "4041424344454647"
+    "5051525354555657"
+    "6061626364656667"
+    "7071727374757677"
+};
+static const char DIGITS_HEX[2*16+1] = {
+    "0123456789abcdef"
+    "0123456789ABCDEF"
+};
+
+/* BuildPyUnicode */
+static PyObject* __Pyx_PyUnicode_BuildFromAscii(Py_ssize_t ulength, char* chars, int clength,
+                                                int prepend_sign, char padding_char) {
+    PyObject *uval;
+    Py_ssize_t uoffset = ulength - clength;
+#if CYTHON_USE_UNICODE_INTERNALS
+    Py_ssize_t i;
+#if CYTHON_PEP393_ENABLED
+    void *udata;
+    uval = PyUnicode_New(ulength, 127);
+    if (unlikely(!uval)) return NULL;
+    udata = PyUnicode_DATA(uval);
+#else
+    Py_UNICODE *udata;
+    uval = PyUnicode_FromUnicode(NULL, ulength);
+    if (unlikely(!uval)) return NULL;
+    udata = PyUnicode_AS_UNICODE(uval);
+#endif
+    if (uoffset > 0) {
+        i = 0;
+        if (prepend_sign) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, 0, '-');
+            i++;
+        }
+        for (; i < uoffset; i++) {
+            __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, i, padding_char);
+        }
+    }
+    for (i=0; i < clength; i++) {
+        __Pyx_PyUnicode_WRITE(PyUnicode_1BYTE_KIND, udata, uoffset+i, chars[i]);
+    }
+#else
+    {
+        PyObject *sign = NULL, *padding = NULL;
+        uval = NULL;
+        if (uoffset > 0) {
+            prepend_sign = !!prepend_sign;
+            if (uoffset > prepend_sign) {
+                padding = PyUnicode_FromOrdinal(padding_char);
+                if (likely(padding) && uoffset > prepend_sign + 1) {
+                    PyObject *tmp;
+                    PyObject *repeat = PyInt_FromSsize_t(uoffset - prepend_sign);
+                    if (unlikely(!repeat)) goto done_or_error;
+                    tmp = PyNumber_Multiply(padding, repeat);
+                    Py_DECREF(repeat);
+                    Py_DECREF(padding);
+                    padding = tmp;
+                }
+                if (unlikely(!padding)) goto done_or_error;
+            }
+            if (prepend_sign) {
+                sign = PyUnicode_FromOrdinal('-');
+                if (unlikely(!sign)) goto done_or_error;
+            }
+        }
+        uval = PyUnicode_DecodeASCII(chars, clength, NULL);
+        if (likely(uval) && padding) {
+            PyObject *tmp = PyNumber_Add(padding, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+        if (likely(uval) && sign) {
+            PyObject *tmp = PyNumber_Add(sign, uval);
+            Py_DECREF(uval);
+            uval = tmp;
+        }
+done_or_error:
+        Py_XDECREF(padding);
+        Py_XDECREF(sign);
+    }
+#endif
+    return uval;
+}
+
+/* CIntToPyUnicode */
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_From_int(int value, Py_ssize_t width, char padding_char, char format_char) {
+    char digits[sizeof(int)*3+2];
+    char *dpos, *end = digits + sizeof(int)*3+2;
+    const char *hex_digits = DIGITS_HEX;
+    Py_ssize_t length, ulength;
+    int prepend_sign, last_one_off;
+    int remaining;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (format_char == 'X') {
+        hex_digits += 16;
+        format_char = 'x';
+    }
+    remaining = value;
+    last_one_off = 0;
+    dpos = end;
+    do {
+        int digit_pos;
+        switch (format_char) {
+        case 'o':
+            digit_pos = abs((int)(remaining % (8*8)));
+            remaining = (int) (remaining / (8*8));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_8 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 8);
+            break;
+        case 'd':
+            digit_pos = abs((int)(remaining % (10*10)));
+            remaining = (int) (remaining / (10*10));
+            dpos -= 2;
+            memcpy(dpos, DIGIT_PAIRS_10 + digit_pos * 2, 2);
+            last_one_off = (digit_pos < 10);
+            break;
+        case 'x':
+            *(--dpos) = hex_digits[abs((int)(remaining % 16))];
+            remaining = (int) (remaining / 16);
+            break;
+        default:
+            assert(0);
+            break;
+        }
+    } while (unlikely(remaining != 0));
+    if (last_one_off) {
+        assert(*dpos == '0');
+        dpos++;
+    }
+    length = end - dpos;
+    ulength = length;
+    prepend_sign = 0;
+    if (!is_unsigned && value <= neg_one) {
+        if (padding_char == ' ' || width <= length + 1) {
+            *(--dpos) = '-';
+            ++length;
+        } else {
+            prepend_sign = 1;
+        }
+        ++ulength;
+    }
+    if (width > ulength) {
+        ulength = width;
+    }
+    if (ulength == 1) {
+        return PyUnicode_FromOrdinal(*dpos);
+    }
+    return __Pyx_PyUnicode_BuildFromAscii(ulength, dpos, (int) length, prepend_sign, padding_char);
+}
+
+/* JoinPyUnicode */
+static PyObject* __Pyx_PyUnicode_Join(PyObject* value_tuple, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      CYTHON_UNUSED Py_UCS4 max_char) {
+#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    PyObject *result_uval;
+    int result_ukind;
+    Py_ssize_t i, char_pos;
+    void *result_udata;
+#if CYTHON_PEP393_ENABLED
+    result_uval = PyUnicode_New(result_ulength, max_char);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
+    result_udata = PyUnicode_DATA(result_uval);
+#else
+    result_uval = PyUnicode_FromUnicode(NULL, result_ulength);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = sizeof(Py_UNICODE);
+    result_udata = PyUnicode_AS_UNICODE(result_uval);
+#endif
+    char_pos = 0;
+    for (i=0; i < value_count; i++) {
+        int ukind;
+        Py_ssize_t ulength;
+        void *udata;
+        PyObject *uval = PyTuple_GET_ITEM(value_tuple, i);
+        if (unlikely(__Pyx_PyUnicode_READY(uval)))
+            goto bad;
+        ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
+        if (unlikely(!ulength))
+            continue;
+        if (unlikely(char_pos + ulength < 0))
+            goto overflow;
+        ukind = __Pyx_PyUnicode_KIND(uval);
+        udata = __Pyx_PyUnicode_DATA(uval);
+        if (!CYTHON_PEP393_ENABLED || ukind == result_ukind) {
+            memcpy((char *)result_udata + char_pos * result_ukind, udata, (size_t) (ulength * result_ukind));
+        } else {
+            #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030300F0 || defined(_PyUnicode_FastCopyCharacters)
+            _PyUnicode_FastCopyCharacters(result_uval, char_pos, uval, 0, ulength);
+            #else
+            Py_ssize_t j;
+            for (j=0; j < ulength; j++) {
+                Py_UCS4 uchar = __Pyx_PyUnicode_READ(ukind, udata, j);
+                __Pyx_PyUnicode_WRITE(result_ukind, result_udata, char_pos+j, uchar);
+            }
+            #endif
+        }
+        char_pos += ulength;
+    }
+    return result_uval;
+overflow:
+    PyErr_SetString(PyExc_OverflowError, "join() result is too long for a Python string");
+bad:
+    Py_DECREF(result_uval);
+    return NULL;
+#else
+    result_ulength++;
+    value_count++;
+    return PyUnicode_Join(__pyx_empty_unicode, value_tuple);
+#endif
+}
+
 /* RaiseException */
 #if PY_MAJOR_VERSION < 3
 static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb,
@@ -5272,13 +6821,7 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
     }
     PyErr_SetObject(type, value);
     if (tb) {
-#if CYTHON_COMPILING_IN_PYPY
-        PyObject *tmp_type, *tmp_value, *tmp_tb;
-        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
-        Py_INCREF(tb);
-        PyErr_Restore(tmp_type, tmp_value, tb);
-        Py_XDECREF(tmp_tb);
-#else
+#if CYTHON_FAST_THREAD_STATE
         PyThreadState *tstate = __Pyx_PyThreadState_Current;
         PyObject* tmp_tb = tstate->curexc_traceback;
         if (tb != tmp_tb) {
@@ -5286,6 +6829,12 @@ static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject
             tstate->curexc_traceback = tb;
             Py_XDECREF(tmp_tb);
         }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
 #endif
     }
 bad:
@@ -5294,6 +6843,28 @@ bad:
 }
 #endif
 
+/* PyObjectCallNoArg */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+#if CYTHON_FAST_PYCALL
+    if (PyFunction_Check(func)) {
+        return __Pyx_PyFunction_FastCall(func, NULL, 0);
+    }
+#endif
+#if defined(__Pyx_CyFunction_USED) && defined(NDEBUG)
+    if (likely(PyCFunction_Check(func) || __Pyx_CyFunction_Check(func)))
+#else
+    if (likely(PyCFunction_Check(func)))
+#endif
+    {
+        if (likely(PyCFunction_GET_FLAGS(func) & METH_NOARGS)) {
+            return __Pyx_PyObject_CallMethO(func, NULL);
+        }
+    }
+    return __Pyx_PyObject_Call(func, __pyx_empty_tuple, NULL);
+}
+#endif
+
 /* PyObject_GenericGetAttrNoDict */
 #if CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP && PY_VERSION_HEX < 0x03070000
 static PyObject *__Pyx_RaiseGenericGetAttributeError(PyTypeObject *tp, PyObject *attr_name) {
@@ -5429,17 +7000,35 @@ static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
 static int __Pyx_setup_reduce(PyObject* type_obj) {
     int ret = 0;
     PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
     PyObject *object_reduce_ex = NULL;
     PyObject *reduce = NULL;
     PyObject *reduce_ex = NULL;
     PyObject *reduce_cython = NULL;
     PyObject *setstate = NULL;
     PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_n_s_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
 #if CYTHON_USE_PYTYPE_LOOKUP
-    if (_PyType_Lookup((PyTypeObject*)type_obj, __pyx_n_s_getstate)) goto __PYX_GOOD;
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_getstate);
 #else
-    if (PyObject_HasAttr(type_obj, __pyx_n_s_getstate)) goto __PYX_GOOD;
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_n_s_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
 #endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
 #if CYTHON_USE_PYTYPE_LOOKUP
     object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_n_s_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
 #else
@@ -5484,6 +7073,8 @@ __PYX_GOOD:
 #if !CYTHON_USE_PYTYPE_LOOKUP
     Py_XDECREF(object_reduce);
     Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
 #endif
     Py_XDECREF(reduce);
     Py_XDECREF(reduce_ex);
@@ -5494,16 +7085,18 @@ __PYX_GOOD:
 }
 
 /* TypeImport */
-#ifndef __PYX_HAVE_RT_ImportType
-#define __PYX_HAVE_RT_ImportType
-static PyTypeObject *__Pyx_ImportType(PyObject *module, const char *module_name, const char *class_name,
-    size_t size, enum __Pyx_ImportType_CheckSize check_size)
+#ifndef __PYX_HAVE_RT_ImportType_0_29_37
+#define __PYX_HAVE_RT_ImportType_0_29_37
+static PyTypeObject *__Pyx_ImportType_0_29_37(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_0_29_37 check_size)
 {
     PyObject *result = 0;
     char warning[200];
     Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
 #ifdef Py_LIMITED_API
     PyObject *py_basicsize;
+    PyObject *py_itemsize;
 #endif
     result = PyObject_GetAttrString(module, class_name);
     if (!result)
@@ -5516,6 +7109,7 @@ static PyTypeObject *__Pyx_ImportType(PyObject *module, const char *module_name,
     }
 #ifndef Py_LIMITED_API
     basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
 #else
     py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
     if (!py_basicsize)
@@ -5525,22 +7119,37 @@ static PyTypeObject *__Pyx_ImportType(PyObject *module, const char *module_name,
     py_basicsize = 0;
     if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
         goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
 #endif
-    if ((size_t)basicsize < size) {
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
         PyErr_Format(PyExc_ValueError,
             "%.200s.%.200s size changed, may indicate binary incompatibility. "
             "Expected %zd from C header, got %zd from PyObject",
             module_name, class_name, size, basicsize);
         goto bad;
     }
-    if (check_size == __Pyx_ImportType_CheckSize_Error && (size_t)basicsize != size) {
+    if (check_size == __Pyx_ImportType_CheckSize_Error_0_29_37 && (size_t)basicsize != size) {
         PyErr_Format(PyExc_ValueError,
             "%.200s.%.200s size changed, may indicate binary incompatibility. "
             "Expected %zd from C header, got %zd from PyObject",
             module_name, class_name, size, basicsize);
         goto bad;
     }
-    else if (check_size == __Pyx_ImportType_CheckSize_Warn && (size_t)basicsize > size) {
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_0_29_37 && (size_t)basicsize > size) {
         PyOS_snprintf(warning, sizeof(warning),
             "%s.%s size changed, may indicate binary incompatibility. "
             "Expected %zd from C header, got %zd from PyObject",
@@ -5635,7 +7244,7 @@ static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
 
 /* CLineInTraceback */
 #ifndef CYTHON_CLINE_IN_TRACEBACK
-static int __Pyx_CLineForTraceback(CYTHON_NCP_UNUSED PyThreadState *tstate, int c_line) {
+static int __Pyx_CLineForTraceback(CYTHON_UNUSED PyThreadState *tstate, int c_line) {
     PyObject *use_cline;
     PyObject *ptype, *pvalue, *ptraceback;
 #if CYTHON_COMPILING_IN_CPYTHON
@@ -5665,7 +7274,7 @@ static int __Pyx_CLineForTraceback(CYTHON_NCP_UNUSED PyThreadState *tstate, int
     }
     if (!use_cline) {
         c_line = 0;
-        PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
+        (void) PyObject_SetAttr(__pyx_cython_runtime, __pyx_n_s_cline_in_traceback, Py_False);
     }
     else if (use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
         c_line = 0;
@@ -5759,33 +7368,40 @@ static void __pyx_insert_code_object(int code_line, PyCodeObject* code_object) {
 #include "compile.h"
 #include "frameobject.h"
 #include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
 static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
             const char *funcname, int c_line,
             int py_line, const char *filename) {
-    PyCodeObject *py_code = 0;
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
     #if PY_MAJOR_VERSION < 3
+    PyObject *py_srcfile = NULL;
     py_srcfile = PyString_FromString(filename);
-    #else
-    py_srcfile = PyUnicode_FromString(filename);
-    #endif
     if (!py_srcfile) goto bad;
+    #endif
     if (c_line) {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
         #else
         py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
         #endif
     }
     else {
         #if PY_MAJOR_VERSION < 3
         py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
+        if (!py_funcname) goto bad;
         #endif
     }
-    if (!py_funcname) goto bad;
+    #if PY_MAJOR_VERSION < 3
     py_code = __Pyx_PyCode_New(
         0,
         0,
@@ -5804,11 +7420,16 @@ static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
         __pyx_empty_bytes  /*PyObject *lnotab*/
     );
     Py_DECREF(py_srcfile);
-    Py_DECREF(py_funcname);
+    #else
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    #endif
+    Py_XDECREF(py_funcname);  // XDECREF since it's only set on Py3 if cline
     return py_code;
 bad:
-    Py_XDECREF(py_srcfile);
     Py_XDECREF(py_funcname);
+    #if PY_MAJOR_VERSION < 3
+    Py_XDECREF(py_srcfile);
+    #endif
     return NULL;
 }
 static void __Pyx_AddTraceback(const char *funcname, int c_line,
@@ -5816,14 +7437,24 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
     PyCodeObject *py_code = 0;
     PyFrameObject *py_frame = 0;
     PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
     if (c_line) {
         c_line = __Pyx_CLineForTraceback(tstate, c_line);
     }
     py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
     if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
         py_code = __Pyx_CreateCodeObjectForTraceback(
             funcname, c_line, py_line, filename);
-        if (!py_code) goto bad;
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
         __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
     }
     py_frame = PyFrame_New(
@@ -5831,71 +7462,47 @@ static void __Pyx_AddTraceback(const char *funcname, int c_line,
         py_code,           /*PyCodeObject *code,*/
         __pyx_d,    /*PyObject *globals,*/
         0                  /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
-
-/* CIntFromPyVerify */
-#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
-#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
-    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
-#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
-    {\
-        func_type value = func_value;\
-        if (sizeof(target_type) < sizeof(func_type)) {\
-            if (unlikely(value != (func_type) (target_type) value)) {\
-                func_type zero = 0;\
-                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
-                    return (target_type) -1;\
-                if (is_unsigned && unlikely(value < zero))\
-                    goto raise_neg_overflow;\
-                else\
-                    goto raise_overflow;\
-            }\
-        }\
-        return (target_type) value;\
-    }
-
-/* CIntToPy */
-static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
-    const int neg_one = (int) ((int) 0 - (int) 1), const_zero = (int) 0;
-    const int is_unsigned = neg_one > const_zero;
-    if (is_unsigned) {
-        if (sizeof(int) < sizeof(long)) {
-            return PyInt_FromLong((long) value);
-        } else if (sizeof(int) <= sizeof(unsigned long)) {
-            return PyLong_FromUnsignedLong((unsigned long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
-#endif
-        }
-    } else {
-        if (sizeof(int) <= sizeof(long)) {
-            return PyInt_FromLong((long) value);
-#ifdef HAVE_LONG_LONG
-        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-            return PyLong_FromLongLong((PY_LONG_LONG) value);
-#endif
-        }
-    }
-    {
-        int one = 1; int little = (int)*(unsigned char *)&one;
-        unsigned char *bytes = (unsigned char *)&value;
-        return _PyLong_FromByteArray(bytes, sizeof(int),
-                                     little, !is_unsigned);
-    }
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
 }
 
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
 /* CIntFromPy */
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-    const int neg_one = (int) ((int) 0 - (int) 1), const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -5946,7 +7553,7 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -6082,9 +7689,326 @@ raise_neg_overflow:
     return (int) -1;
 }
 
+/* CIntFromPy */
+static CYTHON_INLINE int64_t __Pyx_PyInt_As_int64_t(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int64_t neg_one = (int64_t) -1, const_zero = (int64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+#if PY_MAJOR_VERSION < 3
+    if (likely(PyInt_Check(x))) {
+        if (sizeof(int64_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int64_t, long, PyInt_AS_LONG(x))
+        } else {
+            long val = PyInt_AS_LONG(x);
+            if (is_unsigned && unlikely(val < 0)) {
+                goto raise_neg_overflow;
+            }
+            return (int64_t) val;
+        }
+    } else
+#endif
+    if (likely(PyLong_Check(x))) {
+        if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int64_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int64_t, digit, digits[0])
+                case 2:
+                    if (8 * sizeof(int64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 2 * PyLong_SHIFT) {
+                            return (int64_t) (((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 3 * PyLong_SHIFT) {
+                            return (int64_t) (((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) >= 4 * PyLong_SHIFT) {
+                            return (int64_t) (((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0]));
+                        }
+                    }
+                    break;
+            }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+            if (unlikely(Py_SIZE(x) < 0)) {
+                goto raise_neg_overflow;
+            }
+#else
+            {
+                int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+                if (unlikely(result < 0))
+                    return (int64_t) -1;
+                if (unlikely(result == 1))
+                    goto raise_neg_overflow;
+            }
+#endif
+            if (sizeof(int64_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, unsigned long, PyLong_AsUnsignedLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+#endif
+            }
+        } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+            const digit* digits = ((PyLongObject*)x)->ob_digit;
+            switch (Py_SIZE(x)) {
+                case  0: return (int64_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int64_t, sdigit, (sdigit) (-(sdigit)digits[0]))
+                case  1: __PYX_VERIFY_RETURN_INT(int64_t,  digit, +digits[0])
+                case -2:
+                    if (8 * sizeof(int64_t) - 1 > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if (8 * sizeof(int64_t) > 1 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (int64_t) ((((((int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if (8 * sizeof(int64_t) - 1 > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if (8 * sizeof(int64_t) > 2 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (int64_t) ((((((((int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if (8 * sizeof(int64_t) - 1 > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int64_t) (((int64_t)-1)*(((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if (8 * sizeof(int64_t) > 3 * PyLong_SHIFT) {
+                        if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
+                            __PYX_VERIFY_RETURN_INT(int64_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int64_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (int64_t) ((((((((((int64_t)digits[3]) << PyLong_SHIFT) | (int64_t)digits[2]) << PyLong_SHIFT) | (int64_t)digits[1]) << PyLong_SHIFT) | (int64_t)digits[0])));
+                        }
+                    }
+                    break;
+            }
+#endif
+            if (sizeof(int64_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, long, PyLong_AsLong(x))
+#ifdef HAVE_LONG_LONG
+            } else if (sizeof(int64_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int64_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+#endif
+            }
+        }
+        {
+#if CYTHON_COMPILING_IN_PYPY && !defined(_PyLong_AsByteArray)
+            PyErr_SetString(PyExc_RuntimeError,
+                            "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
+#else
+            int64_t val;
+            PyObject *v = __Pyx_PyNumber_IntOrLong(x);
+ #if PY_MAJOR_VERSION < 3
+            if (likely(v) && !PyLong_Check(v)) {
+                PyObject *tmp = v;
+                v = PyNumber_Long(tmp);
+                Py_DECREF(tmp);
+            }
+ #endif
+            if (likely(v)) {
+                int one = 1; int is_little = (int)*(unsigned char *)&one;
+                unsigned char *bytes = (unsigned char *)&val;
+                int ret = _PyLong_AsByteArray((PyLongObject *)v,
+                                              bytes, sizeof(val),
+                                              is_little, !is_unsigned);
+                Py_DECREF(v);
+                if (likely(!ret))
+                    return val;
+            }
+#endif
+            return (int64_t) -1;
+        }
+    } else {
+        int64_t val;
+        PyObject *tmp = __Pyx_PyNumber_IntOrLong(x);
+        if (!tmp) return (int64_t) -1;
+        val = __Pyx_PyInt_As_int64_t(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int64_t");
+    return (int64_t) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int64_t");
+    return (int64_t) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_int64_t(int64_t value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int64_t neg_one = (int64_t) -1, const_zero = (int64_t) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int64_t) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(int64_t) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int64_t) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int64_t) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(int64_t) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(int64_t),
+                                     little, !is_unsigned);
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyInt_From_enum__model_3a__3a_des_3a__3a_ExitReason(enum model::des::ExitReason value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const enum model::des::ExitReason neg_one = (enum model::des::ExitReason) -1, const_zero = (enum model::des::ExitReason) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(enum model::des::ExitReason) < sizeof(long)) {
+            return PyInt_FromLong((long) value);
+        } else if (sizeof(enum model::des::ExitReason) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(enum model::des::ExitReason) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(enum model::des::ExitReason) <= sizeof(long)) {
+            return PyInt_FromLong((long) value);
+#ifdef HAVE_LONG_LONG
+        } else if (sizeof(enum model::des::ExitReason) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+#endif
+        }
+    }
+    {
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&value;
+        return _PyLong_FromByteArray(bytes, sizeof(enum model::des::ExitReason),
+                                     little, !is_unsigned);
+    }
+}
+
 /* CIntToPy */
 static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
-    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
     if (is_unsigned) {
         if (sizeof(long) < sizeof(long)) {
@@ -6115,7 +8039,14 @@ static CYTHON_INLINE PyObject* __Pyx_PyInt_From_long(long value) {
 
 /* CIntFromPy */
 static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
-    const long neg_one = (long) ((long) 0 - (long) 1), const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
@@ -6166,7 +8097,7 @@ static CYTHON_INLINE long __Pyx_PyInt_As_long(PyObject *x) {
                     break;
             }
 #endif
-#if CYTHON_COMPILING_IN_CPYTHON
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
             if (unlikely(Py_SIZE(x) < 0)) {
                 goto raise_neg_overflow;
             }
@@ -6404,11 +8335,33 @@ static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObj
 
 /* CheckBinaryVersion */
 static int __Pyx_check_binary_version(void) {
-    char ctversion[4], rtversion[4];
-    PyOS_snprintf(ctversion, 4, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
-    PyOS_snprintf(rtversion, 4, "%s", Py_GetVersion());
-    if (ctversion[0] != rtversion[0] || ctversion[2] != rtversion[2]) {
+    char ctversion[5];
+    int same=1, i, found_dot;
+    const char* rt_from_call = Py_GetVersion();
+    PyOS_snprintf(ctversion, 5, "%d.%d", PY_MAJOR_VERSION, PY_MINOR_VERSION);
+    found_dot = 0;
+    for (i = 0; i < 4; i++) {
+        if (!ctversion[i]) {
+            same = (rt_from_call[i] < '0' || rt_from_call[i] > '9');
+            break;
+        }
+        if (rt_from_call[i] != ctversion[i]) {
+            same = 0;
+            break;
+        }
+    }
+    if (!same) {
+        char rtversion[5] = {'\0'};
         char message[200];
+        for (i=0; i<4; ++i) {
+            if (rt_from_call[i] == '.') {
+                if (found_dot) break;
+                found_dot = 1;
+            } else if (rt_from_call[i] < '0' || rt_from_call[i] > '9') {
+                break;
+            }
+            rtversion[i] = rt_from_call[i];
+        }
         PyOS_snprintf(message, sizeof(message),
                       "compiletime version %s of module '%.100s' "
                       "does not match runtime version %s",
@@ -6666,6 +8619,23 @@ static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
   Py_DECREF(x);
   return ival;
 }
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+#if PY_MAJOR_VERSION < 3
+  } else if (likely(PyInt_CheckExact(o))) {
+    return PyInt_AS_LONG(o);
+#endif
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyInt_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
 static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
   return b ? __Pyx_NewRef(Py_True) : __Pyx_NewRef(Py_False);
 }
@@ -1,35 +1,46 @@
 import sys
 from collections import namedtuple
 
-from model.des.Scheduler cimport Scheduler
+from model.des.Scheduler cimport EventHandle, Scheduler
 from cpython.ref cimport PyObject
+from libc.math cimport INFINITY
+from libc.stdint cimport int64_t
 
-from model.des.pyscheduler import SpecType
+from model.des.pyscheduler import ExitReason, SpecType
 
 
-cdef void cy_callback_e(void *handler, PyObject *scheduler):
-    ctx = (<object>scheduler).get_context()
-    (<object>handler)(ctx)
+# Callbacks share a signature, so that the scheduler resolves the callback
+# of a handler when it is bound. Context is read from the C attribute, not
+# with a Python method call:
 
+cdef void cy_callback_e(void *handler, PyObject *scheduler, int index,
+                        PyObject *att):
+    (<object>handler)((<CyScheduler>scheduler).c_context)
 
-cdef void cy_callback_i(void *handler, PyObject *scheduler, int index):
-    ctx = (<object>scheduler).get_context()
-    (<object>handler)(ctx, index)
 
+cdef void cy_callback_i(void *handler, PyObject *scheduler, int index,
+                        PyObject *att):
+    (<object>handler)((<CyScheduler>scheduler).c_context, index)
 
-cdef void cy_callback_p(void *handler, PyObject *scheduler, PyObject *att):
-    ctx = (<object>scheduler).get_context()
-    (<object>handler)(ctx, <object>att)
+
+cdef void cy_callback_p(void *handler, PyObject *scheduler, int index,
+                        PyObject *att):
+    (<object>handler)((<CyScheduler>scheduler).c_context, <object>att)
 
 
 cdef void cy_callback_ip(void *handler, PyObject *scheduler, int index,
                          PyObject *att):
-    ctx = (<object>scheduler).get_context()
-    (<object>handler)(ctx, index, <object>att)
+    (<object>handler)((<CyScheduler>scheduler).c_context, index, <object>att)
 
 
 Context = namedtuple('Context', ('sim', 'state', 'params'))
 
+# Event allocator counters: number of slabs (each slab is a single heap
+# allocation), pool capacity, events in use, events acquired and released
+# since the scheduler was created:
+EventPoolStats = namedtuple('EventPoolStats', (
+    'num_slabs', 'capacity', 'num_in_use', 'num_acquired', 'num_released'))
+
 
 cdef class CyScheduler:
     cdef Scheduler *c_scheduler
@@ -62,6 +73,8 @@ cdef class CyScheduler:
         self.c_scheduler.attach_init_handler(<void*>handler)
 
     def bind(self, int code, object handler, spec_type=SpecType.EMPTY):
+        if code < 0:
+            raise ValueError(f'event code must be non-negative, {code} given')
         cdef void* handler_ptr = <void*>handler
         if spec_type is SpecType.EMPTY:
             self.c_scheduler.attach_handler_e(code, handler_ptr)
@@ -76,11 +89,12 @@ cdef class CyScheduler:
         # noinspection PyAttributeOutsideInit
         self.c_context = Context(self, state, params)
 
-    cpdef float get_time(self):
+    cpdef double get_time(self):
         return self.c_scheduler.get_time()
 
-    cpdef int schedule(self, float time, int code, int index = -1,
-                       object att = None):
+    cpdef EventHandle schedule(self, double time, int code, int index = -1,
+                               object att = None):
+        """Schedule an event and return its handle (a positive integer)."""
         cdef PyObject *c_att = NULL
 
         if att is not None:
@@ -88,11 +102,56 @@ cdef class CyScheduler:
 
         return self.c_scheduler.schedule(time, code, index, c_att)
 
-    cpdef void cancel(self, int event_id):
-        self.c_scheduler.cancel(event_id)
+    cpdef void cancel(self, EventHandle handle):
+        """Cancel a pending event, stale and negative handles are ignored."""
+        self.c_scheduler.cancel(handle)
 
     cpdef void stop(self):
         self.c_scheduler.stop()
 
-    cpdef void run(self):
-        self.c_scheduler.run()
+    @property
+    def started(self):
+        return self.c_scheduler.is_started()
+
+    @property
+    def exit_reason(self):
+        return ExitReason(self.c_scheduler.get_exit_reason())
+
+    def get_event_pool_stats(self):
+        pool = &self.c_scheduler.get_event_pool()
+        return EventPoolStats(
+            pool.get_num_slabs(), pool.get_capacity(), pool.get_num_in_use(),
+            pool.get_num_acquired(), pool.get_num_released())
+
+    cpdef object run(self, until=None, max_events=None):
+        """Run init handlers and events up to `until` (inclusive).
+
+        Later events stay in the queue, use `continue_until()` to go on.
+        Horizon and `max_events` are checked in the C++ loop.
+
+        :return: `ExitReason`
+        """
+        cdef double c_until = INFINITY if until is None else until
+        cdef int64_t c_max_events = _get_c_max_events(max_events)
+        return ExitReason(self.c_scheduler.run(c_until, c_max_events))
+
+    cpdef object continue_until(self, double until, max_events=None):
+        """Continue a started run up to `until`, keeping queue and state.
+
+        :return: `ExitReason`
+        """
+        if not self.c_scheduler.is_started():
+            raise RuntimeError('scheduler was not started, call run() first')
+        if until < self.c_scheduler.get_time():
+            raise ValueError(f'horizon {until} is in the past')
+        cdef int64_t c_max_events = _get_c_max_events(max_events)
+        return ExitReason(
+            self.c_scheduler.continue_until(until, c_max_events))
+
+
+cdef int64_t _get_c_max_events(max_events) except? -1:
+    if max_events is None:
+        return 0
+    if max_events <= 0:
+        raise ValueError('max events must be positive')
+    return max_events
@@ -10,6 +10,14 @@ class SpecType(Enum):
     INDEX_OBJECT = 3
 
 
+class ExitReason(Enum):
+    """Why `run()` or `continue_until()` returned."""
+    EMPTY = 0
+    STOPPED = 1
+    TIME_LIMIT = 2
+    MAX_EVENTS = 3
+
+
 class Event:
     def __init__(self, event_id, code, time, index, att):
         self.event_id = event_id
@@ -17,6 +25,7 @@ class Event:
         self.time = time
         self.index = index
         self.att = att
+        self.cancelled = False
 
     def as_tuple(self):
         return self.event_id, self.code, self.time, self.index, self.att
@@ -34,7 +43,9 @@ class Event:
 class EventQueue:
     def __init__(self):
         self._queue = []
-        self._cancelled_events = set()
+        # Only pending events are kept here, so IDs of fired or cancelled
+        # events are ignored by remove(), and nothing is left behind:
+        self._pending_events = {}
         self._next_event_id = 1
 
     def push(self, code, time, index, att):
@@ -42,20 +53,29 @@ class EventQueue:
         self._next_event_id += 1
         ev = Event(event_id, code, time, index, att)
         heapq.heappush(self._queue, ev)
+        self._pending_events[event_id] = ev
         return event_id
 
     def pop(self):
         while len(self._queue) > 0:
             event = heapq.heappop(self._queue)
-            event_id = event.event_id
-            if event_id not in self._cancelled_events:
+            if not event.cancelled:
+                del self._pending_events[event.event_id]
                 return event.as_tuple()
-            self._cancelled_events.remove(event_id)
+        return None
+
+    def peek_time(self):
+        """Get time of the next not cancelled event, or None if empty."""
+        while len(self._queue) > 0:
+            if not self._queue[0].cancelled:
+                return self._queue[0].time
+            heapq.heappop(self._queue)
         return None
 
     def remove(self, event_id):
-        if event_id not in self._cancelled_events:
-            self._cancelled_events.add(event_id)
+        event = self._pending_events.pop(event_id, None)
+        if event is not None:
+            event.cancelled = True
 
     def empty(self):
         return len(self._queue) == 0
@@ -76,6 +96,8 @@ class PyScheduler:
         self._context = Context(self, None, None)
         self._init_handlers = []
         self._stopped = False
+        self._started = False
+        self._exit_reason = ExitReason.EMPTY
 
     def bind(self, code, handler, spec_type=SpecType.EMPTY):
         if code not in self._handlers:
@@ -109,20 +131,70 @@ class PyScheduler:
     def cancel(self, event_id):
         self._queue.remove(event_id)
 
-    def run(self):
+    @property
+    def started(self):
+        return self._started
+
+    @property
+    def exit_reason(self):
+        return self._exit_reason
+
+    def run(self, until=None, max_events=None):
+        """Run init handlers and events up to `until` (inclusive).
+
+        Later events stay in the queue, use `continue_until()` to go on.
+
+        :param until: time horizon, by default runs until no events left
+        :param max_events: maximum number of events to run
+        :return: `ExitReason`
+        """
+        _check_max_events(max_events)
         self._time = 0.0
+        self._started = True
+        self._stopped = False
         for handler in self._init_handlers:
             handler(self.context)
-
-        while not self._queue.empty() and not self._stopped:
-            event_tuple = self._queue.pop()
-            if event_tuple is None:
+        return self._run_until(
+            float('inf') if until is None else until, max_events)
+
+    def continue_until(self, until, max_events=None):
+        """Continue a started run up to `until`, keeping queue and state.
+
+        :param max_events: maximum number of events run by this call
+        :return: `ExitReason`
+        """
+        if not self._started:
+            raise RuntimeError('scheduler was not started, call run() first')
+        if until < self._time:
+            raise ValueError(f'horizon {until} is in the past')
+        _check_max_events(max_events)
+        self._stopped = False
+        return self._run_until(until, max_events)
+
+    def _run_until(self, until, max_events):
+        budget = float('inf') if max_events is None else max_events
+        self._exit_reason = ExitReason.EMPTY
+        while True:
+            if self._stopped:
+                self._exit_reason = ExitReason.STOPPED
                 break
-            _, code, time, index, att = event_tuple
+            time = self._queue.peek_time()
+            if time is None:
+                break
+            if time > until:
+                # Event crossing the horizon stays in the queue:
+                self._time = until
+                self._exit_reason = ExitReason.TIME_LIMIT
+                break
+            _, code, time, index, att = self._queue.pop()
             self._time = time
             for descriptor in self._handlers.get(code, []):
                 self._call_handler(descriptor, index, att)
-        print('after loop: num_events=', self._queue.size())
+            budget -= 1
+            if budget <= 0:
+                self._exit_reason = ExitReason.MAX_EVENTS
+                break
+        return self._exit_reason
 
     def stop(self):
         self._stopped = True
@@ -137,3 +209,8 @@ class PyScheduler:
             handler(self.context, att)
         else:
             handler(self.context)
+
+
+def _check_max_events(max_events):
+    if max_events is not None and max_events <= 0:
+        raise ValueError('max events must be positive')
@@ -6,6 +6,8 @@ DEFAULT_PARAMS = {
     'scene.max_distance': 15.0,
     'scene.position_update_interval': 0.1,
     'scene.max_num_rounds': -1,
+    'scene.max_time': -1.0,
+    'scene.max_events': -1,
     'scene.verbose': False,
 
     'reader.position': (0, 0, 10.0),
@@ -13,6 +13,8 @@ class SceneSpec:
     max_distance: float = 15.0
     position_update_interval: float = 0.1
     max_num_rounds: int = -1
+    max_time: float = -1.0
+    max_events: int = -1
     verbose: int = True
 
 
@@ -25,7 +27,10 @@ class Scene:
         self.max_distance = spec.max_distance
         self.position_update_interval = spec.position_update_interval
         self.max_num_rounds = spec.max_num_rounds
+        self.max_time = spec.max_time
+        self.max_events = spec.max_events
         self.verbose = spec.verbose
+        self.exit_reason = None
 
 
 def create_scene(spec: SceneSpec) -> Scene:
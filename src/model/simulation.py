@@ -40,8 +40,11 @@ def simulate_single_pass(parameters: SceneSpec, scheduler_class=SCHEDULER_CLASS)
     scheduler.bind(ev.TAG_POWER_ON, eh.tag_power_on)
     scheduler.bind(ev.TAG_POWER_OFF, eh.tag_power_off)
 
-    # Run:
-    scheduler.run()  # TODO: pass max_time here!
+    # Run (negative max_time and max_events mean no limits):
+    scene.exit_reason = scheduler.run(
+        until=parameters.max_time if parameters.max_time >= 0 else None,
+        max_events=parameters.max_events if parameters.max_events > 0
+        else None)
 
     return scheduler.time, scene
 
@@ -0,0 +1,628 @@
+import random
+import threading
+
+import pytest
+
+from pysim.des import Kernel, Simulator, DES, DESModel, Logger, StopReason, \
+    Replicator
+from pysim.profiling import merge_profiles
+from pysim.queues import QUEUES
+
+PING = 0
+BIND = 1
+
+
+class Recorder(DESModel):
+    def __init__(self, sim):
+        super().__init__(sim)
+        self.calls = []
+
+    def handle(self, value):
+        self.calls.append((self.sim.sim_time, value))
+
+
+def test_dispatch_does_not_grow_handlers_lists():
+    def extra(value):
+        extra.calls += 1
+    extra.calls = 0
+
+    kernel = Kernel(handlers={PING: [extra]})
+    sim = Simulator(kernel, Recorder)
+    sim.bind(PING, sim.data.handle)
+    for i in range(5):
+        sim.schedule(PING, i, args=(i,))
+    kernel.run(sim, init=None, fin=None)
+
+    assert sim.data.calls == [(i, i) for i in range(5)]
+    assert extra.calls == 5
+    assert sim.num_events == 10
+
+
+def test_bind_during_run_updates_dispatch():
+    kernel = Kernel()
+    sim = Simulator(kernel, Recorder)
+
+    def init(sim_):
+        sim_.schedule(BIND, 1)
+        sim_.schedule(PING, 2, args=('A',))
+
+    sim.bind(BIND, lambda: sim.bind(PING, sim.data.handle))
+    kernel.run(sim, init=init, fin=None)
+
+    assert sim.data.calls == [(2, 'A')]
+
+
+def test_cancelled_events_are_compacted():
+    kernel = Kernel(compaction_threshold=0.5)
+    sim = Simulator(kernel, Recorder)
+    sim.bind(PING, sim.data.handle)
+
+    event_ids = [sim.schedule(PING, i + 1, args=(i,)) for i in range(100)]
+    for event_id in event_ids[:60]:
+        sim.cancel(event_id)
+
+    assert kernel.num_compactions == 1
+    assert kernel.num_removed < 60
+    kernel.run(sim, init=None, fin=None)
+
+    assert sim.data.calls == [(i + 1, i) for i in range(60, 100)]
+    assert kernel.num_removed == 0
+
+
+@pytest.mark.parametrize('queue', sorted(QUEUES))
+def test_queue_backends_dispatch_events_in_same_order(queue):
+    def init(sim_):
+        for i in range(50):
+            sim_.schedule(PING, (i * 7) % 11 * 0.1, args=(i,))
+
+    calls = []
+    for queue_name in ('heap', queue):
+        kernel = Kernel(queue=queue_name)
+        sim = Simulator(kernel, Recorder)
+        sim.bind(PING, sim.data.handle)
+        kernel.run(sim, init=init, fin=None)
+        calls.append(sim.data.calls)
+
+    assert calls[0] == calls[1]
+
+
+@pytest.mark.parametrize('backend', ['python', 'cython'])
+def test_event_codes_must_be_non_negative_integers(backend):
+    if backend == 'cython':
+        pytest.importorskip('model.des.cyscheduler')
+        from pysim.cykernel import CythonKernel
+        kernel = CythonKernel()
+    else:
+        kernel = Kernel()
+    with pytest.raises(TypeError):
+        kernel.bind('ping', print)
+    with pytest.raises(TypeError):
+        kernel.bind(-1, print)
+    for code in (-1, 'x'):
+        with pytest.raises(TypeError):
+            kernel.add_event(code, 1.0)
+        with pytest.raises(TypeError):
+            kernel.add_events([(PING, 1.0, ()), (code, 2.0, ())])
+        with pytest.raises(TypeError):
+            kernel.add_periodic(code, 1.0)
+        with pytest.raises(TypeError):
+            kernel.add_timeout(code, 1.0)
+
+
+def test_logger_formats_lazily_and_only_enabled_levels(capsys):
+    kernel = Kernel()
+    logger = Logger(kernel)
+    logger.level = Logger.Level.DEBUG
+
+    def fail():
+        raise AssertionError('disabled message must not be built')
+
+    logger.trace(fail)
+    logger.trace('%s', fail)
+    logger.debug('tag %s turned %s', 3, 'on')
+    logger.info(lambda: 'entered start area')
+
+    out = capsys.readouterr().out
+    assert 'tag 3 turned on' in out
+    assert 'entered start area' in out
+    assert 'TRACE' not in out
+
+
+def _run_ticker(**setup):
+    kernel = Kernel()
+    sim = Simulator(kernel, Recorder)
+    sim.bind(PING, lambda value: (sim.data.handle(value),
+                                  sim.schedule(PING, 1, args=(value + 1,))))
+    kernel.setup(**setup)
+    reason = kernel.run(sim, init=lambda sim_: sim_.schedule(PING, args=(0,)),
+                        fin=None)
+    return kernel, sim, reason
+
+
+def test_sim_time_limit_keeps_crossing_event_in_queue():
+    kernel, sim, reason = _run_ticker(sim_time_limit=4.5)
+    assert reason is StopReason.SIM_TIME_LIMIT
+    assert [value for _, value in sim.data.calls] == [0, 1, 2, 3, 4]
+    assert sim.sim_time == 4.5
+    assert not kernel.empty
+
+
+@pytest.mark.parametrize('queue', sorted(QUEUES))
+def test_events_scheduled_after_horizon_stop_run_in_order(queue):
+    kernel = Kernel(queue=queue, verify_order=True)
+    sim = Simulator(kernel, Recorder)
+    sim.bind(PING, sim.data.handle)
+    for i in range(200):
+        sim.schedule(PING, i * 0.001, args=(i,))
+    for i in range(10):
+        sim.schedule(PING, 5 + 0.37 * i, args=(200 + i,))
+
+    assert sim.run(until=2.0) is StopReason.SIM_TIME_LIMIT
+    for i, delay in enumerate((0.5, 1.4, 2.3, 3.2, 4.1)):
+        sim.schedule(PING, delay, args=(300 + i,))
+    assert sim.continue_until(100) is StopReason.EMPTY
+
+    times = [time for time, _ in sim.data.calls]
+    assert times == sorted(times)
+    assert len(times) == 215
+
+
+def test_max_events_stops_run():
+    kernel, sim, reason = _run_ticker(max_events=7)
+    assert reason is StopReason.MAX_EVENTS
+    assert len(sim.data.calls) == 7
+
+
+def test_wall_time_limit_stops_run():
+    kernel, sim, reason = _run_ticker(wall_time_limit=0.01,
+                                      wall_check_interval=10)
+    assert reason is StopReason.WALL_TIME_LIMIT
+    assert len(sim.data.calls) % 10 == 0
+
+
+def test_empty_queue_stops_run():
+    kernel = Kernel()
+    sim = Simulator(kernel, Recorder)
+    assert kernel.run(sim, init=None, fin=None) is StopReason.EMPTY
+
+
+def _init_pings(sim):
+    for i in range(sim.params.num_pings):
+        sim.schedule(PING, i, args=(i,))
+
+
+class PingModel(Recorder):
+    def initialize(self):
+        self.sim.bind(PING, self.handle)
+
+
+def _extract_calls(ret):
+    return ret.data.calls
+
+
+def test_simulate_iter_streams_indexed_results_from_processes():
+    params = [{'num_pings': n} for n in range(1, 6)]
+    results = dict(DES.simulate_iter(PingModel, _init_pings, params,
+                                     pool_size=2, extract=_extract_calls))
+
+    assert sorted(results) == list(range(5))
+    for index, calls in results.items():
+        assert calls == [(i, i) for i in range(index + 1)]
+
+    assert DES.simulate(PingModel, _init_pings, params, pool='process',
+                        extract=_extract_calls) == \
+        [results[index] for index in range(5)]
+
+
+class RandomWalk(Recorder):
+    """Each step moves by a random value and schedules the next step."""
+    def initialize(self):
+        self.sim.bind(PING, self.step)
+
+    def step(self, position):
+        self.handle(position)
+        position += self.sim.rng.random()
+        self.sim.schedule(PING, 1, args=(position,))
+
+
+def _init_walk(sim):
+    sim.schedule(PING, args=(0,))
+
+
+def _walk_until(sim, sim_time_limit):
+    sim.kernel.setup(sim_time_limit=sim_time_limit)
+    sim.kernel.resume(sim)
+    return sim.data.calls
+
+
+def test_restored_snapshot_continues_exactly_as_original():
+    sim = Simulator(Kernel(), RandomWalk, seed=1)
+    sim.kernel.start(sim, _init_walk)
+    _walk_until(sim, 10)
+    snapshot = sim.snapshot()
+
+    restored = snapshot.restore()
+    assert _walk_until(restored, 30) == _walk_until(sim, 30)
+
+
+def test_forks_continue_from_snapshot_with_own_rng():
+    sim = Simulator(Kernel(), RandomWalk, seed=1)
+    sim.kernel.start(sim, _init_walk)
+    prefix = list(_walk_until(sim, 10))
+
+    forks = sim.snapshot().fork(3, seeds=[5, 6, 5])
+    walks = [_walk_until(fork, 30) for fork in forks]
+
+    for walk in walks:
+        assert walk[:len(prefix)] == prefix
+        assert len(walk) == 31
+    assert walks[0] == walks[2]
+    assert walks[0] != walks[1]
+    assert sim.data.calls == prefix  # original simulation is not affected
+
+
+def test_simulate_forks_returns_result_per_fork():
+    rets = DES.simulate_forks(RandomWalk, fork_time=10, num_forks=4,
+                              initialize=_init_walk, sim_time_limit=20,
+                              seed=1, seeds=[1, 2, 3, 4])
+    assert len(rets) == 4
+    assert all(ret.sim_time == 20 for ret in rets)
+    assert len({ret.data.calls[-1] for ret in rets}) == 4
+
+
+def test_simulate_forks_passes_kernel_options():
+    rets = DES.simulate_forks(RandomWalk, fork_time=10, num_forks=2,
+                              initialize=_init_walk, sim_time_limit=20,
+                              seed=1, seeds=[1, 2], tick=1e-9, profile=True,
+                              compaction_threshold=0.25)
+    for ret in rets:
+        assert ret.data.sim.kernel.tick == 1e-9
+        assert ret.data.sim.kernel.compaction_threshold == 0.25
+        assert ret.profile.events['#0'].count == ret.data.sim.num_events
+        assert ret.data.sim.num_events == 21
+
+
+class ResettableWalk(RandomWalk):
+    def reset(self):
+        self.calls = []
+
+
+def _extract_walk(ret):
+    return ret.sim_time, ret.stop_reason, ret.data.calls
+
+
+@pytest.mark.parametrize('queue', list(QUEUES))
+def test_replications_match_fresh_simulations(queue):
+    seeds = [1, 2, 1, 3]
+    replicator = Replicator(ResettableWalk, _init_walk, sim_time_limit=20,
+                            queue=queue, logger_level=Logger.Level.WARNING)
+    sim = replicator.sim
+    rets = list(replicator.replicate(seeds, extract=_extract_walk))
+
+    assert replicator.sim is sim and replicator.num_runs == len(seeds)
+    assert rets == [DES.simulate(ResettableWalk, _init_walk, queue=queue,
+                                 sim_time_limit=20, seed=seed,
+                                 logger_level=Logger.Level.WARNING,
+                                 extract=_extract_walk)
+                    for seed in seeds]
+    assert rets[0] == rets[2] != rets[1]
+
+
+def test_schedule_many_returns_ids_and_keeps_order():
+    kernel = Kernel()
+    sim = Simulator(kernel, Recorder)
+    sim.bind(PING, sim.data.handle)
+    sim.schedule(PING, 0.5, args=('single',))
+    handles = sim.schedule_many([(PING, 1.0, ('a',)), (PING, 0.0, ('b',)),
+                                 (PING, 1.0, ('c',))])
+    sim.cancel(handles[2])
+    with pytest.raises(ValueError):
+        sim.schedule_many([(PING, 1.0, ('d',)), (PING, -1.0, ('e',))])
+
+    assert [Kernel.get_event_id(handle) for handle in handles] == [1, 2, 3]
+    kernel.run(sim, init=None, fin=None)
+    assert sim.data.calls == [(0.0, 'b'), (0.5, 'single'), (1.0, 'a')]
+
+
+def test_zero_delay_events_keep_time_and_id_order():
+    kernel = Kernel(verify_order=True)
+    sim = Simulator(kernel, Recorder)
+
+    def ping(value):
+        sim.data.handle(value)
+        if value == 'a':
+            # Zero-delay events must go after 'b', that has the same time
+            # but was scheduled earlier:
+            sim.schedule(PING, args=('c',))
+            sim.schedule(PING, 0, args=('d',))
+            sim.schedule(PING, 1, args=('f',))
+        elif value == 'c':
+            sim.schedule(PING, args=('e',))
+
+    sim.bind(PING, ping)
+    sim.schedule(PING, args=('start',))
+    sim.schedule(PING, 1, args=('a',))
+    sim.schedule(PING, 1, args=('b',))
+    cancelled = sim.schedule(PING, args=('cancelled',))
+    sim.cancel(cancelled)
+    kernel.run(sim, init=None, fin=None)
+
+    assert sim.data.calls == [(0, 'start'), (1, 'a'), (1, 'b'), (1, 'c'),
+                              (1, 'd'), (1, 'e'), (2, 'f')]
+    assert kernel.num_removed == 0
+
+
+def test_delay_lost_in_float_addition_keeps_fifo_order():
+    kernel = Kernel(verify_order=True)
+    sim = Simulator(kernel, Recorder)
+
+    def ping(value):
+        sim.data.handle(value)
+        if value == 'start':
+            sim.schedule(PING, args=('a',))
+            sim.schedule(PING, 1e-14, args=('b',))
+            sim.schedule_many([(PING, 1e-14, ('c',))])
+            sim.schedule_timeout(PING, 1e-14, args=('d',))
+
+    sim.bind(PING, ping)
+    sim.schedule(PING, 1000.0, args=('start',))
+    kernel.run(sim, init=None, fin=None)
+
+    assert sim.data.calls == [(1000.0, value)
+                              for value in ('start', 'a', 'b', 'c', 'd')]
+
+
+def test_verify_order_detects_misordered_events():
+    kernel = Kernel(verify_order=True)
+    kernel._check_order([1.0, 5])
+    with pytest.raises(RuntimeError):
+        kernel._check_order([1.0, 4])
+
+
+def test_profile_counts_events_handlers_and_skipped():
+    kernel = Kernel(profile=True)
+    sim = Simulator(kernel, Recorder)
+    sim.bind(PING, sim.data.handle)
+    sim.set_event_names({PING: 'PING'})
+    for i in range(5):
+        sim.schedule(PING, i, args=(i,))
+    sim.cancel(sim.schedule(PING, 2.5, args=(10,)))
+    kernel.run(sim, init=None, fin=None)
+
+    profile = kernel.profile
+    assert profile.events['PING'].count == 5
+    assert profile.events['PING'].max_queue_size == 4  # after first pop
+    assert profile.handlers['Recorder.handle'].count == 5
+    assert profile.num_skipped == 1
+    assert Kernel().profile is None
+
+
+def test_simulate_returns_mergeable_profiles():
+    rets = DES.simulate(PingModel, _init_pings,
+                        [{'num_pings': 2}, {'num_pings': 3}], profile=True)
+    merged = merge_profiles(ret.profile for ret in rets)
+    assert merged.events['#0'].count == 5
+    assert DES.simulate(PingModel, _init_pings, {'num_pings': 1}).profile \
+        is None
+
+
+def test_cancelling_fired_or_cancelled_handle_is_noop():
+    kernel = Kernel()
+    sim = Simulator(kernel, Recorder)
+    handles = []
+    sim.bind(PING, lambda value: (sim.data.handle(value),
+                                  kernel.remove_event(handles[0])))
+    handles.extend(sim.schedule(PING, i, args=(i,)) for i in range(3))
+
+    assert kernel.remove_event(handles[2])
+    assert not kernel.remove_event(handles[2])
+    assert not kernel.remove_event(None)
+    kernel.run(sim, init=None, fin=None)
+
+    assert sim.data.calls == [(0, 0), (1, 1)]
+    assert not kernel.remove_event(handles[1])
+    assert kernel.empty
+
+
+def test_legacy_integer_event_ids_can_be_cancelled():
+    kernel = Kernel()
+    sim = Simulator(kernel, Recorder)
+    sim.bind(PING, sim.data.handle)
+    handles = [sim.schedule(PING, i, args=(i,)) for i in range(3)]
+
+    assert kernel.remove_event(Kernel.get_event_id(handles[1]))
+    assert not kernel.remove_event(100)
+    kernel.run(sim, init=None, fin=None)
+    assert sim.data.calls == [(0, 0), (2, 2)]
+
+
+def test_tick_clock_orders_events_exactly():
+    # 0.7 + 0.1 < 0.8 in floats, so the event scheduled later runs first.
+    # In ticks both events come at the same time, and run in the order they
+    # were scheduled:
+    calls = {}
+    for tick in (None, 1e-12):
+        kernel = Kernel(tick=tick)
+        sim = Simulator(kernel, Recorder)
+        sim.bind(PING, sim.data.handle)
+        sim.bind(BIND, lambda: sim.schedule(PING, 0.1, args=('second',)))
+        sim.schedule(BIND, 0.7)
+        sim.schedule(PING, 0.8, args=('first',))
+        kernel.run(sim, init=None, fin=None)
+        calls[tick] = [value for _, value in sim.data.calls]
+        assert isinstance(sim.sim_time, float)
+
+    assert calls[None] == ['second', 'first']
+    assert calls[1e-12] == ['first', 'second']
+
+
+def test_tick_clock_sim_time_limit():
+    kernel = Kernel(tick=1e-9)
+    sim = Simulator(kernel, Recorder)
+    sim.bind(PING, lambda value: (sim.data.handle(value),
+                                  sim.schedule(PING, 1, args=(value + 1,))))
+    kernel.setup(sim_time_limit=4.5)
+    reason = kernel.run(sim, init=lambda sim_: sim_.schedule(PING, args=(0,)),
+                        fin=None)
+    assert reason is StopReason.SIM_TIME_LIMIT
+    assert sim.data.calls == [(float(i), i) for i in range(5)]
+    assert sim.sim_time == pytest.approx(4.5)
+
+
+def test_periodic_event_repeats_until_cancelled():
+    kernel = Kernel()
+    sim = Simulator(kernel, Recorder)
+    handle = sim.schedule_periodic(PING, 0.5, args=('tick',), delay=0)
+
+    def ping(value):
+        sim.data.handle(value)
+        if len(sim.data.calls) == 4:
+            sim.cancel(handle)
+
+    sim.bind(PING, ping)
+    kernel.run(sim, init=None, fin=None)
+    assert sim.data.calls == [(0, 'tick'), (0.5, 'tick'), (1.0, 'tick'),
+                              (1.5, 'tick')]
+    assert kernel.empty and kernel.num_removed == 0
+
+    kernel.setup(sim_time_limit=3.0)
+    handle = sim.schedule_periodic(PING, 1.0, args=('other',))
+    assert kernel.resume(sim) is StopReason.SIM_TIME_LIMIT
+    assert [call for call in sim.data.calls if call[1] == 'other'] == \
+        [(2.5, 'other')]
+    assert sim.cancel(handle) is None and kernel.empty
+
+
+@pytest.mark.parametrize('queue', ['heap', 'calendar'])
+@pytest.mark.parametrize('tick', [None, 1e-9])
+def test_timeouts_run_in_same_order_as_events(queue, tick):
+    """Mix events and mostly cancelled timeouts of very different delays."""
+    def run(use_timeouts):
+        rng = random.Random(1)
+        kernel = Kernel(queue=queue, tick=tick, verify_order=True,
+                        timer_resolution=1e-4)
+        sim = Simulator(kernel, Recorder)
+        schedule = sim.schedule_timeout if use_timeouts else sim.schedule
+        pending = []
+
+        def ping(value):
+            sim.data.handle(value)
+            if value >= 2000:
+                return
+            for i in range(2):
+                sim.schedule(PING, rng.choice((1e-4, 3e-4, 0.1)),
+                             args=(value * 2 + i,))
+            pending.append(schedule(BIND, rng.choice((5e-5, 2e-3, 1.0, 30.0)),
+                                    args=(-value,)))
+            if rng.random() < 0.9:
+                sim.cancel(pending.pop(rng.randrange(len(pending))))
+
+        sim.bind(PING, ping)
+        sim.bind(BIND, sim.data.handle)
+        sim.schedule(PING, args=(1,))
+        kernel.run(sim, init=None, fin=None)
+        return sim.data.calls
+
+    assert run(use_timeouts=True) == run(use_timeouts=False)
+
+
+def test_concurrent_simulations_on_threads_match_sequential_runs():
+    num_sims = 16
+    barrier = threading.Barrier(num_sims)
+
+    steps = []
+
+    def count_steps(position):
+        # Extra handler bound to the kernel of each simulation:
+        steps.append(position)
+
+    def init(sim):
+        barrier.wait(timeout=10)  # start all threads at once
+        _init_walk(sim)
+
+    def run(pool_size):
+        return DES.simulate(
+            RandomWalk, initialize=init if pool_size > 1 else _init_walk,
+            params=[{}] * num_sims, sim_time_limit=2000, seed=1,
+            pool_size=pool_size, handlers={PING: [count_steps]},
+            extract=lambda ret: (ret.sim_time, ret.data.calls))
+
+    sequential = run(pool_size=1)
+    concurrent = run(pool_size=num_sims)
+
+    assert concurrent == sequential
+    assert len({tuple(calls) for _, calls in sequential}) == num_sims
+    assert len(steps) == 2 * num_sims * 2001
+
+
+def test_cython_backend_matches_python_backend():
+    pytest.importorskip('model.des.cyscheduler')
+
+    def run(backend, **kwargs):
+        return DES.simulate(RandomWalk, initialize=_init_walk, seed=1,
+                            backend=backend, **kwargs)
+
+    for kwargs in ({'sim_time_limit': 100}, {'max_events': 50}):
+        python_ret = run('python', **kwargs)
+        cython_ret = run('cython', **kwargs)
+        assert cython_ret.data.calls == python_ret.data.calls
+        assert cython_ret.stop_reason is python_ret.stop_reason
+        assert cython_ret.data.sim.num_events == python_ret.data.sim.num_events
+
+
+class Failing(RandomWalk):
+    def step(self, position):
+        if len(self.calls) == 3:
+            raise ZeroDivisionError('step failed')
+        super().step(position)
+
+
+@pytest.mark.parametrize('backend', ['python', 'cython'])
+def test_handler_exception_is_raised_by_both_backends(backend):
+    if backend == 'cython':
+        pytest.importorskip('model.des.cyscheduler')
+    with pytest.raises(ZeroDivisionError, match='step failed'):
+        DES.simulate(Failing, initialize=_init_walk, seed=1,
+                     sim_time_limit=100, backend=backend)
+
+
+@pytest.mark.parametrize('backend, queue',
+                         [('python', queue) for queue in sorted(QUEUES)] +
+                         [('cython', None)])
+def test_continue_until_matches_single_run(backend, queue):
+    if backend == 'cython':
+        pytest.importorskip('model.des.cyscheduler')
+        from pysim.cykernel import CythonKernel as create_kernel
+    else:
+        def create_kernel():
+            return Kernel(queue=queue)
+
+    single = Simulator(create_kernel(), RandomWalk, seed=1)
+    assert single.run(until=35, init=_init_walk) is StopReason.SIM_TIME_LIMIT
+
+    sim = Simulator(create_kernel(), RandomWalk, seed=1)
+    sim.run(until=10.5, init=_init_walk)
+    assert sim.sim_time == 10.5 and len(sim.data.calls) == 11
+    with pytest.raises(RuntimeError):
+        sim.run(until=20)
+    with pytest.raises(ValueError):
+        sim.continue_until(5)
+    sim.continue_until(20)
+    assert sim.continue_until(35) is StopReason.SIM_TIME_LIMIT
+
+    assert sim.data.calls == single.data.calls
+    assert sim.sim_time == single.sim_time == 35
+    assert sim.num_events == single.num_events == 36
+
+
+def test_zero_horizon_runs_only_events_at_time_zero():
+    kernel = Kernel()
+    sim = Simulator(kernel, Recorder)
+    sim.bind(PING, sim.data.handle)
+    for i in range(3):
+        sim.schedule(PING, i, args=(i,))
+
+    assert sim.run(until=0) is StopReason.SIM_TIME_LIMIT
+    assert sim.data.calls == [(0, 0)] and sim.sim_time == 0
+    with pytest.raises(ValueError):
+        kernel.setup(sim_time_limit=-1)
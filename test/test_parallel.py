@@ -0,0 +1,83 @@
+import pytest
+
+from pysim.des import DESModel
+from pysim.parallel import LogicalProcess, frame_lookahead, simulate_parallel
+
+LOOKAHEAD = 0.5
+NUM_LPS = 4
+LOCAL = 0
+REMOTE = 1
+
+
+class TokenRing(DESModel):
+    """LP runs local events and passes tokens to the next LP in the ring."""
+    def __init__(self, sim):
+        super().__init__(sim)
+        self.calls = []
+
+    def initialize(self):
+        self.sim.bind(LOCAL, self.local)
+        self.sim.bind(REMOTE, self.remote)
+
+    def local(self, value):
+        self.calls.append((self.sim.sim_time, 'local', value))
+        if value < 30:
+            self.sim.schedule(LOCAL, self.sim.rng.random(), args=(value + 1,))
+        if self.sim.rng.random() < 0.5:
+            lp = (self.sim.params.index + 1) % NUM_LPS
+            delay = LOOKAHEAD + self.sim.rng.choice((0, 0.25, 1.0))
+            self.sim.send(lp, REMOTE, delay, args=(self.sim.params.index,))
+
+    def remote(self, sender):
+        self.calls.append((self.sim.sim_time, 'remote', sender))
+
+
+def _init(sim):
+    sim.schedule(LOCAL, args=(0,))
+
+
+def _extract_calls(ret):
+    return ret.data.calls
+
+
+def _run(num_workers, sim_time_limit=None):
+    lps = [LogicalProcess(TokenRing, _init, {'index': i}, seed=i)
+           for i in range(NUM_LPS)]
+    return simulate_parallel(lps, LOOKAHEAD, sim_time_limit=sim_time_limit,
+                             num_workers=num_workers, extract=_extract_calls)
+
+
+def test_parallel_run_reproduces_sequential_run():
+    sequential = _run(num_workers=0)
+    assert _run(num_workers=2) == sequential
+    assert _run(num_workers=NUM_LPS) == sequential
+
+    for calls in sequential:
+        assert calls == sorted(calls, key=lambda call: call[0])
+        assert any(kind == 'remote' for _, kind, _ in calls)
+
+
+def test_parallel_run_stops_at_sim_time_limit():
+    for calls in _run(num_workers=0, sim_time_limit=5.0):
+        assert calls and calls[-1][0] <= 5.0
+
+
+class Impatient(TokenRing):
+    def local(self, value):
+        if self.sim.sim_time >= 1:
+            self.sim.send(0, REMOTE, LOOKAHEAD / 2)
+        self.sim.schedule(LOCAL, 0.5, args=(value + 1,))
+
+
+@pytest.mark.parametrize('num_workers', [0, 1, 2])
+def test_send_checks_lookahead(num_workers):
+    lps = [LogicalProcess(TokenRing, _init, {'index': 0}, seed=0),
+           LogicalProcess(Impatient, _init, {'index': 1})]
+    with pytest.raises(ValueError, match='lookahead'):
+        simulate_parallel(lps, LOOKAHEAD, sim_time_limit=10,
+                          num_workers=num_workers)
+
+
+def test_frame_lookahead():
+    assert frame_lookahead(0, 1e-4) == 1e-4
+    assert frame_lookahead(299792458.0, 0) == 1.0
@@ -0,0 +1,154 @@
+import heapq
+import random
+
+import pytest
+
+from pysim.queues import QUEUES, create_queue
+
+
+def _run_hold_model(queue, num_steps, seed, burst_size=0):
+    """Pop an entry and push 0-2 new ones no earlier than the popped one.
+
+    If `burst_size` is given, some steps push that many entries of the same
+    time instead (like a Query sent to many tags), and some push an entry
+    between the popped one and the peeked queue head.
+    """
+    rng = random.Random(seed)
+    reference, popped, next_id = [], [], 0
+    for _ in range(20):
+        entry = (rng.random(), next_id)
+        next_id += 1
+        queue.push(entry)
+        heapq.heappush(reference, entry)
+
+    for step in range(num_steps):
+        if not reference:
+            break
+        entry = queue.pop()
+        assert entry == heapq.heappop(reference)
+        popped.append(entry)
+        assert len(queue) == len(reference)
+        if burst_size and step % 50 == 7:
+            burst_time = entry[0] + rng.choice((0.0, 0.05, 1.0))
+            for _ in range(burst_size):
+                queue.push((burst_time, next_id))
+                heapq.heappush(reference, (burst_time, next_id))
+                next_id += 1
+        if burst_size and step % 50 == 31 and reference:
+            assert queue.peek() == reference[0]
+            new_entry = ((entry[0] + reference[0][0]) / 2, next_id)
+            next_id += 1
+            queue.push(new_entry)
+            heapq.heappush(reference, new_entry)
+        for _ in range(rng.choice((0, 1, 1, 2))):
+            kind = rng.random()
+            if kind < 0.3:
+                delay = 0.0                      # same time events
+            elif kind < 0.8:
+                delay = rng.expovariate(1e5)     # dense short delays
+            else:
+                delay = rng.choice((0.1, 1.0))  # sparse ticks
+            new_entry = (entry[0] + delay, next_id)
+            next_id += 1
+            queue.push(new_entry)
+            heapq.heappush(reference, new_entry)
+        if step % 500 == 499:
+            assert queue.peek() == reference[0]
+            # Drop every third entry, like kernel compaction does:
+            kept = [e for e in queue.entries() if e[1] % 3]
+            queue.rebuild(kept)
+            reference = kept[:]
+            heapq.heapify(reference)
+    return popped
+
+
+@pytest.mark.parametrize('name', sorted(QUEUES))
+def test_queue_pops_entries_in_time_and_id_order(name):
+    popped = _run_hold_model(create_queue(name), 5000, seed=name)
+    assert popped == sorted(popped)
+
+
+@pytest.mark.parametrize('name', sorted(QUEUES))
+@pytest.mark.parametrize('seed', range(5))
+def test_queue_pops_same_time_bursts_in_order(name, seed):
+    popped = _run_hold_model(create_queue(name), 3000, seed=seed,
+                             burst_size=120)
+    assert popped == sorted(popped)
+
+
+@pytest.mark.parametrize('name', sorted(QUEUES))
+def test_entry_pushed_after_burst_head_is_popped_in_order(name):
+    queue = create_queue(name)
+    queue.push((0.01, 0))
+    queue.push_many([(1.0, i) for i in range(1, 101)])
+    queue.push((10.0, 101))
+    assert queue.pop() == (0.01, 0)
+    assert queue.pop() == (1.0, 1)
+    queue.push((1.05, 102))
+
+    assert [queue.pop() for _ in range(len(queue))] == \
+        [(1.0, i) for i in range(2, 101)] + [(1.05, 102), (10.0, 101)]
+
+
+@pytest.mark.parametrize('name', sorted(QUEUES))
+def test_rebuild_keeps_order_of_remaining_entries(name):
+    rng = random.Random(name)
+    queue, reference = create_queue(name), []
+    for i in range(300):
+        entry = (rng.choice((1.0, 2.0, rng.random() * 3)), i)
+        queue.push(entry)
+        reference.append(entry)
+    reference.sort()
+    assert [queue.pop() for _ in range(60)] == reference[:60]
+
+    kept = [entry for entry in queue.entries() if entry[1] % 4]
+    queue.rebuild(kept)
+    queue.push((2.5, 300))
+    assert [queue.pop() for _ in range(len(queue))] == \
+        sorted(kept + [(2.5, 300)])
+
+
+@pytest.mark.parametrize('name', sorted(QUEUES))
+def test_queue_raises_index_error_when_empty(name):
+    queue = create_queue(name)
+    queue.push((1.0, 0))
+    assert queue.pop() == (1.0, 0)
+    with pytest.raises(IndexError):
+        queue.pop()
+
+
+def test_create_queue_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        create_queue('fibonacci')
+
+
+@pytest.mark.parametrize('name', sorted(QUEUES))
+@pytest.mark.parametrize('batch_size', [3, 100])
+def test_push_many_keeps_order(name, batch_size):
+    rng = random.Random(batch_size)
+    queue = create_queue(name)
+    entries = [(rng.random(), i) for i in range(20)]
+    for entry in entries:
+        queue.push(entry)
+    batch = [(rng.random(), 20 + i) for i in range(batch_size)]
+    queue.push_many(batch)
+
+    assert len(queue) == len(entries) + batch_size
+    assert [queue.pop() for _ in range(len(queue))] == sorted(entries + batch)
+
+
+@pytest.mark.parametrize('name', sorted(QUEUES))
+def test_entries_pushed_before_peeked_head_are_popped_first(name):
+    queue = create_queue(name)
+    for i in range(200):
+        queue.push((i * 0.001, i))
+    for i in range(10):
+        queue.push((5 + 0.37 * i, 200 + i))
+    while queue.peek()[0] <= 2.0:
+        queue.pop()
+
+    assert queue.peek() == (5.0, 200)
+    queue.push((2.5, 210))
+    assert queue.peek() == (2.5, 210)
+    assert [queue.pop() for _ in range(len(queue))] == \
+        [(2.5, 210)] + [(5 + 0.37 * i, 200 + i) for i in range(10)]
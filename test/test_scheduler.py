@@ -0,0 +1,179 @@
+import pytest
+
+cyscheduler = pytest.importorskip('model.des.cyscheduler')
+from model.des.pyscheduler import (  # noqa: E402
+    ExitReason, PyScheduler, SpecType)
+
+TICK = 0
+
+
+def _run_ticks(num_pending, num_ticks):
+    """Keep `num_pending` events in the queue, each re-scheduling itself."""
+    scheduler = cyscheduler.CyScheduler()
+    counter = []
+
+    def tick(ctx, index):
+        counter.append(index)
+        if len(counter) < num_ticks:
+            ctx.sim.schedule(ctx.sim.get_time() + 1.0, TICK, index)
+            if index == 0:
+                # Cancelled events are returned to the pool as well:
+                ctx.sim.cancel(ctx.sim.schedule(ctx.sim.get_time() + 0.5,
+                                                TICK, -1))
+
+    scheduler.bind(TICK, tick, SpecType.INDEX)
+    for i in range(num_pending):
+        scheduler.schedule(0.0, TICK, i)
+    scheduler.run()
+    return scheduler.get_event_pool_stats()
+
+
+def test_event_pool_reuses_released_events():
+    short, long = _run_ticks(100, 1000), _run_ticks(100, 100000)
+
+    # Steady state run allocates no memory per event:
+    assert short.num_slabs == long.num_slabs == 1
+    assert long.num_acquired > 100000
+    assert long.num_acquired == long.num_released
+    assert long.num_in_use == 0
+
+
+def test_event_pool_grows_with_pending_events():
+    stats = _run_ticks(5000, 5000)
+    assert stats.num_slabs * 1024 == stats.capacity >= 5000
+    assert stats.num_slabs == -(-5000 // 1024)
+
+
+@pytest.mark.parametrize('scheduler_class',
+                         [cyscheduler.CyScheduler, PyScheduler])
+def test_stale_and_null_handles_are_ignored_by_cancel(scheduler_class):
+    scheduler = scheduler_class()
+    fired = []
+
+    def tick(ctx, index):
+        fired.append(index)
+
+    scheduler.bind(TICK, tick, SpecType.INDEX)
+
+    first = scheduler.schedule(1.0, TICK, 1)
+    scheduler.run(until=1.5)
+    # Slot of the fired event is reused, but its handle is stale:
+    second = scheduler.schedule(2.0, TICK, 2)
+    cancelled = scheduler.schedule(2.5, TICK, 3)
+    assert 0 < first != second
+    for handle in (first, -1, 2 ** 40, cancelled, cancelled):
+        scheduler.cancel(handle)
+    scheduler.continue_until(3.0)
+
+    assert fired == [1, 2]
+
+
+def test_handlers_are_dispatched_by_code_in_bind_order():
+    scheduler = cyscheduler.CyScheduler()
+    calls = []
+
+    def first(ctx, att):
+        calls.append(('first', att))
+
+    def second(ctx, index, att):
+        calls.append(('second', index, att))
+
+    def init(ctx):
+        calls.append('init')
+
+    scheduler.bind_init(init)
+    scheduler.bind(1000, first, SpecType.OBJECT)
+    scheduler.bind(1000, second, SpecType.INDEX_OBJECT)
+    with pytest.raises(ValueError):
+        scheduler.bind(-1, first, SpecType.OBJECT)
+    scheduler.schedule(1.0, 1000, 7, 'a')
+    scheduler.schedule(0.5, 3, 8, 'not bound')
+    scheduler.schedule(2.0, 1000, 9, 'b')
+    scheduler.run()
+
+    assert calls == ['init', ('first', 'a'), ('second', 7, 'a'),
+                     ('first', 'b'), ('second', 9, 'b')]
+
+
+UPDATE_POSITION, SEND_FRAME = 1, 2
+TARI = 6.25e-6
+
+
+def _fly_linear_pass(scheduler_class, duration=3 * 3600.0):
+    """Update reader position every 0.1 s, send frame bursts every minute.
+
+    Frames are separated by fractions of tari, which float32 time can not
+    represent after a few minutes of flight.
+    """
+    scheduler = scheduler_class()
+    log = []
+
+    def update_position(ctx, step):
+        time = ctx.sim.get_time()
+        log.append((time, 'update', step))
+        if time + 0.1 <= duration:
+            ctx.sim.schedule(time + 0.1, UPDATE_POSITION, step + 1)
+        if step % 600 == 0:
+            ctx.sim.schedule(time + TARI, SEND_FRAME, 0)
+
+    def send_frame(ctx, index):
+        time = ctx.sim.get_time()
+        log.append((time, 'frame', index))
+        if index < 40:
+            delay = (TARI, TARI / 4, 2 * TARI, TARI / 2)[index % 4]
+            ctx.sim.schedule(time + delay, SEND_FRAME, index + 1)
+            if index % 10 == 0:
+                # Same time as the next frame, must run after it:
+                ctx.sim.schedule(time + delay, SEND_FRAME, 100 + index)
+
+    scheduler.bind(UPDATE_POSITION, update_position, SpecType.INDEX)
+    scheduler.bind(SEND_FRAME, send_frame, SpecType.INDEX)
+    scheduler.schedule(0.0, UPDATE_POSITION, 0)
+    scheduler.run()
+    return scheduler.get_time(), log
+
+
+def test_long_pass_event_order_matches_python_scheduler():
+    cy_time, cy_log = _fly_linear_pass(cyscheduler.CyScheduler)
+    py_time, py_log = _fly_linear_pass(PyScheduler)
+
+    assert cy_time == py_time > 3 * 3600.0 - 0.1
+    assert cy_log == py_log
+    frame_times = [time for time, kind, index in cy_log
+                   if kind == 'frame' and index < 100]
+    assert len(frame_times) == 180 * 41
+    assert frame_times == sorted(set(frame_times))
+
+
+@pytest.mark.parametrize('scheduler_class',
+                         [cyscheduler.CyScheduler, PyScheduler])
+def test_run_reports_exit_reason(scheduler_class):
+    scheduler = scheduler_class()
+    fired = []
+
+    def tick(ctx, index):
+        fired.append(index)
+        if index == 7:
+            ctx.sim.stop()
+
+    scheduler.bind(TICK, tick, SpecType.INDEX)
+    for i in range(10):
+        scheduler.schedule(float(i), TICK, i)
+
+    assert scheduler.run(until=2.5, max_events=5) == ExitReason.TIME_LIMIT
+    assert fired == [0, 1, 2] and scheduler.get_time() == 2.5
+    assert scheduler.continue_until(10.0, max_events=2) == \
+        ExitReason.MAX_EVENTS
+    assert fired == [0, 1, 2, 3, 4] and scheduler.get_time() == 4.0
+    assert scheduler.continue_until(10.0) == ExitReason.STOPPED
+    assert fired[-1] == 7
+    assert scheduler.continue_until(10.0) == ExitReason.EMPTY
+    assert fired == list(range(10)) and scheduler.exit_reason is \
+        ExitReason.EMPTY
+
+    scheduler.schedule(11.0, TICK, 7)
+    assert scheduler.continue_until(20.0) == ExitReason.STOPPED
+    assert fired[-1] == 7 and scheduler.exit_reason is ExitReason.STOPPED
+
+    with pytest.raises(ValueError):
+        scheduler.continue_until(20.0, max_events=0)